@@ -59,6 +59,18 @@ class SystemPrompt:
 # {self.default_action_description}
 
 
+# Base64 prefixes of the image signatures take_screenshot can produce
+SCREENSHOT_MEDIA_TYPES = {'/9j/': 'image/jpeg', 'UklGR': 'image/webp'}
+
+
+def screenshot_media_type(screenshot_b64: str) -> str:
+	"""Media type of a base64 encoded screenshot, png unless it is a jpeg or webp"""
+	for prefix, media_type in SCREENSHOT_MEDIA_TYPES.items():
+		if screenshot_b64.startswith(prefix):
+			return media_type
+	return 'image/png'
+
+
 class AgentMessagePrompt:
 	def __init__(
 		self,
@@ -129,7 +141,9 @@ Interactive elements from top layer of the current page inside the viewport:
 					{'type': 'text', 'text': state_description},
 					{
 						'type': 'image_url',
-						'image_url': {'url': f'data:image/png;base64,{self.state.screenshot}'},  # , 'detail': 'low'
+						'image_url': {
+							'url': f'data:{screenshot_media_type(self.state.screenshot)};base64,{self.state.screenshot}'
+						},  # , 'detail': 'low'
 					},
 				]
 			)
@@ -44,10 +44,7 @@ from browser_use.browser.context import BrowserContext
 from browser_use.browser.views import BrowserState, BrowserStateHistory
 from browser_use.controller.registry.views import ActionModel
 from browser_use.controller.service import Controller
-from browser_use.dom.history_tree_processor.service import (
-	DOMHistoryElement,
-	HistoryTreeProcessor,
-)
+from browser_use.dom.history_tree_processor.service import DOMHistoryElement
 from browser_use.exceptions import LLMException
 from browser_use.telemetry.service import ProductTelemetry
 from browser_use.telemetry.views import (
@@ -123,6 +120,7 @@ class Agent(Generic[Context]):
 		validate_output: bool = False,
 		message_context: Optional[str] = None,
 		generate_gif: bool | str = False,
+		save_history_screenshots: bool = True,
 		available_file_paths: Optional[list[str]] = None,
 		include_attributes: list[str] = [
 			'title',
@@ -169,6 +167,7 @@ class Agent(Generic[Context]):
 			validate_output=validate_output,
 			message_context=message_context,
 			generate_gif=generate_gif,
+			save_history_screenshots=save_history_screenshots,
 			available_file_paths=available_file_paths,
 			include_attributes=include_attributes,
 			max_actions_per_step=max_actions_per_step,
@@ -350,6 +349,15 @@ class Agent(Generic[Context]):
 			# logger.debug('Agent paused after getting state')
 			raise InterruptedError
 
+	def _needs_screenshot(self) -> bool:
+		"""Screenshots are sent to vision models, kept in history (and GIFs) and passed to the step callback"""
+		return (
+			self.settings.use_vision
+			or bool(self.settings.generate_gif)
+			or self.settings.save_history_screenshots
+			or self.register_new_step_callback is not None
+		)
+
 	# @observe(name='agent.step', ignore_output=True, ignore_input=True)
 	@time_execution_async('--step (agent)')
 	async def step(self, step_info: Optional[AgentStepInfo] = None) -> None:
@@ -362,7 +370,7 @@ class Agent(Generic[Context]):
 		tokens = 0
 
 		try:
-			state = await self.browser_context.get_state()
+			state = await self.browser_context.get_state(include_screenshot=self._needs_screenshot())
 			active_page = await self.browser_context.get_current_page()
 
 			await self._raise_if_stopped_or_paused()
@@ -829,7 +837,7 @@ class Agent(Generic[Context]):
 
 		for i, action in enumerate(actions):
 			if action.get_index() is not None and i != 0:
-				new_state = await self.browser_context.get_state()
+				new_state = await self.browser_context.get_state(include_screenshot=False)
 				new_path_hashes = set(e.hash.branch_path_hash for e in new_state.selector_map.values())
 				if check_for_new_elements and not new_path_hashes.issubset(cached_path_hashes):
 					# next action requires index but there are new elements on the page
@@ -883,7 +891,7 @@ class Agent(Generic[Context]):
 		)
 
 		if self.browser_context.session:
-			state = await self.browser_context.get_state()
+			state = await self.browser_context.get_state(include_screenshot=self.settings.use_vision)
 			content = AgentMessagePrompt(
 				state=state,
 				result=self.state.last_result,
@@ -990,7 +998,7 @@ class Agent(Generic[Context]):
 
 	async def _execute_history_step(self, history_item: AgentHistory, delay: float) -> list[ActionResult]:
 		"""Execute a single step from history with element validation"""
-		state = await self.browser_context.get_state()
+		state = await self.browser_context.get_state(include_screenshot=False)
 		if not state or not history_item.model_output:
 			raise ValueError('Invalid state or model output')
 		updated_actions = []
@@ -1023,7 +1031,7 @@ class Agent(Generic[Context]):
 		if not historical_element or not current_state.element_tree:
 			return action
 
-		current_element = HistoryTreeProcessor.find_history_element_in_tree(historical_element, current_state.element_tree)
+		current_element = current_state.history_index.find(historical_element)
 
 		if not current_element or current_element.highlight_index is None:
 			return None
@@ -1149,8 +1157,8 @@ class Agent(Generic[Context]):
 		if not self.settings.planner_llm:
 			return None
 
-		# Get current state to filter actions by page
-		state = await self.browser_context.get_state()
+		# Get current state to filter actions by page, the planner sees screenshots through the message history
+		state = await self.browser_context.get_state(include_screenshot=False)
 
 		# Get all standard actions (no filter) and page-specific actions
 		standard_actions = self.controller.registry.get_prompt_description()  # No page = system prompt actions
@@ -45,6 +45,7 @@ class AgentSettings(BaseModel):
 	validate_output: bool = False
 	message_context: Optional[str] = None
 	generate_gif: bool | str = False
+	save_history_screenshots: bool = True
 	available_file_paths: Optional[list[str]] = None
 	override_system_message: Optional[str] = None
 	extend_system_message: Optional[str] = None
@@ -1,5 +1,6 @@
 from typing import Dict, Type, Optional, Any
-from browser_use.architect.agents.base.base_agent import BaseAgent
+from browser_use.architect.agents.base.base_agent import BaseAgent as AbstractBaseAgent
+from browser_use.architect.agents.base_agent import BaseAgent
 
 class AgentRegistry:
     """
@@ -20,7 +21,8 @@ class AgentRegistry:
             name: The name to register the agent under
             agent_class: The agent class to register
         """
-        if not issubclass(agent_class, BaseAgent):
+        # Built-in agents derive from the lightweight BaseAgent, generated ones may use the abstract base
+        if not issubclass(agent_class, (BaseAgent, AbstractBaseAgent)):
             raise ValueError(f"Agent class {agent_class.__name__} must inherit from BaseAgent")
             
         cls._registry[name] = agent_class
@@ -10,11 +10,28 @@ from browser_use.architect.agents.coder_agent import CoderAgent
 from browser_use.architect.agents.summarizer_agent import SummarizerAgent
 from browser_use.architect.agents.meta_agent import MetaAgent
 from browser_use.architect.memory.memory_manager import log_message, save_task_result
+from browser_use.architect.tools.dedup import NearDuplicateIndex
+from browser_use.architect.tools.http_fetcher import HttpFetcher
+from browser_use.page_store.service import PageStore
 
 
 class ArchitectAgent(BaseAgent):
-    def __init__(self, goal: str, model: str = "gemini-2.0-flash-lite"):
+    def __init__(
+        self,
+        goal: str,
+        model: str = "gemini-2.0-flash-lite",
+        research_pipeline: str = "full",
+        http_first: bool = False,
+        page_store: Optional[PageStore] = None,
+        dedup_path: Optional[str] = None
+    ):
         super().__init__("Architect", goal, model)
+        self.research_pipeline = research_pipeline
+        self.page_store = page_store
+        # One pooled client shared by every researcher spawned for this goal
+        self.fetcher = HttpFetcher(page_store=page_store) if http_first else None
+        # Near-duplicate sources are collapsed across all prompts of this run (and earlier runs with a path)
+        self.dedup_index = NearDuplicateIndex(dedup_path)
 
     async def run(self, callback: Optional[Callable] = None):
         log_message(self.name, f"📌 Received high-level goal: {self.goal}")
@@ -118,7 +135,8 @@ class ArchitectAgent(BaseAgent):
                 summarizer = SummarizerAgent(
                     goal=self.goal, 
                     results=formatted_results,
-                    model=self.model
+                    model=self.model,
+                    dedup_index=self.dedup_index
                 )
                 
                 # Run the summarizer
@@ -139,6 +157,16 @@ class ArchitectAgent(BaseAgent):
                     "result": f"Error generating summary: {str(e)}"
                 })
 
+        if self.fetcher:
+            await self.fetcher.aclose()
+
+        if self.dedup_index.duplicates_collapsed:
+            log_message(
+                self.name,
+                f"♻️ Collapsed {self.dedup_index.duplicates_collapsed} duplicate source(s), saved ~{self.dedup_index.tokens_saved} tokens"
+            )
+        self.dedup_index.save()
+
         # Final log
         log_message(self.name, f"✅ All subtasks complete for goal: {self.goal}")
         return results
@@ -157,7 +185,15 @@ class ArchitectAgent(BaseAgent):
         log_message(self.name, f"Creating {agent_type}Agent for: {subgoal}")
         
         if agent_type.lower() == "researcher":
-            return ResearcherAgent(subgoal, self.model)
+            return ResearcherAgent(
+                subgoal,
+                self.model,
+                pipeline=self.research_pipeline,
+                http_first=self.fetcher is not None,
+                fetcher=self.fetcher,
+                page_store=self.page_store,
+                dedup_index=self.dedup_index
+            )
         elif agent_type.lower() == "writer":
             return WriterAgent(subgoal, self.model)
         elif agent_type.lower() == "critic":
@@ -169,7 +205,7 @@ class ArchitectAgent(BaseAgent):
         elif agent_type.lower() == "summarizer":
             # For summarizer, we need to provide results later
             # Creating with empty results that will be updated before running
-            return SummarizerAgent(goal=self.goal, results=[], model=self.model)
+            return SummarizerAgent(goal=self.goal, results=[], model=self.model, dedup_index=self.dedup_index)
         else:
             log_message(self.name, f"Unknown agent type '{agent_type}', using MetaAgent")
             # Use MetaAgent for unknown agent types
@@ -1,9 +1,10 @@
-from typing import List, Dict, Any, Optional, Callable, Union
+from typing import List, Dict, Any, Optional, Callable, Type, Union
 import asyncio
 import json
 from datetime import datetime
 
 from browser_use.architect.agents.agent_registry import AgentRegistry
+from browser_use.architect.agents.summarizer_agent import SummarizerAgent
 from browser_use.architect.memory.memory_manager import log_message
 
 class PlanExecutor:
@@ -61,7 +62,7 @@ class PlanExecutor:
                     raise ValueError(f"Unknown agent type: {agent_type}")
                     
                 # Create agent instance
-                agent = agent_cls(name=agent_type, goal=task["goal"])
+                agent = self._create_agent(agent_cls, task)
                 
                 # Report progress
                 if callback:
@@ -133,6 +134,30 @@ class PlanExecutor:
                 }
             }
             
+    def _create_agent(self, agent_cls: Type[Any], task: Dict[str, Any]) -> Any:
+        """
+        Instantiate the agent for a task.
+        
+        Args:
+            agent_cls: The registered agent class
+            task: The task dictionary from the plan
+            
+        Returns:
+            The agent instance
+        """
+        if issubclass(agent_cls, SummarizerAgent):
+            # Forward everything produced so far to the summarizer
+            results = [
+                {
+                    "subtask": entry["task"]["goal"],
+                    "agent_type": entry["task"]["type"],
+                    "result": entry.get("result", entry.get("error"))
+                }
+                for entry in self.results.values()
+            ]
+            return agent_cls(goal=task["goal"], results=results)
+        return agent_cls(goal=task["goal"])
+
     @staticmethod
     def create_plan(tasks: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
@@ -1,19 +1,68 @@
 import asyncio
 import json
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote_plus
 
-from browser_use import Agent, Browser, BrowserConfig
+from browser_use import Agent, AgentHistoryList, Browser, BrowserConfig, Controller
 from browser_use.architect.agents.base_agent import BaseAgent
 from browser_use.architect.memory.memory_manager import log_message
+from browser_use.architect.tools.dedup import NearDuplicateIndex, Source
+from browser_use.architect.tools.http_fetcher import HttpFetcher
+from browser_use.page_store.service import PageStore
 from browser_use.architect.tools.llm_interface import summarize, run_and_parse, _run_llm_with_retry, _run_llm
 from langchain_google_genai import ChatGoogleGenerativeAI
 import os
 from pydantic import SecretStr
 
 
+# "full" re-parses the browser output with the LLM before summarizing it,
+# "single_pass" summarizes the agent history directly in one call
+RESEARCH_PIPELINES = ("full", "single_pass")
+
+# Goals matching these patterns get a template plan instead of an LLM-generated one
+URL_PATTERN = re.compile(r"https?://[^\s'\"<>]+")
+SEARCH_GOAL_PATTERN = re.compile(
+    r"^\s*(search|find|look up|research|get|list|identify|gather|collect|compare|what|who|when|where|which|how)\b",
+    re.IGNORECASE
+)
+TEMPLATE_WAIT_MS = 2000
+
+# Upper bound on the text taken from each page fetched over plain HTTP
+HTTP_TEXT_LIMIT = 50000
+
+
 class ResearcherAgent(BaseAgent):
-    def __init__(self, goal: str, model: str = "gemini-2.0-flash-lite"):
+    def __init__(
+        self,
+        goal: str,
+        model: str = "gemini-2.0-flash-lite",
+        pipeline: str = "full",
+        http_first: bool = False,
+        fetcher: Optional[HttpFetcher] = None,
+        page_store: Optional[PageStore] = None,
+        dedup_index: Optional[NearDuplicateIndex] = None
+    ):
+        """
+        Initialize the researcher.
+
+        Args:
+            goal: The research goal
+            model: Gemini model used for planning and summarizing
+            pipeline: One of RESEARCH_PIPELINES
+            http_first: Try the planned URLs over plain HTTP before launching a browser
+            fetcher: Shared HTTP fetcher, a private one is created per run if omitted
+            page_store: Persistent page store used by the HTTP fetcher and the browser's extract_content
+            dedup_index: Shared near-duplicate index, a private in-memory one is used if omitted
+        """
         super().__init__("Researcher", goal, model)
+        if pipeline not in RESEARCH_PIPELINES:
+            raise ValueError(f"Unknown research pipeline: {pipeline}")
+        self.pipeline = pipeline
+        self.http_first = http_first
+        self.fetcher = fetcher
+        self.page_store = page_store
+        self.dedup_index = dedup_index or NearDuplicateIndex()
 
     def _validate_actions(self, actions: List[Dict[str, Any]]) -> None:
         for action in actions:
@@ -74,6 +123,105 @@ Rules:
         self._validate_actions(result["parameters"]["action"])
         return result
 
+    def _template_plan(self) -> Optional[Dict[str, Any]]:
+        """
+        Build a plan without an LLM call when the goal fits a known pattern.
+
+        Goals containing a URL open that URL, search-style goals open a Google
+        search for the goal. Anything else returns None.
+        """
+        url_match = URL_PATTERN.search(self.goal)
+        if url_match:
+            url = url_match.group(0).rstrip(".,;:)")
+        elif SEARCH_GOAL_PATTERN.match(self.goal):
+            url = f"https://www.google.com/search?q={quote_plus(self.goal)}"
+        else:
+            return None
+
+        plan = {
+            "name": "AgentOutput",
+            "parameters": {
+                "action": [
+                    {"open_url": {"url": url}},
+                    {"wait": {"timeout": TEMPLATE_WAIT_MS}},
+                    {"extract_content": {"selector": "main", "attribute": "text"}}
+                ],
+                "current_state": {
+                    "evaluation_previous_goal": "Starting research",
+                    "memory": f"Starting research on: {self.goal}",
+                    "next_goal": "Extract and analyze relevant information"
+                }
+            }
+        }
+        self._validate_actions(plan["parameters"]["action"])
+        return plan
+
+    async def _summarize_history(self, history: AgentHistoryList) -> str:
+        """
+        Summarize the browser agent's extracted content in a single LLM call.
+
+        Args:
+            history: The history returned by the browser Agent
+
+        Returns:
+            The summary of the findings
+        """
+        # Pair each extracted content with the page it came from, final_result() is the last one
+        sources = [
+            Source(text=result.extracted_content, urls=[step.state.url] if step.state.url else [])
+            for step in history.history
+            for result in step.result
+            if result.extracted_content
+        ]
+        if not sources:
+            errors = [error for error in history.errors() if error]
+            log_message(self.name, "⚠️ Browser returned no extracted content")
+            detail = f" Last error: {errors[-1]}" if errors else ""
+            return f"Browser automation did not extract any content.{detail}"
+
+        return await self._summarize_sources(sources)
+
+    async def _summarize_sources(self, sources: List[Source]) -> str:
+        """Collapse near-duplicate sources, keeping all their URLs, and summarize them in one call."""
+        tokens_saved = self.dedup_index.tokens_saved
+        unique = self.dedup_index.collapse(sources)
+        if len(unique) < len(sources):
+            log_message(
+                self.name,
+                f"♻️ Collapsed {len(sources) - len(unique)} duplicate source(s), saved ~{self.dedup_index.tokens_saved - tokens_saved} tokens"
+            )
+        text = "\n\n".join(source.format() for source in unique)
+        return await summarize(f"Research goal: {self.goal}\n\nFindings:\n{text}", model=self.model)
+
+    async def _research_over_http(self, plan: Dict[str, Any]) -> Optional[str]:
+        """
+        Fetch the plan's URLs without a browser and summarize them.
+
+        Args:
+            plan: The validated task plan
+
+        Returns:
+            The summary, or None if any page needs the browser Agent
+        """
+        urls = [action["open_url"]["url"] for action in plan["parameters"]["action"] if "open_url" in action]
+        if not urls:
+            return None
+
+        fetcher = self.fetcher or HttpFetcher(page_store=self.page_store)
+        try:
+            pages = await fetcher.fetch_all(urls)
+        finally:
+            if self.fetcher is None:
+                await fetcher.aclose()
+
+        for page in pages:
+            if page.needs_browser:
+                log_message(self.name, f"🌐 Escalating to browser, {page.url} looks {page.escalate_reason}")
+                return None
+
+        log_message(self.name, f"⚡ Fetched {len(pages)} page(s) over HTTP in {sum(page.elapsed for page in pages):.2f}s")
+        return await self._summarize_sources([Source(text=page.text[:HTTP_TEXT_LIMIT], urls=[page.url]) for page in pages])
+
     async def run(self, callback=None) -> str:
         log_message(self.name, f"🎯 Starting research: {self.goal}")
 
@@ -84,7 +232,11 @@ Rules:
             })
 
         try:
-            plan = await self._generate_task_plan()
+            plan = self._template_plan() if self.pipeline == "single_pass" else None
+            if plan:
+                log_message(self.name, f"📋 Using template plan for: {self.goal}")
+            else:
+                plan = await self._generate_task_plan()
         except Exception as e:
             log_message(self.name, f"⚠️ Plan generation failed: {e}")
             
@@ -96,6 +248,14 @@ Rules:
                 
             return await summarize(f"Failed to create task plan: {e}", model=self.model)
 
+        if self.http_first:
+            try:
+                http_result = await self._research_over_http(plan)
+                if http_result is not None:
+                    return http_result
+            except Exception as e:
+                log_message(self.name, f"⚠️ HTTP fetch failed, falling back to browser: {e}")
+
         try:
             # First try with browser automation
             browser = Browser(config=BrowserConfig(headless=False))  # Set headless=False to reduce detection
@@ -105,7 +265,10 @@ Rules:
                 model="gemini-2.0-flash-lite", 
                 api_key=SecretStr(gemini_api_key) if gemini_api_key else None
             )
-            agent = Agent(task=json.dumps(plan), browser=browser, llm=llm)
+            if self.page_store:
+                agent = Agent(task=json.dumps(plan), browser=browser, llm=llm, controller=Controller(page_store=self.page_store))
+            else:
+                agent = Agent(task=json.dumps(plan), browser=browser, llm=llm)
 
             try:
                 raw_result = await asyncio.wait_for(agent.run(), timeout=300)
@@ -115,6 +278,9 @@ Rules:
                 if not raw_result:
                     log_message(self.name, f"⚠️ Browser returned empty result")
                     return "Browser automation encountered an issue with empty results. Please try a different search query or approach."
+
+                if self.pipeline == "single_pass" and isinstance(raw_result, AgentHistoryList):
+                    return await self._summarize_history(raw_result)
                 
                 # Make sure we're dealing with a string before calling .lower()
                 if isinstance(raw_result, str):
@@ -3,12 +3,20 @@ from typing import List, Dict, Any, Optional, Callable
 
 from browser_use.architect.agents.base_agent import BaseAgent
 from browser_use.architect.memory.memory_manager import log_message
+from browser_use.architect.tools.dedup import NearDuplicateIndex
 from browser_use.architect.tools.llm_interface import summarize
 
 class SummarizerAgent(BaseAgent):
-    def __init__(self, goal: str, results: List[Dict[str, Any]], model: str = "gemini-2.0-flash-lite"):
+    def __init__(
+        self,
+        goal: str,
+        results: List[Dict[str, Any]],
+        model: str = "gemini-2.0-flash-lite",
+        dedup_index: Optional[NearDuplicateIndex] = None
+    ):
         super().__init__("Summarizer", goal, model)
         self.results = results
+        self.dedup_index = dedup_index or NearDuplicateIndex()
 
     async def run(self, callback: Optional[Callable] = None) -> str:
         log_message(self.name, f"📝 Summarizing {len(self.results)} results")
@@ -24,13 +32,31 @@ class SummarizerAgent(BaseAgent):
                 log_message(self.name, "⚠️ No results to summarize")
                 return "No results available for summarization."
             
-            full_text = f"Goal: {self.goal}\n\nResults:\n\n"
+            # Near-identical results (e.g. syndicated findings or repeated errors) are listed once
+            sections: Dict[int, Dict[str, Any]] = {}
             for i, r in enumerate(self.results):
                 subtask = r.get("subtask", "Unknown task")
                 agent_type = r.get("agent_type", "Unknown agent")
                 result = r.get("result", "No result")
-                
-                full_text += f"### Result {i+1}: [{agent_type}] {subtask}\n{result}\n\n"
+                heading = f"Result {i+1}: [{agent_type}] {subtask}"
+
+                cluster_id = self.dedup_index.add(str(result))
+                if cluster_id in sections:
+                    sections[cluster_id]["headings"].append(heading)
+                    self.dedup_index.record_duplicate(str(result))
+                else:
+                    sections[cluster_id] = {"headings": [heading], "result": result}
+
+            if len(sections) < len(self.results):
+                log_message(self.name, f"♻️ Collapsed {len(self.results) - len(sections)} duplicate result(s)")
+
+            full_text = f"Goal: {self.goal}\n\nResults:\n\n"
+            for section in sections.values():
+                first, *others = section["headings"]
+                full_text += f"### {first}\n"
+                if others:
+                    full_text += f"(Same result for: {'; '.join(others)})\n"
+                full_text += f"{section['result']}\n\n"
             
             if callback:
                 await callback("processing", {
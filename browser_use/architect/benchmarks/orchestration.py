@@ -0,0 +1,389 @@
+"""
+Offline benchmark for the architect orchestration layer.
+
+The LLM and the browser Agent are replaced by deterministic stubs, so the
+numbers reflect only what the architect itself costs: planning logic, memory
+writes, callbacks and result formatting. Timings come from a pass without
+tracemalloc, memory growth from a second, traced pass.
+
+Usage:
+    python -m browser_use.architect.benchmarks.orchestration --scales 1 10 100 1000
+    python -m browser_use.architect.benchmarks.orchestration --scales 1000 --skip-memory
+    python -m browser_use.architect.benchmarks.orchestration --write-thresholds thresholds.json
+    python -m browser_use.architect.benchmarks.orchestration --thresholds thresholds.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from browser_use.architect.benchmarks.stubs import (
+	StubLLM,
+	patch_attributes,
+	patch_browser,
+	patch_llm_interface,
+	stub_browser_agent,
+)
+
+SCENARIOS = ('architect', 'plan_executor', 'summarizer')
+DEFAULT_SCALES = (1, 10, 100)
+SUBTASK_TYPES = ('Researcher', 'Critic', 'Writer', 'Coder')
+
+# Metrics that are compared against thresholds; all are "lower is better"
+THRESHOLD_METRICS = ('overhead_time', 'loop_blocked_time', 'memory_growth', 'memory_bytes_written')
+
+
+@dataclass
+class BenchmarkResult:
+	"""Measurements for one scenario at one scale."""
+
+	scenario: str
+	subtasks: int
+	wall_time: float = 0.0
+	simulated_latency: float = 0.0
+	overhead_time: float = 0.0
+	loop_blocked_time: float = 0.0
+	max_loop_lag: float = 0.0
+	memory_growth: int = 0
+	memory_peak: int = 0
+	memory_reads: int = 0
+	memory_writes: int = 0
+	memory_bytes_read: int = 0
+	memory_bytes_written: int = 0
+	llm_calls: int = 0
+	callbacks: int = 0
+
+	@property
+	def key(self) -> str:
+		return f'{self.scenario}@{self.subtasks}'
+
+
+@dataclass
+class MemoryIOStats:
+	reads: int = 0
+	writes: int = 0
+	bytes_read: int = 0
+	bytes_written: int = 0
+
+
+class LoopMonitor:
+	"""
+	Measures how long the event loop is blocked.
+
+	A heartbeat task sleeps for `interval` seconds at a time; any delay beyond
+	`interval` means some other callback held the loop.
+	"""
+
+	def __init__(self, interval: float = 0.001, tolerance: float = 0.002):
+		self.interval = interval
+		self.tolerance = tolerance
+		self.blocked_time = 0.0
+		self.max_lag = 0.0
+		self._task: Optional[asyncio.Task] = None
+
+	async def _beat(self) -> None:
+		loop = asyncio.get_running_loop()
+		while True:
+			start = loop.time()
+			await asyncio.sleep(self.interval)
+			lag = loop.time() - start - self.interval
+			if lag > self.tolerance:
+				self.blocked_time += lag
+			self.max_lag = max(self.max_lag, lag)
+
+	def start(self) -> None:
+		self._task = asyncio.create_task(self._beat())
+
+	async def stop(self) -> None:
+		if self._task:
+			self._task.cancel()
+			try:
+				await self._task
+			except asyncio.CancelledError:
+				pass
+			self._task = None
+
+
+@contextmanager
+def track_memory_io(path: str) -> Iterator[MemoryIOStats]:
+	"""
+	Point the memory manager at `path` and count every load and append.
+
+	Args:
+	    path: Where the memory file should be written during the benchmark
+	"""
+	from browser_use.architect.memory import memory_manager
+
+	stats = MemoryIOStats()
+	load_memory = memory_manager._load_memory
+	append_memory = memory_manager._append_memory
+
+	def counting_load():
+		stats.reads += 1
+		if os.path.exists(path):
+			stats.bytes_read += os.path.getsize(path)
+		return load_memory()
+
+	def counting_append(kind, entry):
+		size_before = os.path.getsize(path) if os.path.exists(path) else 0
+		append_memory(kind, entry)
+		stats.writes += 1
+		stats.bytes_written += os.path.getsize(path) - size_before
+
+	with patch_attributes(
+		[
+			(memory_manager, 'MEMORY_PATH', path),
+			(memory_manager, '_load_memory', counting_load),
+			(memory_manager, '_append_memory', counting_append),
+		]
+	):
+		yield stats
+
+
+def _subtasks(count: int) -> List[Dict[str, str]]:
+	return [{'agent_type': SUBTASK_TYPES[i % len(SUBTASK_TYPES)], 'goal': f'Benchmark subtask {i + 1}'} for i in range(count)]
+
+
+def _stub_planner(subtasks: List[Dict[str, str]]) -> type:
+	"""Create a PlannerAgent replacement that returns a fixed plan."""
+	from browser_use.architect.agents.planner_agent import PlannerAgent
+
+	class StubPlannerAgent(PlannerAgent):
+		async def run(self, callback: Optional[Callable] = None) -> List[Dict[str, str]]:
+			if callback:
+				await callback('plan_created', {'agent': self.name, 'subtasks': len(subtasks)})
+			return list(subtasks)
+
+	return StubPlannerAgent
+
+
+async def _run_architect(count: int, callback: Callable) -> Any:
+	from browser_use.architect.agents import architect_agent
+
+	with patch_attributes([(architect_agent, 'PlannerAgent', _stub_planner(_subtasks(count)))]):
+		return await architect_agent.ArchitectAgent(goal='Benchmark goal').run(callback)
+
+
+async def _run_plan_executor(count: int, callback: Callable) -> Any:
+	from browser_use.architect.agents.plan_executor import PlanExecutor
+
+	tasks = [{'type': task['agent_type'], 'goal': task['goal']} for task in _subtasks(count)]
+	# Coder is not registered with the executor, use a Writer in its place
+	tasks = [{**task, 'type': 'Writer' if task['type'] == 'Coder' else task['type']} for task in tasks]
+	tasks.append({'type': 'Summarizer', 'goal': 'Summarize benchmark results'})
+	return await PlanExecutor(PlanExecutor.create_plan(tasks)).execute(callback)
+
+
+async def _run_summarizer(count: int, callback: Callable) -> Any:
+	from browser_use.architect.agents.summarizer_agent import SummarizerAgent
+
+	results = [
+		{'subtask': task['goal'], 'agent_type': task['agent_type'], 'result': f'Result text for {task["goal"]}. ' * 10}
+		for task in _subtasks(count)
+	]
+	return await SummarizerAgent(goal='Benchmark goal', results=results).run(callback)
+
+
+SCENARIO_RUNNERS: Dict[str, Callable[[int, Callable], Awaitable[Any]]] = {
+	'architect': _run_architect,
+	'plan_executor': _run_plan_executor,
+	'summarizer': _run_summarizer,
+}
+
+
+@contextmanager
+def _stubbed(stub: StubLLM, agent_cls: type) -> Iterator[MemoryIOStats]:
+	"""Run with the stubs in place and a temporary memory file."""
+	with (
+		tempfile.TemporaryDirectory() as tmp_dir,
+		track_memory_io(os.path.join(tmp_dir, 'memory.jsonl')) as io_stats,
+		patch_llm_interface(stub),
+		patch_browser(agent_cls),
+	):
+		yield io_stats
+
+
+async def run_scenario(
+	scenario: str,
+	subtasks: int,
+	llm_latency: float = 0.0,
+	browser_latency: float = 0.0,
+	browser_steps: int = 1,
+	response_size: int = 200,
+	measure_memory: bool = True,
+) -> BenchmarkResult:
+	"""
+	Run one scenario against the stubs and collect measurements.
+
+	tracemalloc adds a cost to every allocation, so it only runs in a second pass
+	without simulated latency; times, loop blocking and I/O come from the first pass.
+
+	Args:
+	    scenario: One of SCENARIOS
+	    subtasks: Number of subtasks to orchestrate
+	    llm_latency: Simulated seconds per LLM call
+	    browser_latency: Simulated seconds per browser Agent step
+	    browser_steps: Steps returned by each browser Agent run
+	    response_size: Characters per stubbed LLM response
+	    measure_memory: Run the traced pass for memory_growth and memory_peak
+
+	Returns:
+	    The collected BenchmarkResult
+	"""
+	if scenario not in SCENARIO_RUNNERS:
+		raise ValueError(f'Unknown scenario: {scenario}')
+
+	result = BenchmarkResult(scenario=scenario, subtasks=subtasks)
+	stub = StubLLM(latency=llm_latency, response_size=response_size)
+	agent_cls = stub_browser_agent(latency=browser_latency, steps=browser_steps)
+
+	async def callback(status: str, data: Dict[str, Any]) -> None:
+		result.callbacks += 1
+
+	with _stubbed(stub, agent_cls) as io_stats:
+		monitor = LoopMonitor()
+		monitor.start()
+		start = time.perf_counter()
+		try:
+			await SCENARIO_RUNNERS[scenario](subtasks, callback)
+		finally:
+			result.wall_time = time.perf_counter() - start
+			await monitor.stop()
+
+	if measure_memory:
+
+		async def ignore(status: str, data: Dict[str, Any]) -> None:
+			pass
+
+		with _stubbed(StubLLM(response_size=response_size), stub_browser_agent(steps=browser_steps)):
+			tracemalloc.start()
+			baseline_memory, _ = tracemalloc.get_traced_memory()
+			try:
+				await SCENARIO_RUNNERS[scenario](subtasks, ignore)
+			finally:
+				current_memory, peak_memory = tracemalloc.get_traced_memory()
+				tracemalloc.stop()
+		result.memory_growth = current_memory - baseline_memory
+		result.memory_peak = peak_memory - baseline_memory
+
+	result.simulated_latency = stub.simulated_latency + agent_cls.runs * browser_steps * browser_latency
+	result.overhead_time = max(result.wall_time - result.simulated_latency, 0.0)
+	result.loop_blocked_time = monitor.blocked_time
+	result.max_loop_lag = monitor.max_lag
+	result.memory_reads = io_stats.reads
+	result.memory_writes = io_stats.writes
+	result.memory_bytes_read = io_stats.bytes_read
+	result.memory_bytes_written = io_stats.bytes_written
+	result.llm_calls = stub.total_calls
+	return result
+
+
+async def run_benchmarks(
+	scenarios: List[str] = list(SCENARIOS),
+	scales: List[int] = list(DEFAULT_SCALES),
+	**kwargs: Any,
+) -> List[BenchmarkResult]:
+	"""Run every scenario at every scale, one after another."""
+	results = []
+	for scenario in scenarios:
+		for scale in scales:
+			results.append(await run_scenario(scenario, scale, **kwargs))
+	return results
+
+
+def build_thresholds(results: List[BenchmarkResult], headroom: float = 1.5) -> Dict[str, Dict[str, float]]:
+	"""
+	Derive regression thresholds from a run.
+
+	Args:
+	    results: Results of a reference run
+	    headroom: Factor applied to every measured value
+
+	Returns:
+	    Mapping of "scenario@subtasks" to metric limits
+	"""
+	return {r.key: {metric: getattr(r, metric) * headroom for metric in THRESHOLD_METRICS} for r in results}
+
+
+def check_thresholds(results: List[BenchmarkResult], thresholds: Dict[str, Dict[str, float]]) -> List[str]:
+	"""
+	Compare results against thresholds.
+
+	Returns:
+	    A human readable message for every metric that exceeds its limit
+	"""
+	violations = []
+	for r in results:
+		for metric, limit in thresholds.get(r.key, {}).items():
+			value = getattr(r, metric)
+			if value > limit:
+				violations.append(f'{r.key} {metric}: {value:.4f} > {limit:.4f}')
+	return violations
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+	header = f'{"scenario":<14}{"subtasks":>9}{"wall s":>10}{"overhead s":>12}{"blocked s":>11}{"mem KiB":>10}{"io reads":>10}{"io writes":>10}{"io MiB":>9}{"llm":>7}'
+	lines = [header, '-' * len(header)]
+	for r in results:
+		lines.append(
+			f'{r.scenario:<14}{r.subtasks:>9}{r.wall_time:>10.3f}{r.overhead_time:>12.3f}{r.loop_blocked_time:>11.3f}'
+			f'{r.memory_growth / 1024:>10.1f}{r.memory_reads:>10}{r.memory_writes:>10}'
+			f'{r.memory_bytes_written / (1024 * 1024):>9.2f}{r.llm_calls:>7}'
+		)
+	return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description='Offline benchmark for the architect orchestration layer')
+	parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+	parser.add_argument('--scales', nargs='+', type=int, default=list(DEFAULT_SCALES), help='Subtask counts to run')
+	parser.add_argument('--llm-latency', type=float, default=0.0, help='Simulated seconds per LLM call')
+	parser.add_argument('--browser-latency', type=float, default=0.0, help='Simulated seconds per browser step')
+	parser.add_argument('--browser-steps', type=int, default=1, help='Steps per simulated browser run')
+	parser.add_argument('--skip-memory', action='store_true', help='Skip the traced pass that measures memory growth')
+	parser.add_argument('--json', dest='json_path', help='Write raw results to this file')
+	parser.add_argument('--thresholds', help='Fail if any metric exceeds the limits in this file')
+	parser.add_argument('--write-thresholds', help='Write thresholds derived from this run to this file')
+	parser.add_argument('--headroom', type=float, default=1.5, help='Factor applied when writing thresholds')
+	args = parser.parse_args(argv)
+
+	results = asyncio.run(
+		run_benchmarks(
+			args.scenarios,
+			args.scales,
+			llm_latency=args.llm_latency,
+			browser_latency=args.browser_latency,
+			browser_steps=args.browser_steps,
+			measure_memory=not args.skip_memory,
+		)
+	)
+	print(format_results(results))
+
+	if args.json_path:
+		with open(args.json_path, 'w') as f:
+			json.dump([asdict(r) for r in results], f, indent=2)
+
+	if args.write_thresholds:
+		with open(args.write_thresholds, 'w') as f:
+			json.dump(build_thresholds(results, args.headroom), f, indent=2)
+
+	if args.thresholds:
+		with open(args.thresholds, 'r') as f:
+			violations = check_thresholds(results, json.load(f))
+		if violations:
+			print('\nRegressions:\n' + '\n'.join(violations))
+			return 1
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
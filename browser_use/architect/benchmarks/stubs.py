@@ -0,0 +1,225 @@
+"""
+Deterministic in-process stand-ins for the LLM and the browser.
+
+These stubs let the architect orchestration (planning logic, memory writes,
+callbacks, result formatting) be measured without any network access.
+"""
+
+import asyncio
+import hashlib
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from browser_use.agent.views import ActionResult, AgentHistory, AgentHistoryList
+from browser_use.browser.views import BrowserStateHistory
+
+# Names exported by llm_interface that agent modules import directly
+LLM_INTERFACE_FUNCTIONS = ('run_and_parse', '_run_llm_with_retry', '_run_llm', 'think', 'summarize')
+
+
+class StubLLM:
+	"""
+	Replacement for the functions in llm_interface with configurable latency.
+
+	Responses are derived from a hash of the prompt, so repeated runs produce
+	identical output.
+	"""
+
+	def __init__(self, latency: float = 0.0, response_size: int = 200):
+		"""
+		Initialize the stub.
+
+		Args:
+		    latency: Seconds to sleep per call, simulating the network round-trip
+		    response_size: Approximate number of characters in each text response
+		"""
+		self.latency = latency
+		self.response_size = response_size
+		self.calls: Dict[str, int] = {name: 0 for name in LLM_INTERFACE_FUNCTIONS}
+
+	@property
+	def total_calls(self) -> int:
+		return sum(self.calls.values())
+
+	@property
+	def simulated_latency(self) -> float:
+		"""Total time spent sleeping on behalf of the LLM."""
+		return self.total_calls * self.latency
+
+	def _text(self, prompt: str) -> str:
+		digest = hashlib.sha1(prompt.encode()).hexdigest()[:8]
+		filler = f'stub response {digest}. '
+		return (filler * (self.response_size // len(filler) + 1))[: self.response_size]
+
+	async def _call(self, name: str) -> None:
+		self.calls[name] += 1
+		if self.latency:
+			await asyncio.sleep(self.latency)
+
+	async def run_and_parse(self, prompt: str, model: str = 'gemini-2.0-flash-lite') -> Dict[str, Any]:
+		await self._call('run_and_parse')
+		return {
+			'name': 'AgentOutput',
+			'parameters': {
+				'action': [
+					{'open_url': {'url': 'https://example.com'}},
+					{'wait': {'timeout': 1000}},
+					{'extract_content': {'selector': 'main', 'attribute': 'text'}},
+				],
+				'current_state': {
+					'evaluation_previous_goal': 'Starting research',
+					'memory': '',
+					'next_goal': 'Extract and analyze relevant information',
+				},
+			},
+		}
+
+	async def _run_llm_with_retry(
+		self, prompt: str, model: str = 'gemini-1.5-pro', max_retries: int = 3, required_fields: Optional[list[str]] = None
+	) -> Dict[str, Any]:
+		await self._call('_run_llm_with_retry')
+		result: Dict[str, Any] = {'text': self._text(prompt)}
+		for field in required_fields or []:
+			result[field] = {}
+		return result
+
+	async def _run_llm(self, prompt: str, model: str = 'gemini-1.5-pro') -> str:
+		await self._call('_run_llm')
+		return self._text(prompt)
+
+	async def think(self, prompt: str, model: str = 'gemini-1.5-pro') -> str:
+		await self._call('think')
+		return self._text(prompt)
+
+	async def summarize(self, text: str, model: str = 'gemini-1.5-pro') -> str:
+		await self._call('summarize')
+		return self._text(text)
+
+
+class StubBrowser:
+	"""Stands in for browser_use.Browser, never launches anything."""
+
+	def __init__(self, config: Any = None):
+		self.config = config
+
+	async def close(self) -> None:
+		pass
+
+
+class StubChatModel:
+	"""Stands in for the langchain chat model handed to the browser Agent."""
+
+	def __init__(self, *args: Any, **kwargs: Any):
+		self.model = kwargs.get('model', 'stub')
+
+
+class StubBrowserAgent:
+	"""
+	Stands in for browser_use.Agent.
+
+	`run` sleeps for the configured number of steps and returns a real
+	AgentHistoryList so downstream result handling behaves as in production.
+	"""
+
+	latency: float = 0.0
+	steps: int = 1
+	runs: int = 0
+
+	def __init__(self, task: str, llm: Any = None, browser: Any = None, **kwargs: Any):
+		self.task = task
+		self.llm = llm
+		self.browser = browser
+
+	async def run(self, max_steps: int = 100) -> AgentHistoryList:
+		type(self).runs += 1
+		history = []
+		for step in range(self.steps):
+			if self.latency:
+				await asyncio.sleep(self.latency)
+			is_done = step == self.steps - 1
+			content = f'Extracted content for step {step + 1}: {hashlib.sha1(self.task.encode()).hexdigest()[:8]}'
+			history.append(
+				AgentHistory(
+					model_output=None,
+					result=[
+						ActionResult(
+							is_done=is_done, success=True if is_done else None, extracted_content=content, include_in_memory=True
+						)
+					],
+					state=BrowserStateHistory(url='https://example.com', title='Example', tabs=[], interacted_element=[None]),
+				)
+			)
+		return AgentHistoryList(history=history)
+
+
+def stub_browser_agent(latency: float = 0.0, steps: int = 1) -> type:
+	"""
+	Create a StubBrowserAgent subclass with its own latency and step count.
+
+	Args:
+	    latency: Seconds to sleep per simulated browser step
+	    steps: Number of steps each run produces
+
+	Returns:
+	    The configured agent class
+	"""
+	return type('StubBrowserAgent', (StubBrowserAgent,), {'latency': latency, 'steps': steps, 'runs': 0})
+
+
+@contextmanager
+def patch_attributes(patches: List[tuple]) -> Iterator[None]:
+	"""
+	Temporarily replace module attributes.
+
+	Args:
+	    patches: List of (module, attribute name, replacement) tuples
+	"""
+	originals = [(module, name, getattr(module, name)) for module, name, _ in patches]
+	try:
+		for module, name, value in patches:
+			setattr(module, name, value)
+		yield
+	finally:
+		for module, name, value in reversed(originals):
+			setattr(module, name, value)
+
+
+@contextmanager
+def patch_llm_interface(stub: StubLLM) -> Iterator[StubLLM]:
+	"""
+	Route every llm_interface function used by the architect agents through a stub.
+
+	Agent modules import these functions by name, so each loaded
+	browser_use.architect module has its references swapped as well.
+	"""
+	# Load every agent module up front so their references exist before patching
+	import browser_use.architect.agents.architect_agent  # noqa: F401
+	import browser_use.architect.agents.plan_executor  # noqa: F401
+	from browser_use.architect.tools import llm_interface
+
+	originals = {name: getattr(llm_interface, name) for name in LLM_INTERFACE_FUNCTIONS}
+	patches = []
+	for module_name, module in list(sys.modules.items()):
+		if module is None or not module_name.startswith('browser_use.architect'):
+			continue
+		for name, original in originals.items():
+			if getattr(module, name, None) is original:
+				patches.append((module, name, getattr(stub, name)))
+	with patch_attributes(patches):
+		yield stub
+
+
+@contextmanager
+def patch_browser(agent_cls: type = StubBrowserAgent) -> Iterator[type]:
+	"""Replace the browser, browser Agent and chat model used by ResearcherAgent."""
+	from browser_use.architect.agents import researcher_agent
+
+	with patch_attributes(
+		[
+			(researcher_agent, 'Agent', agent_cls),
+			(researcher_agent, 'Browser', StubBrowser),
+			(researcher_agent, 'ChatGoogleGenerativeAI', StubChatModel),
+		]
+	):
+		yield agent_cls
@@ -2,33 +2,38 @@ import json
 from datetime import datetime
 import os
 
-MEMORY_PATH = "browser_use/architect/memory/memory.json"
+# One JSON object per line, appended as agents log, so a write never rewrites earlier entries
+MEMORY_PATH = "browser_use/architect/memory/memory.jsonl"
+
+# Entry kind written to the file -> list it is loaded into
+MEMORY_KINDS = {"log": "logs", "task": "tasks"}
 
 def _load_memory():
+    memory = {"logs": [], "tasks": []}
     if not os.path.exists(MEMORY_PATH):
-        return {"logs": [], "tasks": []}
+        return memory
     with open(MEMORY_PATH, "r") as f:
-        return json.load(f)
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                memory[MEMORY_KINDS[entry.pop("kind")]].append(entry)
+    return memory
 
-def _save_memory(memory):
-    with open(MEMORY_PATH, "w") as f:
-        json.dump(memory, f, indent=2)
+def _append_memory(kind, entry):
+    with open(MEMORY_PATH, "a") as f:
+        f.write(json.dumps({"kind": kind, **entry}) + "\n")
 
 def log_message(agent, message):
-    memory = _load_memory()
-    memory["logs"].append({
+    _append_memory("log", {
         "agent": agent,
         "message": message,
         "timestamp": datetime.utcnow().isoformat()
     })
-    _save_memory(memory)
 
 def save_task_result(agent, task_id, result):
-    memory = _load_memory()
-    memory["tasks"].append({
+    _append_memory("task", {
         "agent": agent,
         "task_id": task_id,
         "result": result,
         "timestamp": datetime.utcnow().isoformat()
     })
-    _save_memory(memory)
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Near-duplicate detection for research sources.
+
+Syndicated articles show up under several URLs with small differences in
+boilerplate. Each text gets a 64-bit simhash over word shingles. Texts within
+a small Hamming distance are collapsed into one source that keeps every URL,
+so citations survive while the LLM only reads the content once.
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+FINGERPRINT_BITS = 64
+# Four 16-bit bands: two fingerprints within distance 3 share at least one band exactly
+BANDS = 4
+BAND_BITS = FINGERPRINT_BITS // BANDS
+SHINGLE_SIZE = 3
+# Below this many shingles simhash is too noisy, only identical fingerprints match
+MIN_SHINGLES = 8
+# Same rough estimate the agent's message manager uses
+CHARS_PER_TOKEN = 3
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def simhash(text: str) -> Tuple[int, int]:
+	"""
+	Compute the simhash fingerprint of a text.
+
+	Args:
+	    text: The text to fingerprint
+
+	Returns:
+	    The 64-bit fingerprint and the number of shingles it was built from
+	"""
+	words = WORD_PATTERN.findall(text.lower())
+	if len(words) < SHINGLE_SIZE:
+		shingles = [' '.join(words)]
+	else:
+		shingles = [' '.join(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+	weights = [0] * FINGERPRINT_BITS
+	for shingle in shingles:
+		value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big')
+		for bit in range(FINGERPRINT_BITS):
+			weights[bit] += 1 if value >> bit & 1 else -1
+
+	fingerprint = 0
+	for bit, weight in enumerate(weights):
+		if weight > 0:
+			fingerprint |= 1 << bit
+	return fingerprint, len(shingles)
+
+
+def estimate_tokens(text: str) -> int:
+	return len(text) // CHARS_PER_TOKEN
+
+
+@dataclass
+class Source:
+	"""A piece of collected content and every location it was found at."""
+
+	text: str
+	urls: List[str] = field(default_factory=list)
+
+	def format(self) -> str:
+		"""Render the source for a prompt, listing all URLs for citation."""
+		if not self.urls:
+			return self.text
+		return f'Sources: {", ".join(self.urls)}\n{self.text}'
+
+
+class NearDuplicateIndex:
+	"""
+	Index of content fingerprints, optionally persisted across runs.
+
+	Clusters of near-identical content remember every URL they were seen at,
+	including URLs from earlier runs when a path is given.
+	"""
+
+	def __init__(self, path: Optional[str] = None, max_distance: int = 3, max_clusters: int = 10000):
+		"""
+		Initialize the index.
+
+		Args:
+		    path: JSON file to load clusters from and save them to, in-memory only if None
+		    max_distance: Maximum Hamming distance between fingerprints of duplicates (at most BANDS - 1)
+		    max_clusters: Oldest clusters are dropped when saving more than this
+		"""
+		if max_distance >= BANDS:
+			raise ValueError(f'max_distance must be below {BANDS}')
+		self.path = path
+		self.max_distance = max_distance
+		self.max_clusters = max_clusters
+		self.clusters: List[Dict] = []
+		self._bands: Dict[Tuple[int, int], List[int]] = {}
+		self.duplicates_collapsed = 0
+		self.tokens_saved = 0
+
+		if path and os.path.exists(path):
+			with open(path, 'r') as f:
+				for cluster in json.load(f):
+					self._add_cluster(cluster['fingerprint'], cluster['urls'])
+
+	def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+		mask = (1 << BAND_BITS) - 1
+		return [(band, fingerprint >> (band * BAND_BITS) & mask) for band in range(BANDS)]
+
+	def _add_cluster(self, fingerprint: int, urls: List[str]) -> int:
+		cluster_id = len(self.clusters)
+		self.clusters.append({'fingerprint': fingerprint, 'urls': list(urls)})
+		for key in self._band_keys(fingerprint):
+			self._bands.setdefault(key, []).append(cluster_id)
+		return cluster_id
+
+	def find(self, fingerprint: int, exact: bool = False) -> Optional[int]:
+		"""Return the id of the closest cluster within max_distance, or None."""
+		max_distance = 0 if exact else self.max_distance
+		best, best_distance = None, max_distance + 1
+		for key in self._band_keys(fingerprint):
+			for cluster_id in self._bands.get(key, []):
+				distance = bin(self.clusters[cluster_id]['fingerprint'] ^ fingerprint).count('1')
+				if distance < best_distance:
+					best, best_distance = cluster_id, distance
+		return best
+
+	def add(self, text: str, urls: Optional[List[str]] = None) -> int:
+		"""
+		Add a text to the index.
+
+		Args:
+		    text: The content
+		    urls: Where the content was found
+
+		Returns:
+		    The id of the cluster the text belongs to
+		"""
+		fingerprint, shingles = simhash(text)
+		cluster_id = self.find(fingerprint, exact=shingles < MIN_SHINGLES)
+		if cluster_id is None:
+			return self._add_cluster(fingerprint, urls or [])
+		known = self.clusters[cluster_id]['urls']
+		known.extend(url for url in urls or [] if url not in known)
+		return cluster_id
+
+	def record_duplicate(self, text: str) -> None:
+		"""Count a text that was left out of a prompt because it duplicates another one."""
+		self.duplicates_collapsed += 1
+		self.tokens_saved += estimate_tokens(text)
+
+	def collapse(self, sources: List[Source]) -> List[Source]:
+		"""
+		Merge near-duplicate sources before they go into a prompt.
+
+		The first copy of each cluster is kept. Its URLs are extended with those
+		of the dropped copies and of earlier sightings of the same content.
+
+		Args:
+		    sources: Sources in prompt order
+
+		Returns:
+		    The deduplicated sources, in the order of their first occurrence
+		"""
+		kept: Dict[int, Source] = {}
+		for source in sources:
+			cluster_id = self.add(source.text, source.urls)
+			if cluster_id in kept:
+				self.record_duplicate(source.text)
+			else:
+				kept[cluster_id] = Source(text=source.text)
+
+		for cluster_id, source in kept.items():
+			source.urls = list(self.clusters[cluster_id]['urls'])
+		return list(kept.values())
+
+	def save(self) -> None:
+		if not self.path:
+			return
+		# Clusters without URLs (e.g. agent results) carry no provenance worth keeping
+		clusters = [cluster for cluster in self.clusters if cluster['urls']]
+		os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+		with open(self.path, 'w') as f:
+			json.dump(clusters[-self.max_clusters :], f)
@@ -0,0 +1,240 @@
+"""
+Plain HTTP fetcher used before falling back to a full browser.
+
+Static pages (docs, Wikipedia, blogs) can be read with a single pooled HTTP
+request. Pages that look blocked, JavaScript-rendered or empty are flagged
+for escalation to the browser Agent.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import httpx
+import markdownify
+
+from browser_use.page_store.service import PageStore
+from browser_use.page_store.views import StoredPage
+
+DEFAULT_USER_AGENT = (
+	'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+)
+
+# Statuses that usually mean bot protection or rate limiting rather than a missing page
+BLOCKED_STATUS_CODES = {401, 403, 429, 503}
+
+BLOCKED_MARKERS = (
+	'captcha',
+	'cf-browser-verification',
+	'challenge-platform',
+	'are you a robot',
+	'access denied',
+	'unusual traffic',
+)
+
+JS_REQUIRED_MARKERS = (
+	'enable javascript',
+	'javascript is required',
+	'javascript is disabled',
+	'requires javascript',
+)
+
+TEXT_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')
+
+SCRIPT_TAG_PATTERN = re.compile(r'<script\b', re.IGNORECASE)
+
+# Page store variant holding the output of html_to_text
+TEXT_VARIANT = 'http-text'
+
+
+@dataclass
+class FetchResult:
+	"""Outcome of fetching one URL over plain HTTP."""
+
+	url: str
+	status_code: Optional[int]
+	text: str
+	elapsed: float
+	escalate_reason: Optional[str] = None
+	from_store: bool = False
+
+	@property
+	def needs_browser(self) -> bool:
+		return self.escalate_reason is not None
+
+
+def html_to_text(html: str) -> str:
+	"""Convert HTML to the markdown text the browser agent would extract."""
+	text = markdownify.markdownify(html, strip=['a', 'img'])
+	return re.sub(r'\n{3,}', '\n\n', text).strip()
+
+
+def escalation_reason(status_code: int, content_type: str, html: str, text: str, min_text_chars: int) -> Optional[str]:
+	"""
+	Decide whether a fetched page has to be loaded in a real browser.
+
+	Args:
+	    status_code: HTTP status of the response
+	    content_type: Content-Type header of the response
+	    html: Raw response body
+	    text: Text extracted from the body
+	    min_text_chars: Minimum amount of text for a page to count as rendered
+
+	Returns:
+	    A short reason ("blocked", "js-rendered", "empty", ...) or None if the text can be used as is
+	"""
+	if status_code in BLOCKED_STATUS_CODES:
+		return f'blocked (HTTP {status_code})'
+	if status_code >= 400:
+		return f'HTTP {status_code}'
+	if content_type and not content_type.startswith(TEXT_CONTENT_TYPES):
+		return f'unsupported content type {content_type}'
+
+	# Only the start of the body matters for challenge pages and noscript banners
+	head = html[:20000].lower()
+	if len(text) < min_text_chars * 4 and any(marker in head for marker in BLOCKED_MARKERS):
+		return 'blocked'
+	if len(text) < min_text_chars:
+		if any(marker in head for marker in JS_REQUIRED_MARKERS) or SCRIPT_TAG_PATTERN.search(html):
+			return 'js-rendered'
+		return 'empty'
+	return None
+
+
+class HttpFetcher:
+	"""
+	Async HTTP client with connection pooling, compression and a concurrency limit.
+
+	The underlying httpx client is created on first use so a fetcher can be
+	constructed outside of a running event loop.
+	"""
+
+	def __init__(
+		self,
+		max_concurrency: int = 5,
+		max_connections: int = 20,
+		timeout: float = 15.0,
+		min_text_chars: int = 200,
+		user_agent: str = DEFAULT_USER_AGENT,
+		page_store: Optional[PageStore] = None,
+	):
+		"""
+		Initialize the fetcher.
+
+		Args:
+		    max_concurrency: Maximum number of requests in flight at once
+		    max_connections: Size of the connection pool
+		    timeout: Seconds before a request is abandoned
+		    min_text_chars: Pages with less extracted text are escalated to the browser
+		    user_agent: User-Agent header sent with every request
+		    page_store: Persistent store consulted before the network and revalidated with ETag/Last-Modified
+		"""
+		self.max_concurrency = max_concurrency
+		self.max_connections = max_connections
+		self.timeout = timeout
+		self.min_text_chars = min_text_chars
+		self.user_agent = user_agent
+		self.page_store = page_store
+		self._client: Optional[httpx.AsyncClient] = None
+		self._semaphore: Optional[asyncio.Semaphore] = None
+
+	def _get_client(self) -> httpx.AsyncClient:
+		if self._client is None:
+			self._client = httpx.AsyncClient(
+				# httpx negotiates gzip/deflate (and brotli/zstd when installed) by default
+				headers={'User-Agent': self.user_agent, 'Accept': 'text/html,application/xhtml+xml,text/plain;q=0.9,*/*;q=0.5'},
+				limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+				timeout=self.timeout,
+				follow_redirects=True,
+			)
+			self._semaphore = asyncio.Semaphore(self.max_concurrency)
+		return self._client
+
+	async def fetch(self, url: str) -> FetchResult:
+		"""
+		Fetch a URL and extract its text.
+
+		Fresh pages in the page store are served without a request, stale ones are
+		revalidated with a conditional GET. Network errors do not raise, they
+		produce a result flagged for escalation.
+
+		Args:
+		    url: The page to fetch
+
+		Returns:
+		    The fetch result
+		"""
+		start = time.perf_counter()
+		# The page store is SQLite, its calls run in a worker thread to keep the event loop free
+		stored = await asyncio.to_thread(self.page_store.get, url) if self.page_store else None
+		if stored and stored.is_fresh:
+			return await self._stored_result(stored, 200, start)
+
+		client = self._get_client()
+		headers = stored.revalidation_headers() if stored else {}
+		async with self._semaphore:
+			try:
+				response = await client.get(url, headers=headers)
+			except httpx.HTTPError as e:
+				return FetchResult(url, None, '', time.perf_counter() - start, f'request failed: {e.__class__.__name__}')
+
+		cache_control = response.headers.get('cache-control')
+		if stored and response.status_code == 304:
+			stored = await asyncio.to_thread(self.page_store.refresh, url, cache_control) or stored
+			return await self._stored_result(stored, 304, start)
+
+		html = response.text
+		content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+		if content_type == 'text/plain':
+			text = html
+		else:
+			stored = None
+			if self.page_store and response.status_code == 200 and content_type.startswith(TEXT_CONTENT_TYPES):
+				stored = await asyncio.to_thread(
+					self.page_store.put,
+					str(response.url),
+					html,
+					etag=response.headers.get('etag'),
+					last_modified=response.headers.get('last-modified'),
+					cache_control=cache_control,
+				)
+				# Redirected requests are stored under their final URL as well as the requested one
+				if stored and str(response.url) != url:
+					await asyncio.to_thread(
+						self.page_store.put,
+						url,
+						html,
+						etag=stored.etag,
+						last_modified=stored.last_modified,
+						cache_control=cache_control,
+					)
+			# markdownify is CPU bound, keep it off the event loop so other fetches proceed
+			if stored:
+				text = await asyncio.to_thread(self.page_store.text, stored, TEXT_VARIANT, html_to_text)
+			else:
+				text = await asyncio.to_thread(html_to_text, html)
+		reason = escalation_reason(response.status_code, content_type, html, text, self.min_text_chars)
+		return FetchResult(str(response.url), response.status_code, text, time.perf_counter() - start, reason)
+
+	async def _stored_result(self, stored: StoredPage, status_code: int, start: float) -> FetchResult:
+		html = await asyncio.to_thread(self.page_store.html, stored) or ''
+		text = await asyncio.to_thread(self.page_store.text, stored, TEXT_VARIANT, html_to_text)
+		reason = escalation_reason(200, 'text/html', html, text, self.min_text_chars)
+		return FetchResult(stored.url, status_code, text, time.perf_counter() - start, reason, from_store=True)
+
+	async def fetch_all(self, urls: List[str]) -> List[FetchResult]:
+		"""Fetch several URLs concurrently, bounded by max_concurrency."""
+		return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+	async def aclose(self) -> None:
+		if self._client is not None:
+			await self._client.aclose()
+			self._client = None
+
+	async def __aenter__(self) -> 'HttpFetcher':
+		return self
+
+	async def __aexit__(self, *exc_info) -> None:
+		await self.aclose()
@@ -5,21 +5,49 @@ from typing import Any, Dict, Optional
 
 import google.generativeai as genai
 
+from browser_use.cassette.service import Cassette
+from browser_use.cassette.views import CassetteMissError
+
 # Configure with API key from env
 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
+# Optional record/replay cassette for every Gemini call made through this module
+_cassette: Optional[Cassette] = None
+
 class RetryError(Exception):
     def __init__(self, message: str, status_code: int = 400):
         self.status_code = status_code
         self.message = message
         super().__init__(f"Error {status_code}: {message}")
 
+def set_cassette(cassette: Optional[Cassette]) -> None:
+    """
+    Route Gemini calls through a record/replay cassette.
+
+    Args:
+        cassette: Cassette to record to or replay from, or None to call Gemini directly
+    """
+    global _cassette
+    _cassette = cassette
+
+async def _generate(prompt: str, model: str) -> str:
+    """Call Gemini and return the raw response text, via the cassette when one is set."""
+    def call() -> str:
+        model_instance = genai.GenerativeModel(model_name=model)
+        return model_instance.generate_content(prompt).text
+
+    if _cassette is None:
+        return call()
+
+    async def acall() -> str:
+        return call()
+
+    return await _cassette.aplay("gemini", f"{model}\n{prompt}", acall)
+
 async def run_and_parse(prompt: str, model: str = "gemini-2.0-flash-lite") -> Dict[str, Any]:
     """Run Gemini and parse the output as JSON if possible."""
     try:
-        model_instance = genai.GenerativeModel(model_name=model)
-        response = model_instance.generate_content(prompt)
-        content = response.text.strip()
+        content = (await _generate(prompt, model)).strip()
 
         if content.startswith("```json"):
             content = content.split("```json")[1].split("```")[0].strip()
@@ -28,6 +56,10 @@ async def run_and_parse(prompt: str, model: str = "gemini-2.0-flash-lite") -> Di
 
         return json.loads(content)
 
+    # An outdated cassette is not a model failure, the replay must stop
+    except CassetteMissError:
+        raise
+
     except Exception as e:
         return {
             "error": str(e),
@@ -65,7 +97,10 @@ async def _run_llm_with_retry(prompt: str, model: str = "gemini-1.5-pro", max_re
         except RetryError as e:
             last_error = str(e)
             last_response = result.get("raw_response") if result else None
-        
+
+        except CassetteMissError:
+            raise
+
         except Exception as e:
             last_error = f"Unexpected error: {str(e)}"
             last_response = str(result) if result else None
@@ -81,16 +116,16 @@ async def _run_llm_with_retry(prompt: str, model: str = "gemini-1.5-pro", max_re
 
 async def _run_llm(prompt: str, model: str = "gemini-1.5-pro") -> str:
     try:
-        model_instance = genai.GenerativeModel(model_name=model)
-        response = model_instance.generate_content(prompt)
-        return response.text.strip()
+        return (await _generate(prompt, model)).strip()
+    except CassetteMissError:
+        raise
     except Exception as e:
         retry_msg = f"⚠️ LLM error: {e}\n\nRetrying with fallback prompt..."
         try:
             fallback_prompt = f"{retry_msg}\n\nOriginal prompt:\n{prompt}"
-            model_instance = genai.GenerativeModel(model_name=model)
-            response = model_instance.generate_content(fallback_prompt)
-            return response.text.strip()
+            return (await _generate(fallback_prompt, model)).strip()
+        except CassetteMissError:
+            raise
         except Exception as second_error:
             return f"❌ LLM failed twice: {second_error}"
 
@@ -0,0 +1,315 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+from playwright.async_api import BrowserContext as PlaywrightBrowserContext
+from playwright.async_api import Route
+
+from browser_use.asset_cache.views import AssetCacheStats, CachedAsset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASSET_CACHE_PATH = Path.home() / '.cache' / 'browser_use' / 'assets'
+
+CACHED_RESOURCE_TYPES = ('script', 'stylesheet', 'font', 'image')
+
+# Lifetime of 'immutable' responses without max-age
+IMMUTABLE_LIFETIME = 365 * 24 * 3600
+# Heuristic freshness for responses with only Last-Modified: a tenth of their age, at most a day (RFC 9111 4.2.2)
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_LIFETIME = 24 * 3600
+
+# Response headers replayed on cache hits. Content-Encoding/Length are left out, bodies are stored decoded.
+STORED_HEADERS = (
+	'content-type',
+	'cache-control',
+	'etag',
+	'last-modified',
+	'access-control-allow-origin',
+	'access-control-allow-credentials',
+	'timing-allow-origin',
+	'cross-origin-resource-policy',
+	'x-content-type-options',
+)
+
+DIRECTIVE_PATTERN = re.compile(r'([a-z-]+)(?:=("?)([^",]*)\2)?')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+	url TEXT PRIMARY KEY,
+	content_hash TEXT NOT NULL,
+	headers TEXT NOT NULL,
+	etag TEXT,
+	last_modified TEXT,
+	expires_at REAL NOT NULL,
+	last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_last_access ON assets (last_access);
+CREATE TABLE IF NOT EXISTS blobs (
+	content_hash TEXT PRIMARY KEY,
+	size INTEGER NOT NULL
+);
+"""
+
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+	if not value:
+		return None
+	try:
+		return parsedate_to_datetime(value).timestamp()
+	except (TypeError, ValueError):
+		return None
+
+
+def cache_lifetime(headers: dict[str, str], credentialed: bool = False) -> Optional[float]:
+	"""
+	Seconds a response may be reused without revalidation, following shared-cache rules.
+
+	Returns None if the response must not be stored, 0 if it may only be reused after revalidation.
+	Responses to requests with Authorization or Cookie headers (credentialed) are only stored when
+	they are explicitly public or have s-maxage. Header names must be lowercase.
+	"""
+	directives = {name: value for name, _, value in DIRECTIVE_PATTERN.findall(headers.get('cache-control', '').lower())}
+	if 'no-store' in directives or 'private' in directives or 'set-cookie' in headers:
+		return None
+	if credentialed and 'public' not in directives and 's-maxage' not in directives:
+		return None
+	# Responses that vary on more than the encoding may differ per client
+	if any(field.strip() not in ('', 'accept-encoding') for field in headers.get('vary', '').lower().split(',')):
+		return None
+	validated = 'etag' in headers or 'last-modified' in headers
+
+	if 'no-cache' in directives:
+		return 0 if validated else None
+	for name in ('s-maxage', 'max-age'):
+		if directives.get(name, '').isdigit():
+			return float(directives[name])
+	if 'immutable' in directives:
+		return IMMUTABLE_LIFETIME
+
+	date = _parse_date(headers.get('date')) or time.time()
+	expires = _parse_date(headers.get('expires'))
+	if 'expires' in headers:
+		return max(expires - date, 0.0) if expires else 0.0
+	last_modified = _parse_date(headers.get('last-modified'))
+	if last_modified:
+		return min(max(date - last_modified, 0.0) * HEURISTIC_FRACTION, HEURISTIC_MAX_LIFETIME)
+	return 0 if validated else None
+
+
+class AssetCache:
+	"""
+	Shared, content-addressed on-disk cache of static assets, served through Playwright request routing.
+
+	Fresh contexts start with an empty HTTP cache. Contexts that share an AssetCache (also across
+	processes, through the same directory) answer GET requests for scripts, stylesheets, fonts and
+	images from disk while the asset is fresh under its Cache-Control/Expires headers, and revalidate
+	stale ones with If-None-Match/If-Modified-Since. Bodies are stored once per content hash. When
+	they exceed max_bytes the least recently used URLs are evicted. Disk and index access runs in a
+	worker thread, off the event loop that serves the routes.
+	"""
+
+	def __init__(
+		self,
+		path: str | Path = DEFAULT_ASSET_CACHE_PATH,
+		max_bytes: int = 512 * 1024 * 1024,
+		resource_types: tuple[str, ...] = CACHED_RESOURCE_TYPES,
+	):
+		self.path = Path(path).expanduser()
+		self.max_bytes = max_bytes
+		self.resource_types = frozenset(resource_types)
+
+		self.hits = 0
+		self.revalidated = 0
+		self.misses = 0
+		self.stored = 0
+		self.evictions = 0
+		self.bytes_served = 0
+
+		(self.path / 'blobs').mkdir(parents=True, exist_ok=True)
+		self._lock = threading.Lock()
+		self._db = sqlite3.connect(self.path / 'index.sqlite', check_same_thread=False, isolation_level=None)
+		self._db.execute('PRAGMA journal_mode=WAL')
+		self._db.executescript(SCHEMA)
+		self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+
+	@property
+	def size(self) -> int:
+		"""Bytes of asset bodies currently stored"""
+		return self._size
+
+	def _blob_path(self, content_hash: str) -> Path:
+		return self.path / 'blobs' / content_hash[:2] / content_hash
+
+	def lookup(self, url: str) -> Optional[CachedAsset]:
+		"""Look up a URL, fresh or stale. Use `CachedAsset.is_fresh` to decide whether to revalidate."""
+		with self._lock:
+			row = self._db.execute(
+				'SELECT url, content_hash, headers, etag, last_modified, expires_at FROM assets WHERE url = ?', (url,)
+			).fetchone()
+			if row is None:
+				return None
+			self._db.execute('UPDATE assets SET last_access = ? WHERE url = ?', (time.time(), url))
+		url, content_hash, headers, etag, last_modified, expires_at = row
+		return CachedAsset(
+			url=url,
+			content_hash=content_hash,
+			headers=json.loads(headers),
+			etag=etag,
+			last_modified=last_modified,
+			expires_at=expires_at,
+		)
+
+	def read(self, asset: CachedAsset) -> Optional[bytes]:
+		try:
+			return self._blob_path(asset.content_hash).read_bytes()
+		except OSError:
+			return None
+
+	def store(
+		self, url: str, status: int, headers: dict[str, str], body: bytes, credentialed: bool = False
+	) -> Optional[CachedAsset]:
+		"""
+		Store a response if it is cacheable. Returns None otherwise or if the body exceeds max_bytes.
+		Set credentialed for responses to requests that carried Authorization or Cookie headers.
+		"""
+		headers = {name.lower(): value for name, value in headers.items()}
+		lifetime = cache_lifetime(headers, credentialed)
+		if status != 200 or lifetime is None or len(body) > self.max_bytes:
+			return None
+
+		content_hash = hashlib.sha256(body).hexdigest()
+		blob_path = self._blob_path(content_hash)
+		if not blob_path.exists():
+			blob_path.parent.mkdir(exist_ok=True)
+			temp_path = blob_path.with_name(f'{content_hash}.{os.getpid()}.tmp')
+			temp_path.write_bytes(body)
+			os.replace(temp_path, blob_path)
+
+		stored_headers = {name: headers[name] for name in STORED_HEADERS if name in headers}
+		now = time.time()
+		asset = CachedAsset(
+			url=url,
+			content_hash=content_hash,
+			headers=stored_headers,
+			etag=headers.get('etag'),
+			last_modified=headers.get('last-modified'),
+			expires_at=now + lifetime,
+		)
+		with self._lock:
+			previous = self._db.execute('SELECT content_hash FROM assets WHERE url = ?', (url,)).fetchone()
+			self._db.execute('BEGIN')
+			try:
+				if self._db.execute('INSERT OR IGNORE INTO blobs VALUES (?, ?)', (content_hash, len(body))).rowcount:
+					self._size += len(body)
+				self._db.execute(
+					'INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?, ?, ?, ?)',
+					(url, content_hash, json.dumps(stored_headers), asset.etag, asset.last_modified, asset.expires_at, now),
+				)
+				if previous and previous[0] != content_hash:
+					self._delete_orphan(previous[0])
+				self._evict()
+				self._db.execute('COMMIT')
+			except Exception:
+				self._db.execute('ROLLBACK')
+				raise
+		self.stored += 1
+		return asset
+
+	def refresh(self, asset: CachedAsset, headers: dict[str, str]) -> CachedAsset:
+		"""Extend the lifetime of an asset after the server confirmed it is unchanged (HTTP 304)"""
+		headers = {name.lower(): value for name, value in headers.items()}
+		lifetime = cache_lifetime({**asset.headers, **headers}) or 0.0
+		asset = asset.model_copy(update={'expires_at': time.time() + lifetime})
+		with self._lock:
+			self._db.execute(
+				'UPDATE assets SET expires_at = ?, last_access = ? WHERE url = ?', (asset.expires_at, time.time(), asset.url)
+			)
+		return asset
+
+	def _delete_orphan(self, content_hash: str) -> None:
+		if self._db.execute('SELECT 1 FROM assets WHERE content_hash = ? LIMIT 1', (content_hash,)).fetchone():
+			return
+		row = self._db.execute('SELECT size FROM blobs WHERE content_hash = ?', (content_hash,)).fetchone()
+		self._db.execute('DELETE FROM blobs WHERE content_hash = ?', (content_hash,))
+		if row:
+			self._size -= row[0]
+		self._blob_path(content_hash).unlink(missing_ok=True)
+
+	def _evict(self) -> None:
+		while self._size > self.max_bytes:
+			row = self._db.execute('SELECT url, content_hash FROM assets ORDER BY last_access LIMIT 1').fetchone()
+			if row is None:
+				break
+			self._db.execute('DELETE FROM assets WHERE url = ?', (row[0],))
+			self._delete_orphan(row[1])
+			self.evictions += 1
+
+	async def install(self, context: PlaywrightBrowserContext) -> None:
+		"""Serve the context's static assets through this cache"""
+		await context.route('**/*', self._handle)
+
+	async def _handle(self, route: Route) -> None:
+		request = route.request
+		if (
+			request.method != 'GET'
+			or request.resource_type not in self.resource_types
+			or not request.url.startswith(('http://', 'https://'))
+		):
+			await route.fallback()
+			return
+
+		asset = await asyncio.to_thread(self.lookup, request.url)
+		body = await asyncio.to_thread(self.read, asset) if asset else None
+		if asset and body is not None and asset.is_fresh:
+			self.hits += 1
+			self.bytes_served += len(body)
+			await route.fulfill(status=200, headers=asset.headers, body=body)
+			return
+
+		revalidation_headers = asset.revalidation_headers() if asset and body is not None else {}
+		try:
+			response = await route.fetch(headers={**request.headers, **revalidation_headers} if revalidation_headers else None)
+		except Exception as e:
+			logger.debug(f'Asset cache could not fetch {request.url}: {e}')
+			await route.fallback()
+			return
+
+		if response.status == 304 and revalidation_headers:
+			asset = await asyncio.to_thread(self.refresh, asset, response.headers)
+			self.revalidated += 1
+			self.bytes_served += len(body)
+			await route.fulfill(status=200, headers=asset.headers, body=body)
+			return
+
+		self.misses += 1
+		response_body = await response.body()
+		# request.headers leaves out Cookie, all_headers() has what was actually sent
+		credentialed = any(name.lower() in ('authorization', 'cookie') for name in await request.all_headers())
+		await asyncio.to_thread(self.store, request.url, response.status, response.headers, response_body, credentialed)
+		await route.fulfill(response=response, body=response_body)
+
+	@property
+	def stats(self) -> AssetCacheStats:
+		return AssetCacheStats(
+			hits=self.hits,
+			revalidated=self.revalidated,
+			misses=self.misses,
+			stored=self.stored,
+			evictions=self.evictions,
+			bytes_served=self.bytes_served,
+			size=self._size,
+		)
+
+	def close(self) -> None:
+		with self._lock:
+			self._db.close()
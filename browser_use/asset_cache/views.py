@@ -0,0 +1,46 @@
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CachedAsset(BaseModel):
+	"""An asset entry in the AssetCache, the body is stored once per content hash"""
+
+	url: str
+	content_hash: str
+	headers: dict[str, str]
+	etag: Optional[str] = None
+	last_modified: Optional[str] = None
+	expires_at: float
+
+	@property
+	def is_fresh(self) -> bool:
+		return time.time() < self.expires_at
+
+	def revalidation_headers(self) -> dict[str, str]:
+		"""Conditional request headers for checking whether the cached copy is still current"""
+		headers = {}
+		if self.etag:
+			headers['if-none-match'] = self.etag
+		if self.last_modified:
+			headers['if-modified-since'] = self.last_modified
+		return headers
+
+
+class AssetCacheStats(BaseModel):
+	"""Requests served by the AssetCache, sizes in bytes"""
+
+	hits: int
+	revalidated: int
+	misses: int
+	stored: int
+	evictions: int
+	bytes_served: int
+	size: int
+
+	@property
+	def hit_rate(self) -> float:
+		"""Share of cacheable requests answered from disk, revalidated ones included"""
+		total = self.hits + self.revalidated + self.misses
+		return (self.hits + self.revalidated) / total if total else 0.0
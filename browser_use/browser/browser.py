@@ -31,6 +31,8 @@ from browser_use.browser.chrome import (
 	CHROME_HEADLESS_ARGS,
 )
 from browser_use.browser.context import BrowserContext, BrowserContextConfig
+from browser_use.browser.daemon import BrowserDaemonClient
+from browser_use.browser.driver import PlaywrightDriver, get_shared_driver
 from browser_use.browser.utils.screen_resolution import get_screen_resolution, get_window_adjustments
 from browser_use.utils import time_execution_async
 
@@ -77,6 +79,14 @@ class BrowserConfig(BaseModel):
 
 		deterministic_rendering: False
 			Enable deterministic rendering (makes GPU/font rendering consistent across different OS's and docker)
+
+		shared_driver: False
+			Share one Playwright driver process with all other browsers on the same event loop instead of starting one per browser
+
+		use_daemon: False
+			Attach to a running browser daemon (python -m browser_use.browser.daemon start) instead of launching chromium,
+			only when the daemon was launched with the same headless, disable_security, deterministic_rendering and
+			extra_browser_args settings and no proxy is set
 	"""
 
 	model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore')
@@ -91,6 +101,8 @@ class BrowserConfig(BaseModel):
 	headless: bool = False
 	disable_security: bool = True
 	deterministic_rendering: bool = False
+	shared_driver: bool = False
+	use_daemon: bool = False
 	keep_alive: bool = Field(default=False, alias='_force_keep_browser_alive')  # used to be called _force_keep_browser_alive
 
 	proxy: ProxySettings | None = None
@@ -115,6 +127,8 @@ class Browser:
 		self.config = config
 		self.playwright: Playwright | None = None
 		self.playwright_browser: PlaywrightBrowser | None = None
+		self._driver: PlaywrightDriver | None = None
+		self._daemon: BrowserDaemonClient | None = None
 
 	async def new_context(self, config: BrowserContextConfig = BrowserContextConfig()) -> BrowserContext:
 		"""Create a browser context"""
@@ -130,14 +144,34 @@ class Browser:
 	@time_execution_async('--init (browser)')
 	async def _init(self):
 		"""Initialize the browser session"""
-		playwright = await async_playwright().start()
-		browser = await self._setup_browser(playwright)
-
+		if self.config.shared_driver:
+			self._driver = get_shared_driver()
+			playwright = await self._driver.acquire()
+		else:
+			playwright = await async_playwright().start()
 		self.playwright = playwright
+		try:
+			browser = await self._setup_browser(playwright)
+		except Exception:
+			try:
+				await self._stop_playwright()
+			except Exception as e:
+				logger.debug(f'Failed to stop playwright after failed browser setup: {e}')
+			raise
+
 		self.playwright_browser = browser
 
 		return self.playwright_browser
 
+	async def _stop_playwright(self):
+		"""Stop the Playwright driver, or release this browser's reference if the driver is shared"""
+		playwright, driver = self.playwright, self._driver
+		self.playwright, self._driver = None, None
+		if driver:
+			await driver.release()
+		elif playwright:
+			await playwright.stop()
+
 	async def _setup_remote_cdp_browser(self, playwright: Playwright) -> PlaywrightBrowser:
 		"""Sets up and returns a Playwright Browser instance with anti-detection measures. Firefox has no longer CDP support."""
 		if 'firefox' in (self.config.browser_binary_path or '').lower():
@@ -160,6 +194,38 @@ class Browser:
 		browser = await browser_class.connect(self.config.wss_url)
 		return browser
 
+	async def _setup_daemon_browser(self, playwright: Playwright) -> PlaywrightBrowser | None:
+		"""Connects to the browser daemon if one is running, contexts created on it are isolated from other clients."""
+		daemon = await BrowserDaemonClient.connect()
+		if daemon is None:
+			return None
+		try:
+			launch_settings = (await daemon.status()).get('launch_settings')
+			if launch_settings != self._daemon_launch_settings():
+				logger.debug(
+					f'Browser daemon was launched with different settings ({launch_settings}), launching a browser instead'
+				)
+				await daemon.close()
+				return None
+			cdp_url = await daemon.attach()
+			browser = await playwright.chromium.connect_over_cdp(cdp_url)
+		except Exception as e:
+			logger.debug(f'Failed to attach to browser daemon, launching a browser instead: {e}')
+			await daemon.close()
+			return None
+		logger.info(f'🔌  Attached to browser daemon at {cdp_url}')
+		self._daemon = daemon
+		return browser
+
+	def _daemon_launch_settings(self) -> dict:
+		"""The daemon launch settings this config needs, see BrowserDaemon.launch_settings"""
+		return {
+			'headless': self.config.headless,
+			'disable_security': self.config.disable_security,
+			'deterministic_rendering': self.config.deterministic_rendering,
+			'extra_browser_args': sorted(set(self.config.extra_browser_args)),
+		}
+
 	async def _setup_user_provided_browser(self, playwright: Playwright) -> PlaywrightBrowser:
 		"""Sets up and returns a Playwright Browser instance with anti-detection measures."""
 		if not self.config.browser_binary_path:
@@ -289,6 +355,14 @@ class Browser:
 				return await self._setup_remote_cdp_browser(playwright)
 			if self.config.wss_url:
 				return await self._setup_remote_wss_browser(playwright)
+			if (
+				self.config.use_daemon
+				and self.config.browser_class == 'chromium'
+				and not self.config.browser_binary_path
+				and not self.config.proxy
+			):
+				if browser := await self._setup_daemon_browser(playwright):
+					return browser
 
 			if self.config.headless:
 				logger.warning('⚠️ Headless mode is not recommended. Many sites will detect and block all headless browsers.')
@@ -310,9 +384,11 @@ class Browser:
 			if self.playwright_browser:
 				await self.playwright_browser.close()
 				del self.playwright_browser
+			if self._daemon:
+				await self._daemon.close()
+				self._daemon = None
 			if self.playwright:
-				await self.playwright.stop()
-				del self.playwright
+				await self._stop_playwright()
 			if chrome_proc := getattr(self, '_chrome_subprocess', None):
 				try:
 					# always kill all children processes, otherwise chrome leaves a bunch of zombie processes
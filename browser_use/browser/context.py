@@ -11,8 +11,9 @@ import os
 import re
 import time
 import uuid
+import weakref
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 from playwright._impl._errors import TimeoutError
 from playwright.async_api import Browser as PlaywrightBrowser
@@ -27,13 +28,19 @@ from playwright.async_api import (
 from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import TypedDict
 
+from browser_use.asset_cache.service import AssetCache
+from browser_use.browser.load_profiles import INTERACTIVE_CHANGE_TRACKER_JS, READ_TIMINGS_JS, PageLoadProfiles
+from browser_use.browser.network_idle import NetworkIdleWatcher
+from browser_use.browser.resource_blocking import ResourceBlocker, ResourceBlockingConfig
 from browser_use.browser.views import (
 	BrowserError,
 	BrowserState,
+	PageLoadTimings,
+	PageLoadWaits,
 	TabInfo,
 	URLNotAllowedError,
 )
-from browser_use.dom.service import DomService
+from browser_use.dom.service import REMOVE_HIGHLIGHTS_JS, RESOLVE_HIGHLIGHTED_ELEMENT_JS, DomService
 from browser_use.dom.views import DOMElementNode, SelectorMap
 from browser_use.utils import time_execution_async, time_execution_sync
 
@@ -69,6 +76,21 @@ class BrowserContextConfig(BaseModel):
 	    maximum_wait_page_load_time: 5.0
 	        Maximum time to wait for page load before proceeding anyway
 
+	    cdp_network_idle: False
+	        Detect network idle from CDP Network events (loadingFinished/loadingFailed) instead of Playwright's request/response events (Chromium only)
+
+	    page_load_profiles_path: None
+	        JSON file of learned per-domain page load timings. When set, the three waits above are adapted per domain
+	        after each new document (see PageLoadProfiles) and new timings are saved on close. Unknown domains keep the configured waits.
+
+	    resource_blocking: None
+	        Block resource types (images, media, fonts) and ad/tracker or custom domains for faster, lighter page loads,
+	        see ResourceBlockingConfig. Useful with use_vision=False or for text extraction.
+
+	    asset_cache: None
+	        AssetCache shared between contexts (and processes using the same directory). Scripts, stylesheets, fonts and
+	        images are served from disk while fresh, so new contexts do not re-download them.
+
 	    wait_between_actions: 1.0
 	        Time to wait between multiple per step actions
 
@@ -96,6 +118,15 @@ class BrowserContextConfig(BaseModel):
 	    highlight_elements: True
 	        Highlight elements in the DOM on the screen
 
+	    screenshot_format: 'png'
+	        Image format of state screenshots: 'png', 'jpeg' or 'webp' (webp needs Chromium, other browsers fall back to jpeg)
+
+	    screenshot_quality: 80
+	        Quality (0-100) of jpeg and webp screenshots
+
+	    screenshot_max_width: None
+	        Downscale screenshots wider than this many pixels, keeping the aspect ratio (scaled by the browser, Chromium only)
+
 	    viewport_expansion: 500
 	        Viewport expansion in pixels. This amount will increase the number of elements which are included in the state what the LLM will see. If set to -1, all elements will be included (this leads to high token usage). If set to 0, only the elements which are visible in the viewport will be included.
 
@@ -128,6 +159,10 @@ class BrowserContextConfig(BaseModel):
 	minimum_wait_page_load_time: float = 0.25
 	wait_for_network_idle_page_load_time: float = 0.5
 	maximum_wait_page_load_time: float = 5
+	cdp_network_idle: bool = False
+	page_load_profiles_path: str | None = None
+	resource_blocking: ResourceBlockingConfig | None = None
+	asset_cache: AssetCache | None = None
 	wait_between_actions: float = 0.5
 
 	disable_security: bool = True
@@ -145,6 +180,9 @@ class BrowserContextConfig(BaseModel):
 	)
 
 	highlight_elements: bool = True
+	screenshot_format: Literal['png', 'jpeg', 'webp'] = 'png'
+	screenshot_quality: int = 80
+	screenshot_max_width: int | None = None
 	viewport_expansion: int = 500
 	allowed_domains: list[str] | None = None
 	include_dynamic_attributes: bool = True
@@ -234,6 +272,15 @@ class BrowserContext:
 		# Initialize these as None - they'll be set up when needed
 		self.session: BrowserSession | None = None
 
+		self.page_load_profiles = (
+			PageLoadProfiles(self.config.page_load_profiles_path) if self.config.page_load_profiles_path else None
+		)
+		self._profiled_time_origin: float | None = None
+		self.resource_blocker = ResourceBlocker(self.config.resource_blocking) if self.config.resource_blocking else None
+		# Tab titles, dropped when their page navigates or loads
+		self._tab_titles: weakref.WeakKeyDictionary[Page, str] = weakref.WeakKeyDictionary()
+		self._tab_title_listeners: weakref.WeakSet[Page] = weakref.WeakSet()
+
 	async def __aenter__(self):
 		"""Async context manager entry"""
 		await self._initialize_session()
@@ -248,6 +295,9 @@ class BrowserContext:
 		"""Close the browser instance"""
 
 		try:
+			if self.page_load_profiles:
+				self.page_load_profiles.save()
+
 			if self.session is None:
 				return
 
@@ -456,176 +506,41 @@ class BrowserContext:
             """
 		)
 
-		return context
-
-	async def _wait_for_stable_network(self):
-		page = await self.get_current_page()
-
-		pending_requests = set()
-		last_activity = asyncio.get_event_loop().time()
-
-		# Define relevant resource types and content types
-		RELEVANT_RESOURCE_TYPES = {
-			'document',
-			'stylesheet',
-			'image',
-			'font',
-			'script',
-			'iframe',
-		}
-
-		RELEVANT_CONTENT_TYPES = {
-			'text/html',
-			'text/css',
-			'application/javascript',
-			'image/',
-			'font/',
-			'application/json',
-		}
-
-		# Additional patterns to filter out
-		IGNORED_URL_PATTERNS = {
-			# Analytics and tracking
-			'analytics',
-			'tracking',
-			'telemetry',
-			'beacon',
-			'metrics',
-			# Ad-related
-			'doubleclick',
-			'adsystem',
-			'adserver',
-			'advertising',
-			# Social media widgets
-			'facebook.com/plugins',
-			'platform.twitter',
-			'linkedin.com/embed',
-			# Live chat and support
-			'livechat',
-			'zendesk',
-			'intercom',
-			'crisp.chat',
-			'hotjar',
-			# Push notifications
-			'push-notifications',
-			'onesignal',
-			'pushwoosh',
-			# Background sync/heartbeat
-			'heartbeat',
-			'ping',
-			'alive',
-			# WebRTC and streaming
-			'webrtc',
-			'rtmp://',
-			'wss://',
-			# Common CDNs for dynamic content
-			'cloudfront.net',
-			'fastly.net',
-		}
-
-		async def on_request(request):
-			# Filter by resource type
-			if request.resource_type not in RELEVANT_RESOURCE_TYPES:
-				return
-
-			# Filter out streaming, websocket, and other real-time requests
-			if request.resource_type in {
-				'websocket',
-				'media',
-				'eventsource',
-				'manifest',
-				'other',
-			}:
-				return
-
-			# Filter out by URL patterns
-			url = request.url.lower()
-			if any(pattern in url for pattern in IGNORED_URL_PATTERNS):
-				return
-
-			# Filter out data URLs and blob URLs
-			if url.startswith(('data:', 'blob:')):
-				return
-
-			# Filter out requests with certain headers
-			headers = request.headers
-			if headers.get('purpose') == 'prefetch' or headers.get('sec-fetch-dest') in [
-				'video',
-				'audio',
-			]:
-				return
-
-			nonlocal last_activity
-			pending_requests.add(request)
-			last_activity = asyncio.get_event_loop().time()
-			# logger.debug(f'Request started: {request.url} ({request.resource_type})')
-
-		async def on_response(response):
-			request = response.request
-			if request not in pending_requests:
-				return
-
-			# Filter by content type if available
-			content_type = response.headers.get('content-type', '').lower()
-
-			# Skip if content type indicates streaming or real-time data
-			if any(
-				t in content_type
-				for t in [
-					'streaming',
-					'video',
-					'audio',
-					'webm',
-					'mp4',
-					'event-stream',
-					'websocket',
-					'protobuf',
-				]
-			):
-				pending_requests.remove(request)
-				return
-
-			# Only process relevant content types
-			if not any(ct in content_type for ct in RELEVANT_CONTENT_TYPES):
-				pending_requests.remove(request)
-				return
-
-			# Skip if response is too large (likely not essential for page load)
-			content_length = response.headers.get('content-length')
-			if content_length and int(content_length) > 5 * 1024 * 1024:  # 5MB
-				pending_requests.remove(request)
-				return
+		if self.page_load_profiles:
+			await context.add_init_script(INTERACTIVE_CHANGE_TRACKER_JS)
 
-			nonlocal last_activity
-			pending_requests.remove(request)
-			last_activity = asyncio.get_event_loop().time()
-			# logger.debug(f'Request resolved: {request.url} ({content_type})')
+		# Routes registered last run first: the resource blocker falls back to the asset cache for allowed requests
+		if self.config.asset_cache:
+			await self.config.asset_cache.install(context)
+		if self.resource_blocker:
+			await self.resource_blocker.install(context)
 
-		# Attach event listeners
-		page.on('request', on_request)
-		page.on('response', on_response)
+		return context
 
-		try:
-			# Wait for idle time
-			start_time = asyncio.get_event_loop().time()
-			while True:
-				await asyncio.sleep(0.1)
-				now = asyncio.get_event_loop().time()
-				if len(pending_requests) == 0 and (now - last_activity) >= self.config.wait_for_network_idle_page_load_time:
-					break
-				if now - start_time > self.config.maximum_wait_page_load_time:
-					logger.debug(
-						f'Network timeout after {self.config.maximum_wait_page_load_time}s with {len(pending_requests)} '
-						f'pending requests: {[r.url for r in pending_requests]}'
-					)
-					break
+	async def _wait_for_stable_network(self, waits: PageLoadWaits | None = None) -> bool:
+		"""Wait until the network is idle, returns False if it did not get idle within the maximum wait"""
+		waits = waits or self._default_page_load_waits()
+		page = await self.get_current_page()
 
-		finally:
-			# Clean up event listeners
-			page.remove_listener('request', on_request)
-			page.remove_listener('response', on_response)
+		start_time = time.time()
+		async with NetworkIdleWatcher(page, use_cdp=self.config.cdp_network_idle) as watcher:
+			idle = await watcher.wait(idle_time=waits.network_idle, timeout=waits.maximum)
 
-		logger.debug(f'⚖️  Network stabilized for {self.config.wait_for_network_idle_page_load_time} seconds')
+		if not idle:
+			logger.debug(
+				f'Network timeout after {waits.maximum:.2f}s with {len(watcher.pending)} '
+				f'pending requests: {list(watcher.pending.values())}'
+			)
+			return False
+		logger.debug(f'⚖️  Network stabilized for {waits.network_idle} seconds (waited {time.time() - start_time:.3f}s)')
+		return True
+
+	def _default_page_load_waits(self) -> PageLoadWaits:
+		return PageLoadWaits(
+			minimum=self.config.minimum_wait_page_load_time,
+			network_idle=self.config.wait_for_network_idle_page_load_time,
+			maximum=self.config.maximum_wait_page_load_time,
+		)
 
 	async def _wait_for_page_and_frames_load(self, timeout_overwrite: float | None = None):
 		"""
@@ -635,10 +550,16 @@ class BrowserContext:
 		"""
 		# Start timing
 		start_time = time.time()
+		waits = self._default_page_load_waits()
+		network_idle_at = None
 
 		# Wait for page load
 		try:
-			await self._wait_for_stable_network()
+			page = await self.get_current_page()
+			if self.page_load_profiles:
+				waits = await self._learned_page_load_waits(page, waits)
+			await self._wait_for_stable_network(waits)
+			network_idle_at = time.time()
 
 			# Check if the loaded URL is allowed
 			page = await self.get_current_page()
@@ -651,7 +572,7 @@ class BrowserContext:
 
 		# Calculate remaining time to meet minimum WAIT_TIME
 		elapsed = time.time() - start_time
-		remaining = max((timeout_overwrite or self.config.minimum_wait_page_load_time) - elapsed, 0)
+		remaining = max((timeout_overwrite or waits.minimum) - elapsed, 0)
 
 		logger.debug(f'--Page loaded in {elapsed:.2f} seconds, waiting for additional {remaining:.2f} seconds')
 
@@ -659,6 +580,57 @@ class BrowserContext:
 		if remaining > 0:
 			await asyncio.sleep(remaining)
 
+		if self.page_load_profiles and network_idle_at:
+			await self._record_page_load(page, network_idle_at)
+
+		if self.resource_blocker and network_idle_at:
+			stats = self.resource_blocker.stats(page)
+			if stats.blocked_requests:
+				logger.debug(
+					f'🚫  Blocked {stats.blocked_requests} requests on {stats.url} '
+					f'(~{stats.estimated_bytes_saved / 1024:.0f} KB saved): {stats.blocked_by_type}'
+				)
+
+	async def _learned_page_load_waits(self, page: Page, defaults: PageLoadWaits) -> PageLoadWaits:
+		"""
+		Learned waits for a newly loaded document, the defaults if the current document was profiled already.
+		Learned minimums count from navigation start, so the time the document has been loading is subtracted.
+		"""
+		try:
+			timings = await page.evaluate(READ_TIMINGS_JS)
+		except Exception as e:
+			logger.debug(f'Failed to read page load timings: {e}')
+			return defaults
+
+		# Actions that did not navigate leave the same document, it is loaded already
+		if timings['timeOrigin'] == self._profiled_time_origin:
+			return defaults
+		waits = self.page_load_profiles.waits(page.url, defaults)
+		return waits.model_copy(update={'minimum': max(waits.minimum - timings['now'] / 1000, 0)})
+
+	async def _record_page_load(self, page: Page, network_idle_at: float) -> None:
+		"""Add the readiness timings of a newly loaded document to its domain's profile"""
+		try:
+			timings = await page.evaluate(READ_TIMINGS_JS)
+		except Exception as e:
+			logger.debug(f'Failed to read page load timings: {e}')
+			return
+
+		# Actions that did not navigate leave the same document, it was profiled already
+		if timings['timeOrigin'] == self._profiled_time_origin:
+			return
+		self._profiled_time_origin = timings['timeOrigin']
+
+		dom_content_loaded = timings['domContentLoaded'] / 1000
+		self.page_load_profiles.record(
+			page.url,
+			PageLoadTimings(
+				dom_content_loaded=dom_content_loaded,
+				network_idle=timings['now'] / 1000 - (time.time() - network_idle_at),
+				dom_stable=max(dom_content_loaded, (timings['interactiveChangedAt'] or 0) / 1000),
+			),
+		)
+
 	def _is_url_allowed(self, url: str) -> bool:
 		"""Check if a URL is allowed based on the whitelist configuration."""
 		if not self.config.allowed_domains:
@@ -826,11 +798,15 @@ class BrowserContext:
 		return structure
 
 	@time_execution_sync('--get_state')  # This decorator might need to be updated to handle async
-	async def get_state(self) -> BrowserState:
-		"""Get the current state of the browser"""
+	async def get_state(self, include_screenshot: bool = True) -> BrowserState:
+		"""
+		Get the current state of the browser.
+
+		Pass include_screenshot=False when nothing will look at the screenshot, e.g. an agent without vision.
+		"""
 		await self._wait_for_page_and_frames_load()
 		session = await self.get_session()
-		session.cached_state = await self._update_state()
+		session.cached_state = await self._update_state(include_screenshot=include_screenshot)
 
 		# Save cookies if a file is specified
 		if self.config.cookies_file:
@@ -838,36 +814,63 @@ class BrowserContext:
 
 		return session.cached_state
 
-	async def _update_state(self, focus_element: int = -1) -> BrowserState:
-		"""Update and return state."""
+	async def _update_state(self, focus_element: int = -1, include_screenshot: bool = True) -> BrowserState:
+		"""
+		Update and return state.
+
+		The in-page work (health check, highlight cleanup, DOM tree, title, scroll info) is one evaluate call.
+		Tab titles are collected while it runs, the screenshot is taken once the new highlights are drawn.
+		"""
 		session = await self.get_session()
+		timings: dict[str, float] = {}
+		started_at = time.perf_counter()
 
-		# Check if current page is still valid, if not switch to another available page
-		try:
-			page = await self.get_current_page()
-			# Test if page is still accessible
-			await page.evaluate('1')
-		except Exception as e:
-			logger.debug(f'👋  Current page is no longer accessible: {str(e)}')
-			# Get all available pages
-			pages = session.context.pages
-			if pages:
-				self.state.target_id = None
-				page = await self._get_current_page(session)
-				logger.debug(f'🔄  Switched to page: {await page.title()}')
-			else:
-				raise BrowserError('Browser closed: no valid pages available')
+		async def timed(phase: str, coroutine):
+			phase_started_at = time.perf_counter()
+			try:
+				return await coroutine
+			finally:
+				timings[phase] = time.perf_counter() - phase_started_at
 
-		try:
-			await self.remove_highlights()
+		def capture_page_state(page: Page):
 			dom_service = DomService(page)
-			content = await dom_service.get_clickable_elements(
-				focus_element=focus_element,
-				viewport_expansion=self.config.viewport_expansion,
-				highlight_elements=self.config.highlight_elements,
+			return timed(
+				'page_state',
+				dom_service.get_page_state(
+					focus_element=focus_element,
+					viewport_expansion=self.config.viewport_expansion,
+					highlight_elements=self.config.highlight_elements,
+				),
 			)
 
-			tabs_info = await self.get_tabs_info()
+		async def collect_tabs_info():
+			# Calls get_tabs_info() only once the task runs, a task cancelled before that leaves no unawaited coroutine
+			return await timed('tabs', self.get_tabs_info())
+
+		page = await self.get_current_page()
+		tabs_task = asyncio.create_task(collect_tabs_info())
+
+		try:
+			try:
+				content = await capture_page_state(page)
+			except Exception as e:
+				# Check if current page is still valid, if not switch to another available page.
+				# Extraction errors on a live page (buildDomTree.js errors, a navigation destroying
+				# the execution context) keep the last known state instead.
+				try:
+					await page.evaluate('1')
+				except Exception:
+					logger.debug(f'👋  Current page is no longer accessible: {str(e)}')
+				else:
+					raise
+				# Get all available pages
+				pages = session.context.pages
+				if not pages:
+					raise BrowserError('Browser closed: no valid pages available')
+				self.state.target_id = None
+				page = await self._get_current_page(session)
+				logger.debug(f'🔄  Switched to page: {page.url}')
+				content = await capture_page_state(page)
 
 			# Get all cross-origin iframes within the page and open them in new tabs
 			# mark the titles of the new tabs so the LLM knows to check them for additional content
@@ -889,42 +892,66 @@ class BrowserContext:
 			# 		)
 			# 	)
 
-			screenshot_b64 = await self.take_screenshot()
-			pixels_above, pixels_below = await self.get_scroll_info(page)
+			screenshot_b64, tabs_info = await asyncio.gather(
+				timed('screenshot', self.take_screenshot()) if include_screenshot else asyncio.sleep(0),
+				tabs_task,
+			)
+			# The evaluate read the current tab's title after any in-page title change
+			if page in session.context.pages:
+				page_id = session.context.pages.index(page)
+				if page_id < len(tabs_info) and tabs_info[page_id].url == page.url:
+					tabs_info[page_id].title = content.title
+					self._cache_tab_title(page, content.title)
+			timings['total'] = time.perf_counter() - started_at
 
 			self.current_state = BrowserState(
 				element_tree=content.element_tree,
 				selector_map=content.selector_map,
 				url=page.url,
-				title=await page.title(),
+				title=content.title,
 				tabs=tabs_info,
 				screenshot=screenshot_b64,
-				pixels_above=pixels_above,
-				pixels_below=pixels_below,
+				pixels_above=content.pixels_above,
+				pixels_below=content.pixels_below,
+				timings=timings,
 			)
 
 			return self.current_state
+		except BrowserError:
+			raise
 		except Exception as e:
 			logger.error(f'❌  Failed to update state: {str(e)}')
 			# Return last known good state if available
 			if hasattr(self, 'current_state'):
 				return self.current_state
 			raise
+		finally:
+			if not tabs_task.done():
+				tabs_task.cancel()
 
 	# region - Browser Actions
 	@time_execution_async('--take_screenshot')
 	async def take_screenshot(self, full_page: bool = False) -> str:
 		"""
-		Returns a base64 encoded screenshot of the current page.
+		Returns a base64 encoded screenshot of the current page, in the configured format and size.
 		"""
 		page = await self.get_current_page()
 
 		await page.bring_to_front()
 		await page.wait_for_load_state()
 
+		screenshot_format = self.config.screenshot_format
+		if screenshot_format == 'webp' or self.config.screenshot_max_width:
+			screenshot_b64 = await self._take_cdp_screenshot(page, full_page)
+			if screenshot_b64 is not None:
+				return screenshot_b64
+
+		# Playwright only encodes png and jpeg
 		screenshot = await page.screenshot(
 			full_page=full_page,
 			animations='disabled',
+			type='png' if screenshot_format == 'png' else 'jpeg',
+			quality=None if screenshot_format == 'png' else self.config.screenshot_quality,
 		)
 
 		screenshot_b64 = base64.b64encode(screenshot).decode('utf-8')
@@ -933,6 +960,57 @@ class BrowserContext:
 
 		return screenshot_b64
 
+	async def _take_cdp_screenshot(self, page: Page, full_page: bool) -> str | None:
+		"""
+		Capture with Page.captureScreenshot, which encodes webp and downscales in the browser.
+		Returns None if CDP is not available (non-Chromium browsers).
+		"""
+		try:
+			cdp_session = await page.context.new_cdp_session(page)  # type: ignore
+		except Exception as e:
+			logger.debug(f'CDP screenshots not available, falling back to Playwright: {e}')
+			return None
+
+		try:
+			metrics = await page.evaluate(
+				"""(fullPage) => {
+					const root = document.documentElement;
+					return {
+						x: fullPage ? 0 : window.scrollX,
+						y: fullPage ? 0 : window.scrollY,
+						width: fullPage ? Math.max(root.scrollWidth, window.innerWidth) : window.innerWidth,
+						height: fullPage ? Math.max(root.scrollHeight, window.innerHeight) : window.innerHeight,
+						devicePixelRatio: window.devicePixelRatio || 1,
+					};
+				}""",
+				full_page,
+			)
+			scale = 1.0
+			pixel_width = metrics['width'] * metrics['devicePixelRatio']
+			if self.config.screenshot_max_width and pixel_width > self.config.screenshot_max_width:
+				scale = self.config.screenshot_max_width / pixel_width
+
+			params = {
+				'format': self.config.screenshot_format,
+				'clip': {
+					'x': metrics['x'],
+					'y': metrics['y'],
+					'width': metrics['width'],
+					'height': metrics['height'],
+					'scale': scale,
+				},
+				'captureBeyondViewport': full_page,
+			}
+			if self.config.screenshot_format != 'png':
+				params['quality'] = self.config.screenshot_quality
+			result = await cdp_session.send('Page.captureScreenshot', params)
+			return result['data']
+		finally:
+			try:
+				await cdp_session.detach()
+			except Exception:
+				pass
+
 	@time_execution_async('--remove_highlights')
 	async def remove_highlights(self):
 		"""
@@ -941,25 +1019,7 @@ class BrowserContext:
 		"""
 		try:
 			page = await self.get_current_page()
-			await page.evaluate(
-				"""
-                try {
-                    // Remove the highlight container and all its contents
-                    const container = document.getElementById('playwright-highlight-container');
-                    if (container) {
-                        container.remove();
-                    }
-
-                    // Remove highlight attributes from elements
-                    const highlightedElements = document.querySelectorAll('[browser-user-highlight-id^="playwright-highlight-"]');
-                    highlightedElements.forEach(el => {
-                        el.removeAttribute('browser-user-highlight-id');
-                    });
-                } catch (e) {
-                    console.error('Failed to remove highlights:', e);
-                }
-                """
-			)
+			await page.evaluate(REMOVE_HIGHLIGHTS_JS)
 		except Exception as e:
 			logger.debug(f'⚠  Failed to remove highlights (this is usually ok): {str(e)}')
 			# Don't raise the error since this is not critical functionality
@@ -1150,6 +1210,12 @@ class BrowserContext:
 
 		# Process all iframe parents in sequence
 		iframes = [item for item in parents if item.tag_name == 'iframe']
+		if not iframes:
+			element_handle = await self._get_registered_element(current_frame, element)
+			if element_handle:
+				await element_handle.scroll_into_view_if_needed()
+				return element_handle
+
 		for parent in iframes:
 			css_selector = self._enhanced_css_selector_for_element(
 				parent,
@@ -1176,6 +1242,27 @@ class BrowserContext:
 			logger.error(f'❌  Failed to locate element: {str(e)}')
 			return None
 
+	async def _get_registered_element(self, page: Page, element: DOMElementNode) -> Optional[ElementHandle]:
+		"""
+		The element with this highlight index from the registry buildDomTree.js keeps in the page, in one evaluate.
+		None if the registry is gone or stale, then the caller falls back to selectors.
+		"""
+		if element.highlight_index is None:
+			return None
+		try:
+			handle = await page.evaluate_handle(
+				RESOLVE_HIGHLIGHTED_ELEMENT_JS, {'index': element.highlight_index, 'xpath': element.xpath}
+			)
+		except Exception as e:
+			logger.debug(f'Failed to resolve element {element.highlight_index} from the page registry: {type(e).__name__}: {e}')
+			return None
+
+		element_handle = handle.as_element()
+		if element_handle is None:
+			logger.debug(f'Element {element.highlight_index} is not in the page registry anymore, locating it by selector')
+			await handle.dispose()
+		return element_handle
+
 	@time_execution_async('--get_locate_element_by_xpath')
 	async def get_locate_element_by_xpath(self, xpath: str) -> Optional[ElementHandle]:
 		"""
@@ -1353,15 +1440,47 @@ class BrowserContext:
 			raise Exception(f'Failed to click element: {repr(element_node)}. Error: {str(e)}')
 
 	@time_execution_async('--get_tabs_info')
-	async def get_tabs_info(self) -> list[TabInfo]:
-		"""Get information about all tabs"""
+	async def get_tabs_info(self, timeout: float = 1) -> list[TabInfo]:
+		"""
+		Get information about all tabs.
+
+		Titles are cached until the tab navigates. Missing ones come from a single Target.getTargets call for CDP
+		browsers, otherwise from concurrent page.title() calls that share one timeout.
+		"""
 		session = await self.get_session()
+		pages = session.context.pages
+
+		titles = {page: self._tab_titles[page] for page in pages if page in self._tab_titles}
+		missing = [page for page in pages if page not in titles]
+
+		if missing and self.browser.config.cdp_url:
+			target_titles: dict[str, set[str]] = {}
+			for target in await self._get_cdp_targets():
+				if target.get('type') == 'page':
+					# Targets without a document title report their URL as title
+					title = '' if target['title'] == target['url'] else target['title']
+					target_titles.setdefault(target['url'], set()).add(title)
+			for page in missing:
+				# Tabs with the same URL but different titles can not be told apart
+				if len(target_titles.get(page.url, ())) == 1:
+					titles[page] = next(iter(target_titles[page.url]))
+			missing = [page for page in missing if page not in titles]
+
+		if missing:
+			title_tasks = {asyncio.create_task(page.title()): page for page in missing}
+			done, pending = await asyncio.wait(title_tasks, timeout=timeout)
+			for task in pending:
+				task.cancel()
+			for task in done:
+				if task.exception() is None:
+					titles[title_tasks[task]] = task.result()
 
 		tabs_info = []
-		for page_id, page in enumerate(session.context.pages):
-			try:
-				tab_info = TabInfo(page_id=page_id, url=page.url, title=await asyncio.wait_for(page.title(), timeout=1))
-			except asyncio.TimeoutError:
+		for page_id, page in enumerate(pages):
+			if page in titles:
+				self._cache_tab_title(page, titles[page])
+				tab_info = TabInfo(page_id=page_id, url=page.url, title=titles[page])
+			else:
 				# page.title() can hang forever on tabs that are crashed/dissapeared/about:blank
 				# we dont want to try automating those tabs because they will hang the whole script
 				logger.debug('⚠  Failed to get tab info for tab #%s: %s (ignoring)', page_id, page.url)
@@ -1370,6 +1489,20 @@ class BrowserContext:
 
 		return tabs_info
 
+	def _cache_tab_title(self, page: Page, title: str) -> None:
+		if page not in self._tab_title_listeners:
+			self._tab_title_listeners.add(page)
+			titles = self._tab_titles
+
+			def invalidate(*args) -> None:
+				titles.pop(page, None)
+
+			# The title is usually set once the document is parsed, SPAs may change it later on load
+			page.on('framenavigated', lambda frame: frame.parent_frame is None and invalidate())
+			page.on('domcontentloaded', invalidate)
+			page.on('load', invalidate)
+		self._tab_titles[page] = title
+
 	@time_execution_async('--switch_to_tab')
 	async def switch_to_tab(self, page_id: int) -> None:
 		"""Switch to a specific tab by its page_id"""
@@ -0,0 +1,370 @@
+"""
+Long-running browser daemon, so short-lived processes skip the Chromium cold start.
+
+	python -m browser_use.browser.daemon start [--idle-timeout 600] [--headful]
+	python -m browser_use.browser.daemon status
+	python -m browser_use.browser.daemon stop
+
+The daemon keeps one Chromium running with a CDP endpoint and listens on a Unix control socket.
+A Browser with use_daemon=True finds the socket, attaches as a client and connects over CDP instead
+of launching its own browser, as long as the daemon was launched with the same settings
+(headless, disable_security, deterministic_rendering, extra_browser_args) and no proxy is set. The control connection stays open while the client
+is attached, so a crashed client is detached automatically.
+
+Clients are isolated: every context a client creates over CDP is its own incognito-like browser
+context, which Chromium disposes when the client disconnects. When the last client detaches the
+daemon also disposes leftover contexts, clears the default context and goes back to about:blank.
+After idle_timeout seconds without clients the daemon shuts down.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import psutil
+from playwright.async_api import async_playwright
+from pydantic import BaseModel, ConfigDict, Field
+
+from browser_use.browser.chrome import (
+	CHROME_ARGS,
+	CHROME_DETERMINISTIC_RENDERING_ARGS,
+	CHROME_DISABLE_SECURITY_ARGS,
+	CHROME_DOCKER_ARGS,
+	CHROME_HEADLESS_ARGS,
+)
+
+logger = logging.getLogger(__name__)
+
+IN_DOCKER = os.environ.get('IN_DOCKER', 'false').lower()[0] in 'ty1'
+
+
+def daemon_socket_path() -> Path:
+	"""Control socket of the daemon, BROWSER_USE_DAEMON_SOCKET overrides the default location"""
+	return Path(os.environ.get('BROWSER_USE_DAEMON_SOCKET') or Path.home() / '.cache' / 'browser_use' / 'browser-daemon.sock')
+
+
+class BrowserDaemonConfig(BaseModel):
+	r"""
+	Configuration for the BrowserDaemon.
+
+	Default values:
+		socket_path: None
+			Control socket, defaults to daemon_socket_path()
+
+		idle_timeout: 600.0
+			Seconds without attached clients before the daemon shuts down, 0 keeps it running
+
+		headless: True
+			Whether to run Chromium in headless mode
+
+		disable_security: True
+			Disable browser security features, as BrowserConfig does by default
+
+		deterministic_rendering: False
+			Enable deterministic rendering flags
+
+		browser_binary_path: None
+			Chromium executable, defaults to Playwright's Chromium
+
+		extra_browser_args: []
+			Extra arguments to pass to Chromium
+
+		startup_timeout: 30.0
+			Seconds to wait for Chromium to open its CDP endpoint
+	"""
+
+	model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore')
+
+	socket_path: Path | None = None
+	idle_timeout: float = 600.0
+	headless: bool = True
+	disable_security: bool = True
+	deterministic_rendering: bool = False
+	browser_binary_path: str | None = None
+	extra_browser_args: list[str] = Field(default_factory=list)
+	startup_timeout: float = 30.0
+
+
+class BrowserDaemon:
+	"""Keeps a warm Chromium and hands its CDP endpoint to clients over the control socket"""
+
+	def __init__(self, config: BrowserDaemonConfig = BrowserDaemonConfig()):
+		self.config = config
+		self.socket_path = config.socket_path or daemon_socket_path()
+		self.cdp_url: str | None = None
+		self._clients: set[int] = set()
+		self._client_ids = itertools.count(1)
+		self._last_active = time.monotonic()
+		self._stopping = asyncio.Event()
+		self._server: asyncio.AbstractServer | None = None
+		self._process: subprocess.Popen | None = None
+		self._profile_dir: str | None = None
+		self._playwright = None
+		self._browser = None
+
+	async def start(self) -> None:
+		"""Launch Chromium and open the control socket"""
+		if await BrowserDaemonClient.connect(self.socket_path):
+			raise RuntimeError(f'A browser daemon is already listening on {self.socket_path}')
+		self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+		self.socket_path.unlink(missing_ok=True)
+
+		await self._launch_browser()
+		self._server = await asyncio.start_unix_server(self._handle_client, path=str(self.socket_path))
+		self._last_active = time.monotonic()
+		logger.info(f'😈  Browser daemon listening on {self.socket_path}, CDP endpoint {self.cdp_url}')
+
+	async def serve(self) -> None:
+		"""Run until stopped or idle for too long, then shut down"""
+		await self.start()
+		try:
+			check_interval = min(1.0, self.config.idle_timeout) if self.config.idle_timeout > 0 else 1.0
+			while not self._stopping.is_set():
+				try:
+					await asyncio.wait_for(self._stopping.wait(), timeout=check_interval)
+				except asyncio.TimeoutError:
+					pass
+				if self._idle_expired():
+					logger.info(f'😴  Browser daemon idle for {self.config.idle_timeout:.0f}s, shutting down')
+					break
+		finally:
+			await self.close()
+
+	def stop(self) -> None:
+		self._stopping.set()
+
+	def _idle_expired(self) -> bool:
+		if self.config.idle_timeout <= 0 or self._clients:
+			return False
+		return time.monotonic() - self._last_active > self.config.idle_timeout
+
+	def status(self) -> dict:
+		return {
+			'pid': os.getpid(),
+			'cdp_url': self.cdp_url,
+			'clients': len(self._clients),
+			'idle_for': 0.0 if self._clients else time.monotonic() - self._last_active,
+			'launch_settings': self.launch_settings(),
+		}
+
+	def launch_settings(self) -> dict:
+		"""The settings Chromium was launched with, a Browser only attaches when its own config matches them"""
+		return {
+			'headless': self.config.headless,
+			'disable_security': self.config.disable_security,
+			'deterministic_rendering': self.config.deterministic_rendering,
+			'extra_browser_args': sorted(set(self.config.extra_browser_args)),
+		}
+
+	async def _launch_browser(self) -> None:
+		executable = self.config.browser_binary_path
+		if executable is None:
+			playwright = await async_playwright().start()
+			executable = playwright.chromium.executable_path
+			await playwright.stop()
+
+		self._profile_dir = tempfile.mkdtemp(prefix='browser-use-daemon-')
+		args = [
+			executable,
+			*{
+				*(arg for arg in CHROME_ARGS if not arg.startswith('--remote-debugging-')),
+				*(CHROME_DOCKER_ARGS if IN_DOCKER else []),
+				*(CHROME_HEADLESS_ARGS if self.config.headless else []),
+				*(CHROME_DISABLE_SECURITY_ARGS if self.config.disable_security else []),
+				*(CHROME_DETERMINISTIC_RENDERING_ARGS if self.config.deterministic_rendering else []),
+				*self.config.extra_browser_args,
+			},
+			'--remote-debugging-port=0',
+			f'--user-data-dir={self._profile_dir}',
+			'about:blank',
+		]
+		self._process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+		# Chromium writes the port it picked to DevToolsActivePort in the profile directory
+		port_file = Path(self._profile_dir) / 'DevToolsActivePort'
+		deadline = time.monotonic() + self.config.startup_timeout
+		while not port_file.exists() or not port_file.read_text().strip():
+			if self._process.poll() is not None or time.monotonic() > deadline:
+				await self.close()
+				raise RuntimeError(f'Chromium did not open a CDP endpoint ({executable})')
+			await asyncio.sleep(0.05)
+		self.cdp_url = f'http://127.0.0.1:{port_file.read_text().split()[0]}'
+
+		self._playwright = await async_playwright().start()
+		self._browser = await self._playwright.chromium.connect_over_cdp(self.cdp_url)
+
+	async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		client_id = next(self._client_ids)
+		try:
+			while line := await reader.readline():
+				try:
+					command = json.loads(line).get('command')
+				except (json.JSONDecodeError, AttributeError):
+					command = None
+
+				if command == 'attach':
+					self._clients.add(client_id)
+					response = {'client_id': client_id, 'cdp_url': self.cdp_url}
+				elif command == 'status':
+					response = self.status()
+				elif command == 'shutdown':
+					response = {'ok': True}
+					self.stop()
+				else:
+					response = {'error': f'Unknown command: {command}'}
+				writer.write(json.dumps(response).encode() + b'\n')
+				await writer.drain()
+		except ConnectionError:
+			pass
+		finally:
+			writer.close()
+			if client_id in self._clients:
+				self._clients.discard(client_id)
+				self._last_active = time.monotonic()
+				if not self._clients:
+					await self._reset_browser()
+
+	async def _reset_browser(self) -> None:
+		"""Remove everything clients left behind, so the next client starts from a clean browser"""
+		if self._browser is None:
+			return
+		try:
+			cdp_session = await self._browser.new_browser_cdp_session()
+			try:
+				contexts = await cdp_session.send('Target.getBrowserContexts')
+				for browser_context_id in contexts.get('browserContextIds', []):
+					await cdp_session.send('Target.disposeBrowserContext', {'browserContextId': browser_context_id})
+			finally:
+				await cdp_session.detach()
+
+			default_context = self._browser.contexts[0]
+			await default_context.clear_cookies()
+			keep, *extra = default_context.pages or [await default_context.new_page()]
+			for page in extra:
+				await page.close()
+			if keep.url != 'about:blank':
+				await keep.goto('about:blank')
+		except Exception as e:
+			logger.debug(f'Failed to reset daemon browser: {e}')
+
+	async def close(self) -> None:
+		if self._server:
+			self._server.close()
+			self._server = None
+			self.socket_path.unlink(missing_ok=True)
+		if self._playwright:
+			try:
+				if self._browser:
+					await self._browser.close()
+				await self._playwright.stop()
+			except Exception as e:
+				logger.debug(f'Failed to disconnect from daemon browser: {e}')
+			self._browser = self._playwright = None
+		if self._process:
+			try:
+				process = psutil.Process(self._process.pid)
+				for child in process.children(recursive=True):
+					child.kill()
+				process.kill()
+			except psutil.Error:
+				pass
+			self._process.wait()
+			self._process = None
+		if self._profile_dir:
+			shutil.rmtree(self._profile_dir, ignore_errors=True)
+			self._profile_dir = None
+
+
+class BrowserDaemonClient:
+	"""Control connection to a running BrowserDaemon"""
+
+	def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+		self._reader = reader
+		self._writer = writer
+
+	@classmethod
+	async def connect(cls, socket_path: Path | None = None, timeout: float = 0.5) -> 'BrowserDaemonClient | None':
+		"""Connect to the daemon, or return None if none is running"""
+		path = socket_path or daemon_socket_path()
+		if os.name != 'posix' or not path.exists():
+			return None
+		try:
+			reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(str(path)), timeout=timeout)
+		except (OSError, asyncio.TimeoutError):
+			return None
+		return cls(reader, writer)
+
+	async def request(self, command: str, timeout: float = 5.0) -> dict:
+		self._writer.write(json.dumps({'command': command}).encode() + b'\n')
+		await self._writer.drain()
+		line = await asyncio.wait_for(self._reader.readline(), timeout=timeout)
+		if not line:
+			raise ConnectionError('Browser daemon closed the control connection')
+		return json.loads(line)
+
+	async def attach(self) -> str:
+		"""Register as a client and return the daemon's CDP endpoint. Keep the connection open while using it."""
+		return (await self.request('attach'))['cdp_url']
+
+	async def status(self) -> dict:
+		return await self.request('status')
+
+	async def shutdown(self) -> None:
+		await self.request('shutdown')
+
+	async def close(self) -> None:
+		self._writer.close()
+		try:
+			await self._writer.wait_closed()
+		except Exception:
+			pass
+
+
+async def _main(argv: list[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(prog='python -m browser_use.browser.daemon', description='Persistent browser daemon')
+	parser.add_argument('command', choices=['start', 'status', 'stop'])
+	parser.add_argument('--socket', type=Path, default=None, help='Control socket path')
+	parser.add_argument('--idle-timeout', type=float, default=600.0, help='Shut down after this many idle seconds (0: never)')
+	parser.add_argument('--headful', action='store_true', help='Show the browser window')
+	parser.add_argument('--enable-security', action='store_true', help='Keep browser security features enabled')
+	parser.add_argument('--deterministic-rendering', action='store_true', help='Enable deterministic rendering flags')
+	parser.add_argument('--browser-binary-path', default=None, help='Chromium executable to run')
+	args = parser.parse_args(argv)
+
+	if args.command == 'start':
+		config = BrowserDaemonConfig(
+			socket_path=args.socket,
+			idle_timeout=args.idle_timeout,
+			headless=not args.headful,
+			disable_security=not args.enable_security,
+			deterministic_rendering=args.deterministic_rendering,
+			browser_binary_path=args.browser_binary_path,
+		)
+		await BrowserDaemon(config).serve()
+		return 0
+
+	client = await BrowserDaemonClient.connect(args.socket)
+	if client is None:
+		print('No browser daemon is running')
+		return 1
+	try:
+		if args.command == 'status':
+			print(json.dumps(await client.status(), indent=2))
+		else:
+			await client.shutdown()
+			print('Browser daemon is shutting down')
+	finally:
+		await client.close()
+	return 0
+
+
+if __name__ == '__main__':
+	raise SystemExit(asyncio.run(_main()))
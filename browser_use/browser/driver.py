@@ -0,0 +1,122 @@
+"""
+Process-wide shared Playwright driver.
+
+Every `async_playwright().start()` spawns its own Node driver process. Browsers created with
+`BrowserConfig(shared_driver=True)` instead take a reference on one driver per event loop, launch
+their browser or connect to their CDP/WSS endpoint through it, and release the reference on close.
+The driver is stopped when the last reference is released.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+
+import psutil
+from playwright.async_api import Playwright, async_playwright
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class DriverOverhead(BaseModel):
+	"""Cost of starting Playwright drivers, times in seconds and memory in MB"""
+
+	browsers: int
+	separate_startup_time: float
+	shared_startup_time: float
+	separate_memory_mb: float
+	shared_memory_mb: float
+
+
+class PlaywrightDriver:
+	"""Reference-counted Playwright driver bound to one event loop"""
+
+	def __init__(self):
+		self.playwright: Playwright | None = None
+		self.references = 0
+		self.starts = 0
+		self._lock = asyncio.Lock()
+
+	async def acquire(self) -> Playwright:
+		"""Take a reference, starting the driver if nobody holds one"""
+		async with self._lock:
+			if self.playwright is None:
+				self.playwright = await async_playwright().start()
+				self.starts += 1
+				logger.debug('🎭  Started shared Playwright driver')
+			self.references += 1
+			return self.playwright
+
+	async def release(self) -> None:
+		"""Drop a reference, stopping the driver when it was the last one"""
+		async with self._lock:
+			if self.references == 0:
+				return
+			self.references -= 1
+			if self.references == 0 and self.playwright is not None:
+				playwright, self.playwright = self.playwright, None
+				await playwright.stop()
+				logger.debug('🎭  Stopped shared Playwright driver')
+
+
+_drivers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PlaywrightDriver]' = weakref.WeakKeyDictionary()
+
+
+def get_shared_driver() -> PlaywrightDriver:
+	"""Return the shared driver of the running event loop (Playwright objects cannot cross loops)"""
+	loop = asyncio.get_running_loop()
+	driver = _drivers.get(loop)
+	if driver is None:
+		driver = _drivers[loop] = PlaywrightDriver()
+	return driver
+
+
+def _driver_memory_mb() -> float:
+	"""Resident memory of the Playwright driver processes spawned by this process"""
+	children = psutil.Process().children(recursive=True)
+	total = 0
+	for child in children:
+		try:
+			total += child.memory_info().rss
+		except psutil.Error:
+			pass
+	return total / 1024 / 1024
+
+
+async def measure_driver_overhead(browsers: int = 10) -> DriverOverhead:
+	"""
+	Start one driver per browser and then one shared driver for all of them, and compare the
+	startup time and driver memory. Browsers themselves are not launched, their cost is the same
+	in both setups.
+	"""
+	start = time.perf_counter()
+	separate = await asyncio.gather(*(async_playwright().start() for _ in range(browsers)))
+	separate_startup_time = time.perf_counter() - start
+	separate_memory_mb = _driver_memory_mb()
+	await asyncio.gather(*(playwright.stop() for playwright in separate))
+
+	driver = PlaywrightDriver()
+	start = time.perf_counter()
+	await asyncio.gather(*(driver.acquire() for _ in range(browsers)))
+	shared_startup_time = time.perf_counter() - start
+	shared_memory_mb = _driver_memory_mb()
+	for _ in range(browsers):
+		await driver.release()
+
+	return DriverOverhead(
+		browsers=browsers,
+		separate_startup_time=separate_startup_time,
+		shared_startup_time=shared_startup_time,
+		separate_memory_mb=separate_memory_mb,
+		shared_memory_mb=shared_memory_mb,
+	)
+
+
+if __name__ == '__main__':
+	overhead = asyncio.run(measure_driver_overhead())
+	print(
+		f'{overhead.browsers} browsers: '
+		f'separate drivers {overhead.separate_startup_time:.2f}s / {overhead.separate_memory_mb:.0f}MB, '
+		f'shared driver {overhead.shared_startup_time:.2f}s / {overhead.shared_memory_mb:.0f}MB'
+	)
@@ -0,0 +1,306 @@
+"""
+Client for a farm of remote Chrome instances reachable over CDP.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+import httpx
+from playwright.async_api import Browser as PlaywrightBrowser
+from playwright.async_api import Playwright
+from pydantic import BaseModel, ConfigDict, Field
+
+from browser_use.browser.browser import Browser, BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
+from browser_use.browser.views import BrowserFarmEndpointStats
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserFarmConfig(BaseModel):
+	r"""
+	Configuration for the BrowserFarm.
+
+	Default values:
+		endpoints: []
+			CDP endpoints of the farm, e.g. 'http://10.0.0.5:9222' or 'ws://10.0.0.5:9222/devtools/browser/<id>'
+
+		max_contexts_per_endpoint: 10
+			Contexts open at the same time on one endpoint
+
+		health_check_interval: 15.0
+			Seconds between background health checks of all endpoints, 0 disables them
+
+		health_check_timeout: 5.0
+			Seconds an endpoint gets to answer a health check
+
+		connect_timeout: 20.0
+			Seconds allowed for connecting to an endpoint
+
+		latency_window: 20
+			Number of recent health check latencies averaged per endpoint
+
+		browser_config: BrowserConfig(shared_driver=True)
+			Settings applied to the connection to every endpoint (its cdp_url is ignored)
+
+		context_config: None
+			Configuration for the contexts, defaults to browser_config.new_context_config
+	"""
+
+	model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore')
+
+	endpoints: list[str] = Field(default_factory=list)
+	max_contexts_per_endpoint: int = 10
+	health_check_interval: float = 15.0
+	health_check_timeout: float = 5.0
+	connect_timeout: float = 20.0
+	latency_window: int = 20
+
+	browser_config: BrowserConfig = Field(default_factory=lambda: BrowserConfig(shared_driver=True))
+	context_config: BrowserContextConfig | None = None
+
+
+class FarmBrowser(Browser):
+	"""
+	Browser connected to one farm endpoint over CDP.
+
+	Unlike a Browser with cdp_url, which reuses the remote browser's default context, every
+	context created on a FarmBrowser is a new isolated one.
+	"""
+
+	def __init__(self, endpoint_url: str, config: BrowserConfig, connect_timeout: float = 20.0):
+		super().__init__(config=config.model_copy(update={'cdp_url': None, 'wss_url': None, 'browser_binary_path': None}))
+		self.endpoint_url = endpoint_url
+		self.connect_timeout = connect_timeout
+
+	async def _setup_browser(self, playwright: Playwright) -> PlaywrightBrowser:
+		logger.info(f'🔌  Connecting to farm browser via CDP {self.endpoint_url}')
+		return await playwright.chromium.connect_over_cdp(self.endpoint_url, timeout=self.connect_timeout * 1000)
+
+
+@dataclass(eq=False)
+class FarmEndpoint:
+	url: str
+	latencies: deque[float]
+	browser: FarmBrowser | None = None
+	healthy: bool = True
+	open_contexts: int = 0
+	failures: int = 0
+
+	@property
+	def version_url(self) -> str:
+		"""HTTP URL of the endpoint's /json/version, also for ws:// endpoints"""
+		parsed = urlparse(self.url)
+		scheme = {'ws': 'http', 'wss': 'https'}.get(parsed.scheme, parsed.scheme)
+		return f'{scheme}://{parsed.netloc}/json/version'
+
+	@property
+	def avg_latency(self) -> float:
+		return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+
+class BrowserFarm:
+	"""
+	Routes new browser contexts across several remote Chrome instances.
+
+	Every endpoint is health-checked through its /json/version URL, in the background and on
+	connection errors. A new context goes to the healthy endpoint with the fewest open contexts
+	(relative to max_contexts_per_endpoint), ties going to the lowest recent latency. If connecting
+	to an endpoint or creating the context fails, the endpoint is marked unhealthy and the next one
+	is tried. Unhealthy endpoints get no new contexts but keep their connection, so contexts already
+	leased on them drain; only a lost CDP connection fails the endpoint's contexts and frees their
+	slots. Unhealthy endpoints come back once a health check succeeds again.
+
+	Usage:
+		async with BrowserFarm(BrowserFarmConfig(endpoints=['http://host-a:9222', 'http://host-b:9222'])) as farm:
+			async with farm.lease() as context:
+				agent = Agent(task=task, llm=llm, browser=context.browser, browser_context=context)
+				await agent.run()
+	"""
+
+	def __init__(self, config: BrowserFarmConfig):
+		if not config.endpoints:
+			raise ValueError('BrowserFarm needs at least one endpoint')
+		self.config = config
+		self.context_config = config.context_config or config.browser_config.new_context_config
+		self.endpoints = [FarmEndpoint(url=url, latencies=deque(maxlen=config.latency_window)) for url in config.endpoints]
+		self._contexts: dict[BrowserContext, FarmEndpoint] = {}
+		# Contexts whose endpoint connection was lost, their slots are free already
+		self._lost_contexts: weakref.WeakSet[BrowserContext] = weakref.WeakSet()
+		self._monitor: asyncio.Task | None = None
+
+	async def __aenter__(self) -> 'BrowserFarm':
+		await self.start()
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
+
+	async def start(self) -> None:
+		"""Check all endpoints once and start the background health checks"""
+		await self.check_health()
+		healthy = sum(endpoint.healthy for endpoint in self.endpoints)
+		logger.info(f'🚜  Browser farm ready with {healthy}/{len(self.endpoints)} healthy endpoints')
+		if self.config.health_check_interval > 0 and self._monitor is None:
+			self._monitor = asyncio.create_task(self._monitor_health())
+
+	async def _monitor_health(self) -> None:
+		while True:
+			await asyncio.sleep(self.config.health_check_interval)
+			await self.check_health()
+
+	async def check_health(self) -> None:
+		"""Probe every endpoint concurrently and update its health and latency"""
+		# A client per round: Browser.close() closes every open httpx client in the process
+		async with httpx.AsyncClient(timeout=self.config.health_check_timeout) as client:
+			await asyncio.gather(*(self._check_endpoint(client, endpoint) for endpoint in self.endpoints))
+
+	async def _check_endpoint(self, client: httpx.AsyncClient, endpoint: FarmEndpoint) -> None:
+		browser = endpoint.browser
+		if browser and browser.playwright_browser and not browser.playwright_browser.is_connected():
+			await self._drop_connection(endpoint, RuntimeError('CDP connection lost'))
+			return
+
+		start = time.perf_counter()
+		try:
+			response = await client.get(endpoint.version_url)
+			response.raise_for_status()
+		except Exception as e:
+			self._mark_unhealthy(endpoint, e)
+			return
+
+		endpoint.latencies.append(time.perf_counter() - start)
+		if not endpoint.healthy:
+			logger.info(f'✅  Browser farm endpoint {endpoint.url} is healthy again')
+		endpoint.healthy = True
+
+	def _mark_unhealthy(self, endpoint: FarmEndpoint, error: Exception) -> None:
+		"""Stop routing new contexts to the endpoint, contexts leased on it keep running"""
+		if endpoint.healthy:
+			logger.warning(f'⚠️  Browser farm endpoint {endpoint.url} is unhealthy: {error}')
+		endpoint.healthy = False
+		endpoint.failures += 1
+
+	async def _drop_connection(self, endpoint: FarmEndpoint, error: Exception) -> None:
+		"""The endpoint's CDP connection is gone: fail its contexts, free their slots and reconnect on the next lease"""
+		self._mark_unhealthy(endpoint, error)
+		lost = [context for context, owner in self._contexts.items() if owner is endpoint]
+		for context in lost:
+			del self._contexts[context]
+			self._lost_contexts.add(context)
+		endpoint.open_contexts -= len(lost)
+		if lost:
+			logger.warning(f'💥  Lost {len(lost)} contexts on browser farm endpoint {endpoint.url}')
+		await self._disconnect(endpoint)
+
+	async def _disconnect(self, endpoint: FarmEndpoint) -> None:
+		# Not Browser.close(): it also closes every httpx client in the process
+		browser, endpoint.browser = endpoint.browser, None
+		if browser is None:
+			return
+		try:
+			if browser.playwright_browser:
+				await browser.playwright_browser.close()
+			await browser._stop_playwright()
+		except Exception as e:
+			logger.debug(f'Failed to disconnect from {endpoint.url}: {e}')
+		finally:
+			browser.playwright_browser = None
+
+	@staticmethod
+	def _connected(endpoint: FarmEndpoint) -> bool:
+		browser = endpoint.browser
+		return browser is not None and browser.playwright_browser is not None and browser.playwright_browser.is_connected()
+
+	def _load(self, endpoint: FarmEndpoint) -> tuple[float, float]:
+		return endpoint.open_contexts / self.config.max_contexts_per_endpoint, endpoint.avg_latency
+
+	async def new_context(self, config: BrowserContextConfig | None = None) -> BrowserContext:
+		"""
+		Create a context on the least-loaded healthy endpoint, failing over to the next one on errors.
+		Raises RuntimeError when no healthy endpoint has free capacity.
+		"""
+		tried: set[FarmEndpoint] = set()
+		while True:
+			candidates = [
+				endpoint
+				for endpoint in self.endpoints
+				if endpoint.healthy and endpoint not in tried and endpoint.open_contexts < self.config.max_contexts_per_endpoint
+			]
+			if not candidates:
+				raise RuntimeError('No healthy browser farm endpoint with free capacity')
+			endpoint = min(candidates, key=self._load)
+			tried.add(endpoint)
+
+			# Count the context before connecting so concurrent calls spread over the endpoints
+			endpoint.open_contexts += 1
+			try:
+				if endpoint.browser is None:
+					endpoint.browser = FarmBrowser(endpoint.url, self.config.browser_config, self.config.connect_timeout)
+				await endpoint.browser.get_playwright_browser()
+				context = BrowserContext(browser=endpoint.browser, config=config or self.context_config)
+				await context.get_session()
+			except Exception as e:
+				endpoint.open_contexts -= 1
+				# A working connection stays up for the contexts already leased on the endpoint
+				if self._connected(endpoint):
+					self._mark_unhealthy(endpoint, e)
+				else:
+					await self._drop_connection(endpoint, e)
+				continue
+
+			self._contexts[context] = endpoint
+			return context
+
+	async def close_context(self, context: BrowserContext) -> None:
+		"""Close a context created by this farm and free its slot"""
+		endpoint = self._contexts.pop(context, None)
+		if endpoint is not None:
+			endpoint.open_contexts -= 1
+		elif context in self._lost_contexts:
+			self._lost_contexts.discard(context)
+		else:
+			raise ValueError('Context was not created by this farm')
+		try:
+			await context.close()
+		except Exception as e:
+			logger.debug(f'Failed to close farm context: {e}')
+
+	@asynccontextmanager
+	async def lease(self, config: BrowserContextConfig | None = None) -> AsyncIterator[BrowserContext]:
+		context = await self.new_context(config)
+		try:
+			yield context
+		finally:
+			await self.close_context(context)
+
+	def stats(self) -> list[BrowserFarmEndpointStats]:
+		return [
+			BrowserFarmEndpointStats(
+				url=endpoint.url,
+				healthy=endpoint.healthy,
+				connected=endpoint.browser is not None and endpoint.browser.playwright_browser is not None,
+				open_contexts=endpoint.open_contexts,
+				avg_latency=endpoint.avg_latency,
+				failures=endpoint.failures,
+			)
+			for endpoint in self.endpoints
+		]
+
+	async def close(self) -> None:
+		"""Close all contexts and disconnect from the endpoints (the remote browsers keep running)"""
+		if self._monitor:
+			self._monitor.cancel()
+			await asyncio.gather(self._monitor, return_exceptions=True)
+			self._monitor = None
+		for context in list(self._contexts):
+			await self.close_context(context)
+		for endpoint in self.endpoints:
+			await self._disconnect(endpoint)
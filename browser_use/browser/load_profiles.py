@@ -0,0 +1,122 @@
+"""
+Per-domain page load profiles learned from observed readiness timings.
+"""
+
+import json
+import logging
+import os
+from urllib.parse import urlparse
+
+from browser_use.browser.views import PageLoadTimings, PageLoadWaits
+
+logger = logging.getLogger(__name__)
+
+# Installed in every page when profiles are enabled: remembers when the last interactive element was added or removed
+INTERACTIVE_CHANGE_TRACKER_JS = """
+(() => {
+	const selector = 'a, button, input, select, textarea, [role="button"], [role="link"], [onclick], [tabindex]';
+	window.__browserUseInteractiveChangedAt = 0;
+	const isInteractive = (node) => node.nodeType === 1 && (node.matches(selector) || node.querySelector(selector) !== null);
+	new MutationObserver((records) => {
+		for (const record of records) {
+			for (const node of [...record.addedNodes, ...record.removedNodes]) {
+				if (isInteractive(node)) {
+					window.__browserUseInteractiveChangedAt = performance.now();
+					return;
+				}
+			}
+		}
+	}).observe(document, { childList: true, subtree: true });
+})();
+"""
+
+# Returns the document's timings in ms since navigation start
+READ_TIMINGS_JS = """
+() => {
+	const navigation = performance.getEntriesByType('navigation')[0];
+	return {
+		timeOrigin: performance.timeOrigin,
+		now: performance.now(),
+		domContentLoaded: navigation ? navigation.domContentLoadedEventEnd : 0,
+		interactiveChangedAt: window.__browserUseInteractiveChangedAt ?? null,
+	};
+}
+"""
+
+
+def percentile(values: list[float], fraction: float) -> float:
+	ordered = sorted(values)
+	return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class PageLoadProfiles:
+	"""
+	Recent page load timings per domain, persisted as JSON.
+
+	Domains with fewer than min_samples loads get the configured waits. For known domains the
+	minimum wait covers the 90th percentile of the time until interactive elements stop changing,
+	and the maximum wait 1.5x the 90th percentile of the time to network idle plus the idle window,
+	capped at max_wait_factor times the configured maximum. Timings are measured from navigation
+	start, so the waits derived from them err on the long side.
+	"""
+
+	def __init__(self, path: str | None = None, max_samples: int = 20, min_samples: int = 3, max_wait_factor: float = 3.0):
+		self.path = path
+		self.max_samples = max_samples
+		self.min_samples = min_samples
+		self.max_wait_factor = max_wait_factor
+		self.profiles: dict[str, dict[str, list[float]]] = {}
+		self._changed: set[str] = set()
+
+		if path and os.path.exists(path):
+			try:
+				with open(path) as f:
+					self.profiles = json.load(f)
+			except (OSError, json.JSONDecodeError) as e:
+				logger.warning(f'⚠️  Could not read page load profiles from {path}: {e}')
+
+	@staticmethod
+	def domain(url: str) -> str:
+		return urlparse(url).netloc.lower()
+
+	def record(self, url: str, timings: PageLoadTimings) -> None:
+		domain = self.domain(url)
+		if not domain:
+			return
+		profile = self.profiles.setdefault(domain, {})
+		for name, value in timings.model_dump().items():
+			samples = profile.setdefault(name, [])
+			samples.append(round(value, 3))
+			del samples[: -self.max_samples]
+		self._changed.add(domain)
+
+	def waits(self, url: str, defaults: PageLoadWaits) -> PageLoadWaits:
+		"""Waits for a page load on url, the defaults unless the domain has enough samples"""
+		profile = self.profiles.get(self.domain(url))
+		if not profile or len(profile.get('network_idle', [])) < self.min_samples:
+			return defaults
+
+		network_idle = percentile(profile['network_idle'], 0.9)
+		dom_stable = percentile(profile['dom_stable'], 0.9)
+		maximum = min(
+			max(network_idle * 1.5 + defaults.network_idle, 2 * defaults.network_idle),
+			defaults.maximum * self.max_wait_factor,
+		)
+		return PageLoadWaits(minimum=min(dom_stable, maximum), network_idle=defaults.network_idle, maximum=maximum)
+
+	def save(self) -> None:
+		"""Write the profile of every domain recorded since loading, keeping other writers' domains"""
+		if not self.path or not self._changed:
+			return
+		profiles = {}
+		if os.path.exists(self.path):
+			try:
+				with open(self.path) as f:
+					profiles = json.load(f)
+			except (OSError, json.JSONDecodeError):
+				pass
+		profiles.update({domain: self.profiles[domain] for domain in self._changed})
+		os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+		with open(self.path, 'w') as f:
+			json.dump(profiles, f)
+		self._changed.clear()
@@ -0,0 +1,219 @@
+"""
+Event-driven detection of network idle.
+
+Relevant requests are tracked from Playwright's request/response events, or from the CDP Network
+domain (requestWillBeSent/loadingFinished/loadingFailed) when use_cdp is set. Waiting wakes up on
+every idle transition instead of polling, so idle is detected as soon as the quiet period ends.
+"""
+
+import asyncio
+import logging
+import re
+
+from playwright.async_api import Page, Request, Response
+
+logger = logging.getLogger(__name__)
+
+RELEVANT_RESOURCE_TYPES = {
+	'document',
+	'stylesheet',
+	'image',
+	'font',
+	'script',
+	'iframe',
+}
+
+RELEVANT_CONTENT_TYPES = re.compile(r'text/html|text/css|application/javascript|image/|font/|application/json')
+
+# Streaming or real-time responses never settle, they don't count as pending
+STREAMING_CONTENT_TYPES = re.compile(r'streaming|video|audio|webm|mp4|event-stream|websocket|protobuf')
+
+IGNORED_URL_PATTERNS = (
+	# Analytics and tracking
+	'analytics',
+	'tracking',
+	'telemetry',
+	'beacon',
+	'metrics',
+	# Ad-related
+	'doubleclick',
+	'adsystem',
+	'adserver',
+	'advertising',
+	# Social media widgets
+	'facebook.com/plugins',
+	'platform.twitter',
+	'linkedin.com/embed',
+	# Live chat and support
+	'livechat',
+	'zendesk',
+	'intercom',
+	'crisp.chat',
+	'hotjar',
+	# Push notifications
+	'push-notifications',
+	'onesignal',
+	'pushwoosh',
+	# Background sync/heartbeat
+	'heartbeat',
+	'ping',
+	'alive',
+	# WebRTC and streaming
+	'webrtc',
+	'rtmp://',
+	'wss://',
+	# Common CDNs for dynamic content
+	'cloudfront.net',
+	'fastly.net',
+)
+
+# One alternation scans the URL once instead of once per pattern
+IGNORED_URLS = re.compile('|'.join(map(re.escape, IGNORED_URL_PATTERNS)))
+
+MAX_RELEVANT_CONTENT_LENGTH = 5 * 1024 * 1024
+
+
+def is_relevant_request(resource_type: str, url: str, headers: dict[str, str]) -> bool:
+	"""Whether the page load should wait for this request (headers with lowercase names)"""
+	if resource_type not in RELEVANT_RESOURCE_TYPES:
+		return False
+	url = url.lower()
+	if url.startswith(('data:', 'blob:')) or IGNORED_URLS.search(url):
+		return False
+	return headers.get('purpose') != 'prefetch' and headers.get('sec-fetch-dest') not in ('video', 'audio')
+
+
+def is_relevant_response(headers: dict[str, str]) -> bool:
+	"""Whether a response counts as page load activity (headers with lowercase names)"""
+	content_type = headers.get('content-type', '').lower()
+	if STREAMING_CONTENT_TYPES.search(content_type) or not RELEVANT_CONTENT_TYPES.search(content_type):
+		return False
+	content_length = headers.get('content-length')
+	return not (content_length and content_length.isdigit() and int(content_length) > MAX_RELEVANT_CONTENT_LENGTH)
+
+
+class NetworkIdleWatcher:
+	"""
+	Tracks the relevant in-flight requests of a page.
+
+	Usage:
+		async with NetworkIdleWatcher(page) as watcher:
+			idle = await watcher.wait(idle_time=0.5, timeout=5)
+	"""
+
+	def __init__(self, page: Page, use_cdp: bool = False):
+		self.page = page
+		self.use_cdp = use_cdp
+		self.pending: dict[object, str] = {}
+		self._loop = asyncio.get_running_loop()
+		self.last_activity = self._loop.time()
+		self._changed = asyncio.Event()
+		self._cdp_session = None
+
+	async def __aenter__(self) -> 'NetworkIdleWatcher':
+		await self.start()
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.stop()
+
+	def _started(self, key: object, url: str) -> None:
+		self.pending[key] = url
+		self.last_activity = self._loop.time()
+		self._changed.set()
+
+	def _finished(self, key: object, activity: bool) -> None:
+		if self.pending.pop(key, None) is None:
+			return
+		if activity:
+			self.last_activity = self._loop.time()
+		self._changed.set()
+
+	# Playwright events (handlers are sync, so no task is spawned per request)
+
+	def _on_request(self, request: Request) -> None:
+		if is_relevant_request(request.resource_type, request.url, request.headers):
+			self._started(request, request.url)
+
+	def _on_response(self, response: Response) -> None:
+		request = response.request
+		if request in self.pending:
+			self._finished(request, activity=is_relevant_response(response.headers))
+
+	def _on_request_failed(self, request: Request) -> None:
+		self._finished(request, activity=False)
+
+	# CDP Network events: a request only settles once its body has been loaded
+
+	def _on_cdp_request(self, params: dict) -> None:
+		request = params['request']
+		headers = {name.lower(): value for name, value in request.get('headers', {}).items()}
+		if is_relevant_request(params.get('type', '').lower(), request['url'], headers):
+			self._started(params['requestId'], request['url'])
+
+	def _on_cdp_response(self, params: dict) -> None:
+		if params['requestId'] not in self.pending:
+			return
+		response = params['response']
+		headers = {name.lower(): value for name, value in response.get('headers', {}).items()}
+		headers.setdefault('content-type', response.get('mimeType', ''))
+		if not is_relevant_response(headers):
+			self._finished(params['requestId'], activity=False)
+
+	def _on_cdp_loading_finished(self, params: dict) -> None:
+		self._finished(params['requestId'], activity=True)
+
+	def _on_cdp_loading_failed(self, params: dict) -> None:
+		self._finished(params['requestId'], activity=False)
+
+	async def start(self) -> None:
+		if self.use_cdp:
+			try:
+				self._cdp_session = await self.page.context.new_cdp_session(self.page)
+				self._cdp_session.on('Network.requestWillBeSent', self._on_cdp_request)
+				self._cdp_session.on('Network.responseReceived', self._on_cdp_response)
+				self._cdp_session.on('Network.loadingFinished', self._on_cdp_loading_finished)
+				self._cdp_session.on('Network.loadingFailed', self._on_cdp_loading_failed)
+				await self._cdp_session.send('Network.enable')
+				return
+			except Exception as e:
+				logger.debug(f'CDP network tracking unavailable, using Playwright events: {e}')
+				self._cdp_session = None
+
+		self.page.on('request', self._on_request)
+		self.page.on('response', self._on_response)
+		self.page.on('requestfailed', self._on_request_failed)
+
+	async def stop(self) -> None:
+		if self._cdp_session:
+			try:
+				await self._cdp_session.detach()
+			except Exception as e:
+				logger.debug(f'Failed to detach CDP network session: {e}')
+			self._cdp_session = None
+			return
+
+		self.page.remove_listener('request', self._on_request)
+		self.page.remove_listener('response', self._on_response)
+		self.page.remove_listener('requestfailed', self._on_request_failed)
+
+	async def wait(self, idle_time: float, timeout: float) -> bool:
+		"""
+		Wait until no relevant request has been pending for idle_time seconds.
+		Returns False if that did not happen within timeout seconds.
+		"""
+		deadline = self._loop.time() + timeout
+		while True:
+			now = self._loop.time()
+			if not self.pending and now - self.last_activity >= idle_time:
+				return True
+			if now >= deadline:
+				return False
+
+			# Sleep until the quiet period would end or the next request event, whichever comes first
+			wake_at = deadline if self.pending else min(deadline, self.last_activity + idle_time)
+			self._changed.clear()
+			try:
+				await asyncio.wait_for(self._changed.wait(), timeout=wake_at - now)
+			except asyncio.TimeoutError:
+				pass
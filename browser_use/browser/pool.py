@@ -0,0 +1,343 @@
+"""
+Pool of pre-launched browsers with warm contexts.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from browser_use.browser.browser import Browser, BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
+from browser_use.browser.views import BrowserPoolStats
+
+logger = logging.getLogger(__name__)
+
+# Storage cleared per origin on release (Chromium only)
+CLEARED_STORAGE_TYPES = 'local_storage,session_storage,indexeddb,websql,cache_storage,service_workers,file_systems'
+
+
+class BrowserPoolConfig(BaseModel):
+	r"""
+	Configuration for the BrowserPool.
+
+	Default values:
+		size: 2
+			Number of browsers kept running
+
+		contexts_per_browser: 1
+			Number of warm contexts created in each browser
+
+		max_leases_per_context: 50
+			A context is replaced by a fresh one after this many leases
+
+		max_leases_per_browser: 500
+			A browser is relaunched after this many leases across its contexts
+
+		acquire_timeout: 60.0
+			Seconds to wait for a free context before raising TimeoutError
+
+		health_check_timeout: 5.0
+			Seconds a leased context gets to answer a health check
+
+		browser_config: BrowserConfig()
+			Configuration for every pooled browser
+
+		context_config: None
+			Configuration for every pooled context, defaults to browser_config.new_context_config
+	"""
+
+	model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore')
+
+	size: int = 2
+	contexts_per_browser: int = 1
+	max_leases_per_context: int = 50
+	max_leases_per_browser: int = 500
+	acquire_timeout: float = 60.0
+	health_check_timeout: float = 5.0
+
+	browser_config: BrowserConfig = Field(default_factory=lambda: BrowserConfig(shared_driver=True))
+	context_config: BrowserContextConfig | None = None
+
+
+@dataclass(eq=False)
+class PooledBrowser:
+	browser: Browser
+	contexts: set['PooledContext'] = field(default_factory=set)
+	leases: int = 0
+	retiring: bool = False
+
+
+@dataclass(eq=False)
+class PooledContext:
+	context: BrowserContext
+	owner: PooledBrowser
+	leases: int = 0
+
+
+class BrowserPool:
+	"""
+	Keeps browsers with pre-created contexts warm and leases the contexts to Agents.
+
+	On release a context gets a fast reset (cookies, storage and extra tabs are cleared and the
+	remaining tab goes to about:blank) instead of being closed. Contexts and browsers are replaced
+	after a configurable number of leases or when a health check fails.
+
+	Usage:
+		async with BrowserPool(BrowserPoolConfig(size=4)) as pool:
+			async with pool.lease() as context:
+				agent = Agent(task=task, llm=llm, browser=context.browser, browser_context=context)
+				await agent.run()
+	"""
+
+	def __init__(self, config: BrowserPoolConfig = BrowserPoolConfig()):
+		self.config = config
+		self.context_config = config.context_config or config.browser_config.new_context_config
+		self._browsers: set[PooledBrowser] = set()
+		self._idle: asyncio.Queue[PooledContext] = asyncio.Queue()
+		self._leased: dict[BrowserContext, PooledContext] = {}
+		self._tasks: set[asyncio.Task] = set()
+		self._started = False
+		self._closed = False
+
+		self._wait_times: list[float] = []
+		self._resets = 0
+		self._recycled_contexts = 0
+		self._recycled_browsers = 0
+		self._failed_health_checks = 0
+
+	async def __aenter__(self) -> 'BrowserPool':
+		await self.start()
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
+
+	async def start(self) -> None:
+		"""Launch all browsers and their contexts concurrently"""
+		if self._started:
+			return
+		self._started = True
+		await asyncio.gather(*(self._launch() for _ in range(self.config.size)))
+		logger.info(f'🏊  Browser pool ready with {self._idle.qsize()} warm contexts')
+
+	async def _launch(self) -> None:
+		"""Start one browser and fill it with warm contexts"""
+		owner = PooledBrowser(browser=Browser(config=self.config.browser_config))
+		self._browsers.add(owner)
+		await owner.browser.get_playwright_browser()
+		entries = await asyncio.gather(*(self._new_context(owner) for _ in range(self.config.contexts_per_browser)))
+		for entry in entries:
+			self._idle.put_nowait(entry)
+
+	async def _new_context(self, owner: PooledBrowser) -> PooledContext:
+		context = BrowserContext(browser=owner.browser, config=self.context_config)
+		await context.get_session()
+		entry = PooledContext(context=context, owner=owner)
+		owner.contexts.add(entry)
+		return entry
+
+	def _spawn(self, coro) -> None:
+		task = asyncio.create_task(coro)
+		self._tasks.add(task)
+		task.add_done_callback(self._tasks.discard)
+
+	async def acquire(self) -> BrowserContext:
+		"""Lease a healthy, reset context. Raises TimeoutError if none becomes free in time."""
+		if self._closed:
+			raise RuntimeError('Browser pool is closed')
+		if not self._started:
+			await self.start()
+
+		start = time.perf_counter()
+		deadline = start + self.config.acquire_timeout
+		while True:
+			remaining = deadline - time.perf_counter()
+			if remaining <= 0:
+				raise TimeoutError(f'No browser context became available within {self.config.acquire_timeout}s')
+			entry = await asyncio.wait_for(self._idle.get(), timeout=remaining)
+
+			if entry.owner.retiring:
+				await self._discard(entry)
+				continue
+			if not await self._is_healthy(entry):
+				self._failed_health_checks += 1
+				logger.warning('⚠️  Pooled browser context failed its health check, replacing it')
+				await self._discard(entry)
+				continue
+
+			self._wait_times.append(time.perf_counter() - start)
+			self._leased[entry.context] = entry
+			return entry.context
+
+	async def release(self, context: BrowserContext) -> None:
+		"""Return a leased context to the pool"""
+		entry = self._leased.pop(context, None)
+		if entry is None:
+			raise ValueError('Context was not leased from this pool')
+
+		entry.leases += 1
+		entry.owner.leases += 1
+		if entry.owner.leases >= self.config.max_leases_per_browser:
+			entry.owner.retiring = True
+
+		if self._closed or entry.owner.retiring:
+			await self._discard(entry)
+		elif entry.leases >= self.config.max_leases_per_context:
+			await self._discard(entry)
+		else:
+			try:
+				await fast_reset(context)
+				self._resets += 1
+				self._idle.put_nowait(entry)
+			except Exception as e:
+				logger.debug(f'Fast reset failed, replacing context: {e}')
+				await self._discard(entry)
+
+	@asynccontextmanager
+	async def lease(self) -> AsyncIterator[BrowserContext]:
+		context = await self.acquire()
+		try:
+			yield context
+		finally:
+			await self.release(context)
+
+	async def _is_healthy(self, entry: PooledContext) -> bool:
+		playwright_browser = entry.owner.browser.playwright_browser
+		if playwright_browser is None or not playwright_browser.is_connected():
+			entry.owner.retiring = True
+			return False
+		try:
+			page = await entry.context.get_current_page()
+			await asyncio.wait_for(page.evaluate('1'), timeout=self.config.health_check_timeout)
+			return True
+		except Exception as e:
+			logger.debug(f'Health check failed: {e}')
+			return False
+
+	async def _discard(self, entry: PooledContext) -> None:
+		"""Close a context and schedule its replacement (a new context, or a new browser once a retiring one is empty)"""
+		owner = entry.owner
+		owner.contexts.discard(entry)
+		try:
+			await entry.context.close()
+		except Exception as e:
+			logger.debug(f'Failed to close pooled context: {e}')
+
+		if self._closed:
+			return
+		if owner.retiring:
+			if not owner.contexts:
+				self._browsers.discard(owner)
+				self._recycled_browsers += 1
+				self._spawn(self._replace_browser(owner))
+		else:
+			self._recycled_contexts += 1
+			self._spawn(self._replace_context(owner))
+
+	async def _replace_context(self, owner: PooledBrowser) -> None:
+		try:
+			self._idle.put_nowait(await self._new_context(owner))
+		except Exception as e:
+			logger.warning(f'⚠️  Failed to create replacement context, relaunching browser: {e}')
+			owner.retiring = True
+			if not owner.contexts:
+				self._browsers.discard(owner)
+				self._recycled_browsers += 1
+				await self._replace_browser(owner)
+
+	async def _replace_browser(self, owner: PooledBrowser) -> None:
+		await self._close_browser(owner)
+		if not self._closed:
+			await self._launch()
+
+	@staticmethod
+	async def _close_browser(owner: PooledBrowser) -> None:
+		# Not Browser.close(): it also closes every httpx client in the process, including those of running agents' LLMs
+		browser = owner.browser
+		try:
+			if browser.playwright_browser:
+				await browser.playwright_browser.close()
+			await browser._stop_playwright()
+		except Exception as e:
+			logger.debug(f'Failed to close pooled browser: {e}')
+		finally:
+			browser.playwright_browser = None
+			browser.playwright = None
+
+	def stats(self) -> BrowserPoolStats:
+		waits = sorted(self._wait_times)
+		return BrowserPoolStats(
+			acquisitions=len(waits),
+			avg_acquire_time=sum(waits) / len(waits) if waits else 0.0,
+			p50_acquire_time=waits[len(waits) // 2] if waits else 0.0,
+			p95_acquire_time=waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+			max_acquire_time=waits[-1] if waits else 0.0,
+			resets=self._resets,
+			recycled_contexts=self._recycled_contexts,
+			recycled_browsers=self._recycled_browsers,
+			failed_health_checks=self._failed_health_checks,
+			idle=self._idle.qsize(),
+			leased=len(self._leased),
+		)
+
+	async def close(self) -> None:
+		"""Close every context and browser, including leased ones"""
+		self._closed = True
+		for task in list(self._tasks):
+			task.cancel()
+		await asyncio.gather(*self._tasks, return_exceptions=True)
+		for owner in list(self._browsers):
+			for entry in list(owner.contexts):
+				try:
+					await entry.context.close()
+				except Exception as e:
+					logger.debug(f'Failed to close pooled context: {e}')
+			await self._close_browser(owner)
+		self._browsers.clear()
+		self._leased.clear()
+
+
+async def fast_reset(context: BrowserContext) -> None:
+	"""
+	Make a used context look fresh without closing it: clear cookies, permissions and per-origin
+	storage, close all tabs but one and point that tab to about:blank.
+	"""
+	session = await context.get_session()
+	playwright_context = session.context
+	pages = [page for page in playwright_context.pages if not page.is_closed()]
+
+	origins = {f'{parsed.scheme}://{parsed.netloc}' for parsed in map(urlparse, (page.url for page in pages))}
+	storage = await playwright_context.storage_state()
+	origins.update(entry['origin'] for entry in storage.get('origins', []))
+	origins = {origin for origin in origins if origin.startswith(('http://', 'https://'))}
+
+	if pages and context.browser.config.browser_class == 'chromium':
+		cdp_session = await playwright_context.new_cdp_session(pages[0])
+		try:
+			await asyncio.gather(
+				*(
+					cdp_session.send('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': CLEARED_STORAGE_TYPES})
+					for origin in origins
+				)
+			)
+		finally:
+			await cdp_session.detach()
+	elif origins:
+		raise RuntimeError('Fast reset of per-origin storage needs Chromium')
+
+	await playwright_context.clear_cookies()
+	await playwright_context.clear_permissions()
+
+	keep, *extra = pages or [await playwright_context.new_page()]
+	await asyncio.gather(*(page.close() for page in extra))
+	if keep.url != 'about:blank':
+		await keep.goto('about:blank')
+
+	session.cached_state = None
+	context.state.target_id = None
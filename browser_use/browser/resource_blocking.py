@@ -0,0 +1,177 @@
+"""
+Request routing policy that skips resources an agent does not need.
+"""
+
+import logging
+import weakref
+
+from playwright.async_api import BrowserContext as PlaywrightBrowserContext
+from playwright.async_api import Page, Route
+from pydantic import BaseModel, Field
+
+from browser_use.browser.views import ResourceBlockingStats
+
+logger = logging.getLogger(__name__)
+
+# Ad, analytics and tracking domains, subdomains included
+AD_TRACKER_DOMAINS = frozenset(
+	{
+		'2mdn.net',
+		'adnxs.com',
+		'adsafeprotected.com',
+		'adservice.google.com',
+		'adsrvr.org',
+		'advertising.com',
+		'amazon-adsystem.com',
+		'bat.bing.com',
+		'branch.io',
+		'chartbeat.com',
+		'clarity.ms',
+		'criteo.com',
+		'criteo.net',
+		'demdex.net',
+		'doubleclick.net',
+		'everesttech.net',
+		'facebook.net',
+		'fullstory.com',
+		'google-analytics.com',
+		'googleadservices.com',
+		'googlesyndication.com',
+		'googletagmanager.com',
+		'googletagservices.com',
+		'hotjar.com',
+		'hubspot.com',
+		'mathtag.com',
+		'mixpanel.com',
+		'moatads.com',
+		'newrelic.com',
+		'nr-data.net',
+		'omtrdc.net',
+		'onesignal.com',
+		'optimizely.com',
+		'outbrain.com',
+		'pubmatic.com',
+		'quantserve.com',
+		'rubiconproject.com',
+		'scorecardresearch.com',
+		'segment.com',
+		'segment.io',
+		'sentry.io',
+		'taboola.com',
+		'tiktokanalytics.com',
+		'yieldmo.com',
+	}
+)
+
+# Rough transfer size per request of a resource type, used to estimate the bytes saved by blocking
+ESTIMATED_BYTES_PER_TYPE = {
+	'image': 40_000,
+	'media': 500_000,
+	'font': 30_000,
+	'script': 25_000,
+	'stylesheet': 10_000,
+	'document': 20_000,
+}
+ESTIMATED_BYTES_OTHER = 5_000
+
+# Transparent 1x1 GIF
+PLACEHOLDER_IMAGE = b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00!\xf9\x04\x01\x00\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+
+
+class ResourceBlockingConfig(BaseModel):
+	r"""
+	Configuration for blocking requests in a browser context.
+
+	Default values:
+		resource_types: ['image', 'media', 'font']
+			Playwright resource types to block
+
+		block_ads_and_trackers: True
+			Block requests to the built-in list of ad and tracking domains (AD_TRACKER_DOMAINS)
+
+		blocked_domains: []
+			Additional domains to block, subdomains included
+
+		image_placeholders: False
+			Answer blocked images with a 1x1 transparent GIF instead of failing them, for pages that wait for image loads
+	"""
+
+	resource_types: list[str] = Field(default_factory=lambda: ['image', 'media', 'font'])
+	block_ads_and_trackers: bool = True
+	blocked_domains: list[str] = Field(default_factory=list)
+	image_placeholders: bool = False
+
+
+class ResourceBlocker:
+	"""
+	Routes every request of a context through a blocking policy and counts what it saved per page.
+
+	Note that Playwright disables the HTTP cache of a context with routes, so blocking only pays off
+	when the blocked resources outweigh cache hits.
+	"""
+
+	def __init__(self, config: ResourceBlockingConfig):
+		self.config = config
+		self.resource_types = frozenset(config.resource_types)
+		self.blocked_domains = frozenset(domain.lower().lstrip('.') for domain in config.blocked_domains)
+		if config.block_ads_and_trackers:
+			self.blocked_domains |= AD_TRACKER_DOMAINS
+		self._stats: weakref.WeakKeyDictionary[Page, ResourceBlockingStats] = weakref.WeakKeyDictionary()
+
+	async def install(self, context: PlaywrightBrowserContext) -> None:
+		await context.route('**/*', self._handle)
+
+	def _is_blocked_host(self, host: str) -> bool:
+		# Check the host and each parent domain: a.b.example.com, b.example.com, example.com, com
+		labels = host.split('.')
+		return any('.'.join(labels[i:]) in self.blocked_domains for i in range(len(labels)))
+
+	def decide(self, url: str, resource_type: str, is_main_frame_navigation: bool = False) -> str:
+		"""Return 'continue', 'abort' or 'placeholder' for a request"""
+		if is_main_frame_navigation or not url.startswith(('http://', 'https://')):
+			return 'continue'
+		if resource_type in self.resource_types:
+			return 'placeholder' if resource_type == 'image' and self.config.image_placeholders else 'abort'
+		if self.blocked_domains:
+			host = url.split('/', 3)[2].split('@')[-1].split(':')[0].lower()
+			if self._is_blocked_host(host):
+				return 'placeholder' if resource_type == 'image' and self.config.image_placeholders else 'abort'
+		return 'continue'
+
+	async def _handle(self, route: Route) -> None:
+		request = route.request
+		try:
+			frame = request.frame
+			page = frame.page
+			is_main_frame_navigation = request.is_navigation_request() and frame.parent_frame is None
+		except Exception:
+			# Service worker requests have no frame
+			page, is_main_frame_navigation = None, False
+
+		if is_main_frame_navigation and page is not None:
+			self._stats[page] = ResourceBlockingStats(url=request.url)
+
+		action = self.decide(request.url, request.resource_type, is_main_frame_navigation)
+		try:
+			if action == 'continue':
+				await route.fallback()
+				return
+			if action == 'placeholder':
+				await route.fulfill(status=200, content_type='image/gif', body=PLACEHOLDER_IMAGE)
+			else:
+				await route.abort('blockedbyclient')
+		except Exception as e:
+			# The page may have navigated away or closed in the meantime
+			logger.debug(f'Failed to route {request.url}: {e}')
+			return
+
+		if page is not None:
+			stats = self._stats.setdefault(page, ResourceBlockingStats(url=page.url))
+			stats.blocked_requests += 1
+			stats.placeholder_requests += action == 'placeholder'
+			stats.blocked_by_type[request.resource_type] = stats.blocked_by_type.get(request.resource_type, 0) + 1
+			stats.estimated_bytes_saved += ESTIMATED_BYTES_PER_TYPE.get(request.resource_type, ESTIMATED_BYTES_OTHER)
+
+	def stats(self, page: Page) -> ResourceBlockingStats:
+		"""What was blocked since the page's last main-frame navigation"""
+		return self._stats.get(page) or ResourceBlockingStats(url=page.url)
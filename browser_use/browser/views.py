@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from browser_use.dom.history_tree_processor.service import DOMHistoryElement
 from browser_use.dom.views import DOMState
@@ -17,6 +17,59 @@ class TabInfo(BaseModel):
 	parent_page_id: Optional[int] = None  # parent page that contains this popup or cross-origin iframe
 
 
+class BrowserPoolStats(BaseModel):
+	"""Lease and recycling metrics of a BrowserPool, times in seconds"""
+
+	acquisitions: int
+	avg_acquire_time: float
+	p50_acquire_time: float
+	p95_acquire_time: float
+	max_acquire_time: float
+	resets: int
+	recycled_contexts: int
+	recycled_browsers: int
+	failed_health_checks: int
+	idle: int
+	leased: int
+
+
+class BrowserFarmEndpointStats(BaseModel):
+	"""Health and load of one BrowserFarm endpoint, latency in seconds"""
+
+	url: str
+	healthy: bool
+	connected: bool
+	open_contexts: int
+	avg_latency: float
+	failures: int
+
+
+class PageLoadTimings(BaseModel):
+	"""Readiness of one loaded document, in seconds since its navigation started"""
+
+	dom_content_loaded: float
+	network_idle: float
+	dom_stable: float
+
+
+class PageLoadWaits(BaseModel):
+	"""Waits applied to one page load, in seconds"""
+
+	minimum: float
+	network_idle: float
+	maximum: float
+
+
+class ResourceBlockingStats(BaseModel):
+	"""Requests blocked on a page since its last navigation, bytes estimated from typical sizes per resource type"""
+
+	url: str
+	blocked_requests: int = 0
+	placeholder_requests: int = 0
+	blocked_by_type: dict[str, int] = Field(default_factory=dict)
+	estimated_bytes_saved: int = 0
+
+
 class GroupTabsAction(BaseModel):
 	tab_ids: list[int]
 	title: str
@@ -36,6 +89,8 @@ class BrowserState(DOMState):
 	pixels_above: int = 0
 	pixels_below: int = 0
 	browser_errors: list[str] = field(default_factory=list)
+	# Seconds spent per phase of the state capture, e.g. {'page_state': 0.21, 'tabs': 0.05, 'screenshot': 0.12}
+	timings: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
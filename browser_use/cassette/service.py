@@ -0,0 +1,237 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from browser_use.cassette.views import CassetteEntry, CassetteMatch, CassetteMissError, CassetteMode
+
+logger = logging.getLogger(__name__)
+
+LANGCHAIN_SOURCE = 'langchain'
+
+
+class Cassette(BaseCache):
+	"""
+	Records LLM responses to a JSONL file and replays them offline.
+
+	Langchain chat models use the cassette as their cache, either per model with
+	`attach(llm)` or globally with `langchain_core.globals.set_llm_cache`. Other
+	providers wrap their calls with `aplay`.
+
+	Modes:
+	- record: always call the model and write the response with its latency
+	- replay: never call the model, raise CassetteMissError for unknown calls
+	- auto: replay known calls and record new ones
+
+	Calls are matched by a hash of the full request (`match='prompt'`) or by their
+	position per source (`match='sequence'`), which tolerates prompts that change
+	between runs, such as those containing screenshots. Replayed calls sleep for
+	`latency_factor` times the recorded latency.
+	"""
+
+	def __init__(
+		self,
+		path: str | Path,
+		mode: CassetteMode = 'auto',
+		match: CassetteMatch = 'prompt',
+		latency_factor: float = 0.0,
+	):
+		self.path = Path(path)
+		self.mode = mode
+		self.match = match
+		self.latency_factor = latency_factor
+
+		self._by_key: dict[str, list[CassetteEntry]] = {}
+		self._by_source: dict[str, list[CassetteEntry]] = {}
+		self._key_cursor: dict[str, int] = {}
+		self._source_cursor: dict[str, int] = {}
+		self._pending: dict[str, list[float]] = {}
+		self._lock = threading.Lock()
+
+		self.hits = 0
+		self.misses = 0
+		self.recorded = 0
+		self.simulated_latency = 0.0
+
+		if mode == 'record':
+			self.path.parent.mkdir(parents=True, exist_ok=True)
+			self.path.write_text('', encoding='utf-8')
+		elif self.path.exists():
+			self._load()
+
+	def _load(self) -> None:
+		with self.path.open(encoding='utf-8') as f:
+			for line in f:
+				if line.strip():
+					self._add(CassetteEntry.model_validate_json(line))
+		logger.debug(f'Loaded {sum(len(v) for v in self._by_key.values())} cassette entries from {self.path}')
+
+	def _add(self, entry: CassetteEntry) -> None:
+		self._by_key.setdefault(entry.key, []).append(entry)
+		self._by_source.setdefault(entry.source, []).append(entry)
+
+	@staticmethod
+	def _key(source: str, *parts: str) -> str:
+		digest = hashlib.sha256()
+		for part in (source, *parts):
+			digest.update(part.encode('utf-8'))
+			digest.update(b'\0')
+		return digest.hexdigest()
+
+	def _next(self, key: str, source: str) -> Optional[CassetteEntry]:
+		"""Return the next recorded entry for a call, or None if it has to go to the model"""
+		if self.mode == 'record':
+			return None
+		with self._lock:
+			if self.match == 'sequence':
+				entries, cursors, cursor_key = self._by_source.get(source, []), self._source_cursor, source
+			else:
+				entries, cursors, cursor_key = self._by_key.get(key, []), self._key_cursor, key
+			index = cursors.get(cursor_key, 0)
+			if index < len(entries):
+				cursors[cursor_key] = index + 1
+				self.hits += 1
+				return entries[index]
+			# Identical prompts asked more often than recorded reuse the last response
+			if entries and self.match == 'prompt':
+				self.hits += 1
+				return entries[-1]
+			self.misses += 1
+		if self.mode == 'replay':
+			raise CassetteMissError(f'No recorded {source} response in {self.path} (key {key[:12]})')
+		return None
+
+	def _delay(self, entry: CassetteEntry) -> float:
+		delay = entry.latency * self.latency_factor
+		self.simulated_latency += delay
+		return delay
+
+	def _start(self, key: str) -> None:
+		with self._lock:
+			self._pending.setdefault(key, []).append(time.perf_counter())
+
+	def _record(self, key: str, source: str, response: str, latency: float) -> None:
+		if self.mode == 'replay':
+			return
+		entry = CassetteEntry(key=key, source=source, response=response, latency=latency, recorded_at=time.time())
+		with self._lock:
+			self._add(entry)
+			# Recorded calls are not replayed again within the same session
+			self._key_cursor[key] = len(self._by_key[key])
+			self._source_cursor[source] = len(self._by_source[source])
+			self.recorded += 1
+			with self.path.open('a', encoding='utf-8') as f:
+				f.write(entry.model_dump_json() + '\n')
+
+	# Generic providers
+
+	async def aplay(self, source: str, request: str, call: Callable[[], Awaitable[str]]) -> str:
+		"""
+		Replay the response for a request, or run `call` and record its response.
+
+		`source` names the provider (e.g. 'gemini') and `request` must contain everything
+		that influences the response, such as the model name and the prompt.
+		"""
+		key = self._key(source, request)
+		entry = self._next(key, source)
+		if entry is not None:
+			delay = self._delay(entry)
+			if delay:
+				await asyncio.sleep(delay)
+			return entry.response
+
+		start = time.perf_counter()
+		response = await call()
+		self._record(key, source, response, time.perf_counter() - start)
+		return response
+
+	# Langchain cache interface
+
+	def attach(self, llm: BaseLanguageModel) -> BaseLanguageModel:
+		"""Make the cassette the cache of a single langchain model"""
+		llm.cache = self
+		return llm
+
+	def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+		key = self._key(LANGCHAIN_SOURCE, prompt, llm_string)
+		entry = self._next(key, LANGCHAIN_SOURCE)
+		if entry is None:
+			self._start(key)
+			return None
+		delay = self._delay(entry)
+		if delay:
+			time.sleep(delay)
+		return _loads_generations(entry.response)
+
+	async def alookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+		key = self._key(LANGCHAIN_SOURCE, prompt, llm_string)
+		entry = self._next(key, LANGCHAIN_SOURCE)
+		if entry is None:
+			self._start(key)
+			return None
+		delay = self._delay(entry)
+		if delay:
+			await asyncio.sleep(delay)
+		return _loads_generations(entry.response)
+
+	def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+		key = self._key(LANGCHAIN_SOURCE, prompt, llm_string)
+		with self._lock:
+			starts = self._pending.get(key)
+			start = starts.pop(0) if starts else time.perf_counter()
+		self._record(key, LANGCHAIN_SOURCE, _dumps_generations(return_val), time.perf_counter() - start)
+
+	async def aupdate(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+		self.update(prompt, llm_string, return_val)
+
+	def clear(self, **kwargs: Any) -> None:
+		with self._lock:
+			self._by_key.clear()
+			self._by_source.clear()
+			self._key_cursor.clear()
+			self._source_cursor.clear()
+			self._pending.clear()
+			if self.path.exists():
+				self.path.write_text('', encoding='utf-8')
+
+	async def aclear(self, **kwargs: Any) -> None:
+		self.clear(**kwargs)
+
+	@property
+	def stats(self) -> dict[str, Any]:
+		return {
+			'hits': self.hits,
+			'misses': self.misses,
+			'recorded': self.recorded,
+			'simulated_latency': round(self.simulated_latency, 4),
+		}
+
+
+def _dumps_generations(generations: Sequence[Generation]) -> str:
+	data = []
+	for generation in generations:
+		item: dict[str, Any] = {'text': generation.text, 'generation_info': generation.generation_info}
+		if isinstance(generation, ChatGeneration):
+			item['message'] = message_to_dict(generation.message)
+		data.append(item)
+	return json.dumps(data, default=str)
+
+
+def _loads_generations(response: str) -> list[Generation]:
+	generations: list[Generation] = []
+	for item in json.loads(response):
+		if 'message' in item:
+			message = messages_from_dict([item['message']])[0]
+			generations.append(ChatGeneration(message=message, generation_info=item['generation_info']))
+		else:
+			generations.append(Generation(text=item['text'], generation_info=item['generation_info']))
+	return generations
@@ -0,0 +1,22 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+CassetteMode = Literal['record', 'replay', 'auto']
+CassetteMatch = Literal['prompt', 'sequence']
+
+
+class CassetteEntry(BaseModel):
+	"""A single recorded LLM call"""
+
+	key: str
+	source: str
+	response: str
+	latency: float
+	recorded_at: float
+
+
+class CassetteMissError(Exception):
+	"""Raised in replay mode when a call has no recorded response"""
+
+	pass
@@ -31,6 +31,7 @@ from browser_use.controller.views import (
 	SwitchTabAction,
 	WaitForElementAction,
 )
+from browser_use.page_store.service import PageStore
 from browser_use.utils import time_execution_sync
 
 logger = logging.getLogger(__name__)
@@ -44,8 +45,13 @@ class Controller(Generic[Context]):
 		self,
 		exclude_actions: list[str] = [],
 		output_model: Optional[Type[BaseModel]] = None,
+		page_store: Optional[PageStore] = None,
+		store_pages_with_cookies: bool = False,
 	):
 		self.registry = Registry[Context](exclude_actions)
+		self.page_store = page_store
+		# Pages of sessions with cookies may be personalized or authenticated, they are only stored when enabled
+		self.store_pages_with_cookies = store_pages_with_cookies
 
 		"""Register all default browser actions"""
 
@@ -310,7 +316,18 @@ class Controller(Generic[Context]):
 			if should_strip_link_urls:
 				strip = ['a', 'img']
 
-			content = markdownify.markdownify(await page.content(), strip=strip)
+			html = await page.content()
+			stored = None
+			if self.page_store and (self.store_pages_with_cookies or not await page.context.cookies()):
+				stored = await asyncio.to_thread(self.page_store.put_rendered, page.url, html)
+			if stored:
+				# Reuses the markdown of identical content extracted before, in this or an earlier run
+				variant = 'markdown-no-links' if should_strip_link_urls else 'markdown'
+				content = await asyncio.to_thread(
+					self.page_store.text, stored, variant, lambda html: markdownify.markdownify(html, strip=strip)
+				)
+			else:
+				content = markdownify.markdownify(html, strip=strip)
 
 			# manually append iframe text into the content so it's readable by the LLM (includes cross-origin iframes)
 			for iframe in page.frames:
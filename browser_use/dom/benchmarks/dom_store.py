@@ -0,0 +1,94 @@
+"""
+Benchmark of DOMStore against the tree of DOMElementNode/DOMTextNode objects built from the same columnar payload:
+construction time, memory held by the result and the common queries.
+
+Usage:
+	python -m browser_use.dom.benchmarks.dom_store --nodes 20000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+from browser_use.dom.benchmarks.wire_format import encode_columnar, synthetic_page
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMElementNode, DOMStore
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+	best = float('inf')
+	for _ in range(repeat):
+		started_at = time.perf_counter()
+		func()
+		best = min(best, time.perf_counter() - started_at)
+	return best
+
+
+def _retained_bytes(build: Callable[[], object]) -> int:
+	gc.collect()
+	tracemalloc.start()
+	try:
+		result = build()
+		gc.collect()
+		retained = tracemalloc.get_traced_memory()[0]
+	finally:
+		tracemalloc.stop()
+	del result
+	return retained
+
+
+def _tree_interactive_in_viewport(root: DOMElementNode) -> list[DOMElementNode]:
+	found = []
+	stack = [root]
+	while stack:
+		node = stack.pop()
+		if isinstance(node, DOMElementNode):
+			if node.is_interactive and node.is_in_viewport:
+				found.append(node)
+			stack.extend(reversed(node.children))
+	return found
+
+
+def measure(nodes: int, repeat: int = 5) -> dict[str, dict[str, float]]:
+	columnar = encode_columnar(synthetic_page(nodes))['columnar']
+	tree, selector_map = DomService._decode_columnar_dom_tree(columnar)
+	store = DOMStore(columnar)
+
+	return {
+		'tree': {
+			'build ms': _best_of(repeat, lambda: DomService._decode_columnar_dom_tree(columnar)) * 1000,
+			'memory KiB': _retained_bytes(lambda: DomService._decode_columnar_dom_tree(columnar)) / 1024,
+			'interactive ms': _best_of(repeat, lambda: _tree_interactive_in_viewport(tree)) * 1000,
+			'texts ms': _best_of(
+				repeat, lambda: [node.get_all_text_till_next_clickable_element() for node in selector_map.values()]
+			)
+			* 1000,
+		},
+		'store': {
+			'build ms': _best_of(repeat, lambda: DOMStore(columnar)) * 1000,
+			'memory KiB': _retained_bytes(lambda: DOMStore(columnar)) / 1024,
+			'interactive ms': _best_of(repeat, store.interactive_in_viewport) * 1000,
+			'texts ms': _best_of(repeat, store.texts_till_next_clickable) * 1000,
+		},
+	}
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description='Compare DOMStore with the DOMElementNode tree')
+	parser.add_argument('--nodes', type=int, nargs='+', default=[1_000, 20_000], help='Synthetic page sizes')
+	parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement, the fastest is reported')
+	args = parser.parse_args(argv)
+
+	columns = ('build ms', 'memory KiB', 'interactive ms', 'texts ms')
+	print(f'{"":<6} {"nodes":>7} ' + ' '.join(f'{column:>14}' for column in columns))
+	for nodes in args.nodes:
+		for name, results in measure(nodes, args.repeat).items():
+			print(f'{name:<6} {nodes:>7} ' + ' '.join(f'{results[column]:>14.1f}' for column in columns))
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Microbenchmark of hashing every selector map element of a state, as Agent.multi_act does after each refresh,
+against the previous scheme: a walk to the root and three SHA-256 digests per element.
+
+Usage:
+	python -m browser_use.dom.benchmarks.element_hashing --nodes 20000 --depths 10 50 200
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from typing import Optional
+
+from browser_use.dom.benchmarks.prompt_serializer import synthetic_tree
+from browser_use.dom.history_tree_processor.service import HistoryTreeProcessor
+from browser_use.dom.history_tree_processor.view import HashedDomElement
+from browser_use.dom.views import DOMElementNode
+
+
+def legacy_hash_dom_element(dom_element: DOMElementNode) -> HashedDomElement:
+	"""HistoryTreeProcessor._hash_dom_element before the incremental hashing"""
+	parent_branch_path = HistoryTreeProcessor._get_parent_branch_path(dom_element)
+	branch_path_hash = hashlib.sha256('/'.join(parent_branch_path).encode()).hexdigest()
+	attributes_string = ''.join(f'{key}={value}' for key, value in dom_element.attributes.items())
+	attributes_hash = hashlib.sha256(attributes_string.encode()).hexdigest()
+	xpath_hash = hashlib.sha256(dom_element.xpath.encode()).hexdigest()
+	return HashedDomElement(branch_path_hash, attributes_hash, xpath_hash)
+
+
+def selector_map(root: DOMElementNode) -> list[DOMElementNode]:
+	elements = []
+	stack = [root]
+	while stack:
+		node = stack.pop()
+		if isinstance(node, DOMElementNode):
+			if node.highlight_index is not None:
+				elements.append(node)
+			stack.extend(node.children)
+	return elements
+
+
+def measure(nodes: int, depth: int, repeat: int = 3) -> tuple[int, float, float]:
+	"""Number of selector map elements and the best seconds to hash all of them, legacy and incremental"""
+	legacy = incremental = float('inf')
+	for _ in range(repeat):
+		# A fresh tree every time: the incremental hashes are memoized on the elements
+		elements = selector_map(synthetic_tree(nodes, depth))
+		started_at = time.perf_counter()
+		for element in elements:
+			legacy_hash_dom_element(element)
+		legacy = min(legacy, time.perf_counter() - started_at)
+
+		started_at = time.perf_counter()
+		for element in elements:
+			HistoryTreeProcessor._hash_dom_element(element)
+		incremental = min(incremental, time.perf_counter() - started_at)
+	return len(elements), legacy, incremental
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description='Compare incremental element hashing with the SHA-256 walk to the root')
+	parser.add_argument('--nodes', type=int, nargs='+', default=[1_000, 20_000], help='Synthetic tree sizes')
+	parser.add_argument('--depths', type=int, nargs='+', default=[10, 50, 200], help='Synthetic tree depths')
+	parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement, the fastest is reported')
+	args = parser.parse_args(argv)
+
+	print(f'{"nodes":>7} {"depth":>6} {"elements":>9} {"legacy ms":>10} {"incremental ms":>15} {"speedup":>8}')
+	for nodes in args.nodes:
+		for depth in args.depths:
+			elements, legacy, incremental = measure(nodes, depth, args.repeat)
+			print(
+				f'{nodes:>7} {depth:>6} {elements:>9} {legacy * 1000:>10.2f} {incremental * 1000:>15.2f} '
+				f'{legacy / incremental:>7.1f}x'
+			)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
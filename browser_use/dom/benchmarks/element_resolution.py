@@ -0,0 +1,86 @@
+"""
+Benchmark of BrowserContext.get_locate_element: resolving a highlight index through the registry buildDomTree.js
+keeps in the page, against locating it with the generated CSS selector. Needs a local Chromium.
+
+Usage:
+	python -m browser_use.dom.benchmarks.element_resolution --elements 500 --lookups 200
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import Optional
+
+from browser_use.browser.browser import Browser, BrowserConfig
+from browser_use.browser.context import BrowserContext
+
+
+def synthetic_html(elements: int) -> str:
+	"""A page of product cards whose buttons carry dynamic-looking classes and attributes"""
+	cards = []
+	for i in range(elements):
+		cards.append(
+			f'<div class="card card-{i % 7} css-{i:x}a9f"><h3>Product {i}</h3>'
+			f'<button class="btn btn-primary css-{i:x}b2c" data-reactid=".0.{i}" aria-label="Add product {i}">Add</button>'
+			f'<a href="/product/{i}" class="link">Details</a></div>'
+		)
+	return f'<html><body><main>{"".join(cards)}</main></body></html>'
+
+
+async def _time_lookups(context: BrowserContext, indices: list[int], registry: bool) -> list[float]:
+	selector_map = await context.get_selector_map()
+	if not registry:
+
+		async def no_registry(page, element):
+			return None
+
+		context._get_registered_element = no_registry  # type: ignore[method-assign]
+
+	durations = []
+	for index in indices:
+		started_at = time.perf_counter()
+		element_handle = await context.get_locate_element(selector_map[index])
+		durations.append(time.perf_counter() - started_at)
+		if element_handle is None:
+			raise AssertionError(f'Element {index} was not found')
+	if not registry:
+		del context._get_registered_element
+	return durations
+
+
+async def run(elements: int, lookups: int, seed: int = 0) -> dict[str, list[float]]:
+	browser = Browser(config=BrowserConfig(headless=True))
+	try:
+		async with await browser.new_context() as context:
+			page = await context.get_current_page()
+			await page.set_content(synthetic_html(elements))
+			await context.get_state(include_screenshot=False)
+
+			indices = random.Random(seed).choices(range(len(await context.get_selector_map())), k=lookups)
+			return {
+				'selector': await _time_lookups(context, indices, registry=False),
+				'registry': await _time_lookups(context, indices, registry=True),
+			}
+	finally:
+		await browser.close()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description='Compare element resolution through the page registry and CSS selectors')
+	parser.add_argument('--elements', type=int, default=500, help='Product cards on the synthetic page')
+	parser.add_argument('--lookups', type=int, default=200, help='Elements to locate per method')
+	args = parser.parse_args(argv)
+
+	results = asyncio.run(run(args.elements, args.lookups))
+	print(f'{"method":<10} {"median ms":>10} {"p95 ms":>8}')
+	for method, durations in results.items():
+		p95 = statistics.quantiles(durations, n=20)[-1]
+		print(f'{method:<10} {statistics.median(durations) * 1000:>10.2f} {p95 * 1000:>8.2f}')
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Benchmark of DOMElementNode.clickable_elements_to_string against the recursive implementation it replaced, which
+walked up to the root for every text node and re-walked the subtree of every highlighted element.
+
+Both run on synthetic trees of increasing depth and must produce the same string.
+
+Usage:
+	python -m browser_use.dom.benchmarks.prompt_serializer --nodes 20000 --depths 10 50 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import Callable, Optional
+
+from browser_use.dom.views import DOMBaseNode, DOMElementNode, DOMTextNode
+
+INCLUDE_ATTRIBUTES = ['title', 'type', 'name', 'role', 'aria-label', 'placeholder', 'value', 'alt']
+
+
+def synthetic_tree(nodes: int = 20_000, depth: int = 50, seed: int = 0) -> DOMElementNode:
+	"""A tree of about this many nodes made of nested containers this deep, with links, buttons and text throughout"""
+	rng = random.Random(seed)
+	root = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	count = 1
+	highlight_index = 0
+
+	def add(node: DOMBaseNode, parent: DOMElementNode) -> None:
+		nonlocal count
+		node.parent = parent
+		parent.children.append(node)
+		count += 1
+
+	while count < nodes:
+		parent = root
+		for level in range(depth):
+			if count >= nodes:
+				break
+			container = DOMElementNode(
+				tag_name='div', xpath=f'{parent.xpath}/div', attributes={}, children=[], is_visible=True, parent=None
+			)
+			add(container, parent)
+			if rng.random() < 0.5:
+				add(DOMTextNode(text=f'Level {level} text', is_visible=rng.random() < 0.9, parent=None), container)
+			if rng.random() < 0.3:
+				link = DOMElementNode(
+					tag_name=rng.choice(('a', 'button')),
+					xpath=f'{container.xpath}/a',
+					attributes={'title': f'Item {count}', 'role': 'link', 'aria-label': f'Open item {count}'},
+					children=[],
+					is_visible=True,
+					highlight_index=highlight_index,
+					parent=None,
+				)
+				highlight_index += 1
+				add(link, container)
+				add(DOMTextNode(text=f'Item {count}', is_visible=True, parent=None), link)
+				# Some clickables wrap the rest of the branch, so their text stops at the next clickable
+				if rng.random() < 0.3:
+					container = link
+			parent = container
+	return root
+
+
+def legacy_clickable_elements_to_string(root: DOMElementNode, include_attributes: list[str] | None = None) -> str:
+	"""DOMElementNode.clickable_elements_to_string before the single-pass serializer"""
+	formatted_text = []
+
+	def process_node(node: DOMBaseNode, depth: int) -> None:
+		if isinstance(node, DOMElementNode):
+			if node.highlight_index is not None:
+				attributes_str = ''
+				text = node.get_all_text_till_next_clickable_element()
+				if include_attributes:
+					attributes = list(
+						set(
+							[
+								str(value)
+								for key, value in node.attributes.items()
+								if key in include_attributes and value != node.tag_name
+							]
+						)
+					)
+					if text in attributes:
+						attributes.remove(text)
+					attributes_str = ';'.join(attributes)
+				line = f'[{node.highlight_index}]<{node.tag_name} '
+				if attributes_str:
+					line += f'{attributes_str}'
+				if text:
+					if attributes_str:
+						line += f'>{text}'
+					else:
+						line += f'{text}'
+				line += '/>'
+				formatted_text.append(line)
+
+			for child in node.children:
+				process_node(child, depth + 1)
+
+		elif isinstance(node, DOMTextNode):
+			if not node.has_parent_with_highlight_index() and node.is_visible:
+				formatted_text.append(f'{node.text}')
+
+	process_node(root, 0)
+	return '\n'.join(formatted_text)
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+	best = float('inf')
+	for _ in range(repeat):
+		started_at = time.perf_counter()
+		func()
+		best = min(best, time.perf_counter() - started_at)
+	return best
+
+
+def measure(nodes: int, depth: int, repeat: int = 3) -> tuple[float, float]:
+	"""Seconds taken by the legacy and the single-pass serializer on one synthetic tree"""
+	root = synthetic_tree(nodes, depth)
+	expected = legacy_clickable_elements_to_string(root, INCLUDE_ATTRIBUTES)
+	if root.clickable_elements_to_string(INCLUDE_ATTRIBUTES) != expected:
+		raise AssertionError(f'Serializers disagree on the tree with {nodes} nodes and depth {depth}')
+
+	return (
+		_best_of(repeat, lambda: legacy_clickable_elements_to_string(root, INCLUDE_ATTRIBUTES)),
+		_best_of(repeat, lambda: root.clickable_elements_to_string(INCLUDE_ATTRIBUTES)),
+	)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description='Compare the single-pass and the legacy prompt serializer')
+	parser.add_argument('--nodes', type=int, nargs='+', default=[1_000, 20_000], help='Synthetic tree sizes')
+	parser.add_argument('--depths', type=int, nargs='+', default=[10, 50, 200], help='Synthetic tree depths')
+	parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement, the fastest is reported')
+	args = parser.parse_args(argv)
+
+	sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * max(args.depths)))
+	print(f'{"nodes":>7} {"depth":>6} {"legacy ms":>10} {"single ms":>10} {"speedup":>8}')
+	for nodes in args.nodes:
+		for depth in args.depths:
+			legacy, single_pass = measure(nodes, depth, args.repeat)
+			print(f'{nodes:>7} {depth:>6} {legacy * 1000:>10.1f} {single_pass * 1000:>10.1f} {legacy / single_pass:>7.1f}x')
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Benchmark of the two wire formats of buildDomTree.js: the map of verbose per-node objects and the columnar format.
+
+A synthetic page is encoded in both formats, then each payload is serialized to JSON (what crosses CDP),
+parsed back and turned into the Python tree by DomService.
+
+Usage:
+	python -m browser_use.dom.benchmarks.wire_format --nodes 20000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from browser_use.dom.service import DomService
+from browser_use.dom.views import (
+	FLAG_HAS_ATTRIBUTES,
+	FLAG_HIGHLIGHTED,
+	FLAG_IN_VIEWPORT,
+	FLAG_INTERACTIVE,
+	FLAG_SHADOW_ROOT,
+	FLAG_TOP_ELEMENT,
+	FLAG_VISIBLE,
+)
+
+CONTAINER_TAGS = ('div', 'section', 'article', 'li', 'ul', 'nav', 'span')
+INTERACTIVE_TAGS = ('a', 'button', 'input', 'select')
+
+
+def synthetic_page(nodes: int = 20_000, seed: int = 0) -> dict:
+	"""A buildDomTree.js result in the map format with about this many nodes, shaped like a long listing page"""
+	rng = random.Random(seed)
+	node_map: dict[str, dict] = {}
+	next_id = 0
+	highlight_index = 0
+
+	def add(node_data: dict) -> str:
+		nonlocal next_id
+		node_id = str(next_id)
+		next_id += 1
+		node_map[node_id] = node_data
+		return node_id
+
+	def build(xpath: str, depth: int) -> str:
+		nonlocal highlight_index
+		children = []
+		sibling_counts: dict[str, int] = {}
+		for _ in range(rng.randint(2, 5)):
+			if len(node_map) >= nodes:
+				break
+			if depth >= 6 or rng.random() < 0.3:
+				children.append(add({'type': 'TEXT_NODE', 'text': f'Item text {rng.randint(0, 10_000)}', 'isVisible': True}))
+				continue
+
+			tag = rng.choice(INTERACTIVE_TAGS if rng.random() < 0.25 else CONTAINER_TAGS)
+			sibling_counts[tag] = sibling_counts.get(tag, 0) + 1
+			step = tag if sibling_counts[tag] == 1 else f'{tag}[{sibling_counts[tag]}]'
+			child_xpath = f'{xpath}/{step}'
+			if tag in INTERACTIVE_TAGS:
+				node_data = {
+					'tagName': tag,
+					'xpath': child_xpath,
+					'attributes': {'href': f'/item/{next_id}', 'class': 'card-link', 'aria-label': f'Item {next_id}'},
+					'children': [add({'type': 'TEXT_NODE', 'text': f'Open item {next_id}', 'isVisible': True})],
+					'isVisible': True,
+					'isTopElement': True,
+					'isInteractive': True,
+					'isInViewport': True,
+					'highlightIndex': highlight_index,
+				}
+				highlight_index += 1
+				children.append(add(node_data))
+			else:
+				children.append(build(child_xpath, depth + 1))
+
+		return add(
+			{
+				'tagName': xpath.rsplit('/', 1)[-1].split('[')[0],
+				'xpath': xpath,
+				'attributes': {},
+				'children': children,
+				'isVisible': True,
+				'isTopElement': depth < 3,
+				'shadowRoot': depth == 2 and rng.random() < 0.05,
+			}
+		)
+
+	body_children = []
+	while len(node_map) < nodes:
+		body_children.append(build(f'html/body/div[{len(body_children) + 1}]', 1))
+	root_id = add({'tagName': 'body', 'attributes': {}, 'xpath': '/body', 'children': body_children})
+	return {'rootId': root_id, 'map': node_map}
+
+
+def encode_columnar(eval_page: dict) -> dict:
+	"""The columnar encoding of a map format result, as encodeColumnar in buildDomTree.js produces it"""
+	node_map = eval_page['map']
+	tables: dict[str, list] = {'tags': [], 'attributeNames': [], 'xpathSegments': []}
+	indexes: dict[str, dict] = {table: {} for table in tables}
+
+	def intern(table: str, value: str) -> int:
+		if value not in indexes[table]:
+			indexes[table][value] = len(tables[table])
+			tables[table].append(value)
+		return indexes[table][value]
+
+	columns: dict[str, list] = {
+		'tag': [],
+		'parent': [],
+		'flags': [],
+		'xpath': [],
+		'attributes': [],
+		'highlightIndex': [],
+		'text': [],
+	}
+	xpaths: list[Optional[str]] = []
+	stack = [(str(eval_page['rootId']), -1)]
+	while stack:
+		node_id, parent = stack.pop()
+		node_data = node_map[node_id]
+		position = len(columns['tag'])
+		columns['parent'].append(parent)
+
+		if node_data.get('type') == 'TEXT_NODE':
+			columns['tag'].append(-1)
+			columns['flags'].append(FLAG_VISIBLE if node_data['isVisible'] else 0)
+			columns['text'].append(node_data['text'])
+			xpaths.append(None)
+			continue
+
+		columns['tag'].append(intern('tags', node_data['tagName']))
+		flags = 0
+		for key, flag in (
+			('isVisible', FLAG_VISIBLE),
+			('isInteractive', FLAG_INTERACTIVE),
+			('isTopElement', FLAG_TOP_ELEMENT),
+			('isInViewport', FLAG_IN_VIEWPORT),
+			('shadowRoot', FLAG_SHADOW_ROOT),
+		):
+			if node_data.get(key):
+				flags |= flag
+		if node_data['attributes']:
+			flags |= FLAG_HAS_ATTRIBUTES
+			pairs = []
+			for name, value in node_data['attributes'].items():
+				pairs += [intern('attributeNames', name), value]
+			columns['attributes'].append(pairs)
+		if node_data.get('highlightIndex') is not None:
+			flags |= FLAG_HIGHLIGHTED
+			columns['highlightIndex'].append(node_data['highlightIndex'])
+		columns['flags'].append(flags)
+
+		parent_xpath = xpaths[parent] if parent >= 0 else None
+		xpath = node_data['xpath']
+		if parent_xpath is not None and xpath.startswith(parent_xpath + '/') and '/' not in xpath[len(parent_xpath) + 1 :]:
+			columns['xpath'].append(intern('xpathSegments', xpath[len(parent_xpath) + 1 :]))
+		else:
+			columns['xpath'].append(xpath)
+		xpaths.append(xpath)
+
+		stack.extend((str(child_id), position) for child_id in reversed(node_data['children']))
+
+	return {'columnar': {**tables, **columns}}
+
+
+@dataclass
+class WireFormatResult:
+	wire_format: str
+	nodes: int
+	payload_bytes: int
+	parse_seconds: float
+	build_seconds: float
+
+	@property
+	def total_seconds(self) -> float:
+		return self.parse_seconds + self.build_seconds
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+	best = float('inf')
+	for _ in range(repeat):
+		started_at = time.perf_counter()
+		func()
+		best = min(best, time.perf_counter() - started_at)
+	return best
+
+
+def measure(eval_page: dict, wire_format: str, repeat: int = 5) -> WireFormatResult:
+	payload = json.dumps(encode_columnar(eval_page) if wire_format == 'columnar' else eval_page, separators=(',', ':'))
+	parsed = json.loads(payload)
+	loop = asyncio.new_event_loop()
+
+	def build() -> None:
+		if wire_format == 'columnar':
+			DomService._decode_columnar_dom_tree(parsed['columnar'])
+		else:
+			loop.run_until_complete(DomService(page=None)._construct_dom_tree(parsed))  # type: ignore[arg-type]
+
+	try:
+		return WireFormatResult(
+			wire_format=wire_format,
+			nodes=len(eval_page['map']),
+			payload_bytes=len(payload.encode()),
+			parse_seconds=_best_of(repeat, lambda: json.loads(payload)),
+			build_seconds=_best_of(repeat, build),
+		)
+	finally:
+		loop.close()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description='Compare the map and columnar wire formats of buildDomTree.js')
+	parser.add_argument('--nodes', type=int, nargs='+', default=[1_000, 20_000], help='Synthetic page sizes')
+	parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement, the fastest is reported')
+	args = parser.parse_args(argv)
+
+	print(f'{"format":<10} {"nodes":>7} {"bytes":>11} {"parse ms":>9} {"build ms":>9} {"total ms":>9}')
+	for nodes in args.nodes:
+		eval_page = synthetic_page(nodes)
+		for wire_format in ('map', 'columnar'):
+			result = measure(eval_page, wire_format, args.repeat)
+			print(
+				f'{result.wire_format:<10} {result.nodes:>7} {result.payload_bytes:>11,} '
+				f'{result.parse_seconds * 1000:>9.1f} {result.build_seconds * 1000:>9.1f} {result.total_seconds * 1000:>9.1f}'
+			)
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -4,11 +4,114 @@
     focusHighlightIndex: -1,
     viewportExpansion: 0,
     debugMode: false,
+    previousExtractionId: null,
+    wireFormat: 'map',
   }
 ) => {
-  const { doHighlightElements, focusHighlightIndex, viewportExpansion, debugMode } = args;
+  const { doHighlightElements, focusHighlightIndex, viewportExpansion, debugMode, previousExtractionId, wireFormat } = args;
   let highlightIndex = 0; // Reset highlight index
 
+  const HIGHLIGHT_CONTAINER_ID = "playwright-highlight-container";
+
+  /**
+   * Extraction state that outlives a single call. A MutationObserver marks the subtrees that changed
+   * since the last extraction dirty, so clean elements can reuse their cached records and an unchanged
+   * page can skip the extraction entirely.
+   */
+  function createIncrementalState() {
+    const state = {
+      sessionId: Math.random().toString(36).slice(2),
+      lastExtractionId: null,
+      lastArgsKey: null,
+      lastFingerprint: null,
+      // [element, highlightIndex, parentIframe] of every interactive element of the last extraction, at its
+      // highlight index. Actions resolve their element through it (RESOLVE_HIGHLIGHTED_ELEMENT_JS).
+      interactiveElements: [],
+      changed: true,
+      // Extractions so far. Records remember the extraction that built them, dirty subtree roots the
+      // last extraction before their mutation: a record is stale if an ancestor changed after it was built.
+      generation: 0,
+      dirtyAt: new WeakMap(),
+      // element -> { generation, tagName, xpath, attributes }
+      records: new WeakMap(),
+      // getComputedStyle returns live objects, they stay correct across calls
+      computedStyles: new WeakMap(),
+      observedRoots: new WeakSet(),
+      observer: null,
+    };
+
+    function isHighlightNode(node) {
+      return node.nodeType === Node.ELEMENT_NODE &&
+        (node.id === HIGHLIGHT_CONTAINER_ID || !!node.closest?.(`#${HIGHLIGHT_CONTAINER_ID}`));
+    }
+
+    // The extraction only visits body and what is below it, changes elsewhere (e.g. stylesheets in <head>)
+    // can restyle anything
+    function dirtyRootOf(node) {
+      if (node.nodeType === Node.DOCUMENT_FRAGMENT_NODE && node.host) return node.host;
+      if (node.nodeType === Node.DOCUMENT_NODE) {
+        return node === document ? document.body : node.defaultView?.frameElement;
+      }
+      if (node.getRootNode?.() === document && node !== document.body && !document.body?.contains(node)) {
+        return document.body;
+      }
+      return node;
+    }
+
+    state.markChanged = (node) => {
+      state.changed = true;
+      const root = dirtyRootOf(node);
+      if (root) state.dirtyAt.set(root, state.generation);
+    };
+
+    state.markDirty = (mutations) => {
+      for (const mutation of mutations) {
+        // Our own highlight overlays do not change the page
+        if (mutation.type === 'attributes' && mutation.attributeName === 'browser-user-highlight-id') continue;
+        if (isHighlightNode(mutation.target)) continue;
+        if (
+          mutation.type === 'childList' &&
+          [...mutation.addedNodes, ...mutation.removedNodes].every(isHighlightNode)
+        ) continue;
+
+        // Attribute changes can restyle siblings (e.g. `.open + ul`), text changes only affect their element
+        state.markChanged(mutation.type === 'childList' ? mutation.target : mutation.target.parentNode || mutation.target);
+      }
+    };
+    state.observer = new MutationObserver(state.markDirty);
+    state.observe = (root) => {
+      if (!root || state.observedRoots.has(root)) return;
+      state.observedRoots.add(root);
+      state.observer.observe(root, { subtree: true, childList: true, attributes: true, characterData: true });
+    };
+    state.observe(document);
+    return state;
+  }
+
+  // Limitation: there is no dirty-subtree pruning. Once anything changed, the pass below still walks all of
+  // document.body and re-runs the geometry checks (visibility, top element, viewport) on every node, since a
+  // clean subtree can still move. Only the per-element records (tag, xpath, attributes) of clean subtrees and
+  // the computed styles are reused; the walk itself is skipped only by the unchanged fast path.
+  const INCREMENTAL = window.__browserUseIncrementalDom || (window.__browserUseIncrementalDom = createIncrementalState());
+  INCREMENTAL.markDirty(INCREMENTAL.observer.takeRecords());
+
+  /**
+   * Cheap summary of the layout: scroll position, viewport and document size, and the boxes of the
+   * interactive elements. Catches layout changes that are not DOM mutations (resizes, animations).
+   */
+  function layoutFingerprint(interactiveElements) {
+    const root = document.documentElement;
+    const parts = [window.scrollX, window.scrollY, window.innerWidth, window.innerHeight, root.scrollWidth, root.scrollHeight];
+    for (const [element] of interactiveElements) {
+      if (!element.isConnected) return null;
+      const rect = element.getBoundingClientRect();
+      parts.push(rect.top, rect.left, rect.width, rect.height);
+    }
+    return parts.join(',');
+  }
+
+  const argsKey = `${doHighlightElements}|${viewportExpansion}`;
+
   // Add timing stack to handle recursion
   const TIMING_STACK = {
     nodeProcessing: [],
@@ -102,10 +205,9 @@
   // Add caching mechanisms at the top level
   const DOM_CACHE = {
     boundingRects: new WeakMap(),
-    computedStyles: new WeakMap(),
+    computedStyles: INCREMENTAL.computedStyles,
     clearCache: () => {
       DOM_CACHE.boundingRects = new WeakMap();
-      DOM_CACHE.computedStyles = new WeakMap();
     }
   };
 
@@ -185,8 +287,6 @@
 
   const ID = { current: 0 };
 
-  const HIGHLIGHT_CONTAINER_ID = "playwright-highlight-container";
-
   /**
    * Highlights an element in the DOM and returns the index of the next element.
    */
@@ -809,8 +909,9 @@
   /**
    * Creates a node data object for a given node and its descendants.
    */
-  function buildDomTree(node, parentIframe = null) {
+  function buildDomTree(node, parentIframe = null, parentDirtyAt = -1) {
     if (debugMode) PERF_METRICS.nodeMetrics.totalNodes++;
+    const dirtyAt = Math.max(parentDirtyAt, node ? INCREMENTAL.dirtyAt.get(node) ?? -1 : -1);
 
     if (!node || node.id === HIGHLIGHT_CONTAINER_ID) {
       if (debugMode) PERF_METRICS.nodeMetrics.skippedNodes++;
@@ -828,7 +929,7 @@
 
       // Process children of body
       for (const child of node.childNodes) {
-        const domElement = buildDomTree(child, parentIframe);
+        const domElement = buildDomTree(child, parentIframe, dirtyAt);
         if (domElement) nodeData.children.push(domElement);
       }
 
@@ -897,22 +998,35 @@
       }
     }
 
+    // Tag, xpath and attributes only change with DOM mutations, reuse them outside dirty subtrees
+    let record = INCREMENTAL.records.get(node);
+    if (!record || record.generation <= dirtyAt) {
+      const tagName = node.tagName.toLowerCase();
+      record = {
+        generation: INCREMENTAL.generation,
+        tagName,
+        xpath: getXPathTree(node, true),
+        attributes: {},
+      };
+
+      // Get attributes for interactive elements or potential text containers
+      if (isInteractiveCandidate(node) || tagName === 'iframe' || tagName === 'body') {
+        const attributeNames = node.getAttributeNames?.() || [];
+        for (const name of attributeNames) {
+          record.attributes[name] = node.getAttribute(name);
+        }
+      }
+      INCREMENTAL.records.set(node, record);
+    }
+
     // Process element node
     const nodeData = {
-      tagName: node.tagName.toLowerCase(),
-      attributes: {},
-      xpath: getXPathTree(node, true),
+      tagName: record.tagName,
+      attributes: { ...record.attributes },
+      xpath: record.xpath,
       children: [],
     };
 
-    // Get attributes for interactive elements or potential text containers
-    if (isInteractiveCandidate(node) || node.tagName.toLowerCase() === 'iframe' || node.tagName.toLowerCase() === 'body') {
-      const attributeNames = node.getAttributeNames?.() || [];
-      for (const name of attributeNames) {
-        nodeData.attributes[name] = node.getAttribute(name);
-      }
-    }
-
     // if (isInteractiveCandidate(node)) {
 
     // Check interactivity
@@ -925,6 +1039,7 @@
           if (nodeData.isInteractive) {
             nodeData.isInViewport = true;
             nodeData.highlightIndex = highlightIndex++;
+            interactiveElements.push([node, nodeData.highlightIndex, parentIframe]);
 
             if (doHighlightElements) {
               if (focusHighlightIndex >= 0) {
@@ -949,8 +1064,14 @@
         try {
           const iframeDoc = node.contentDocument || node.contentWindow?.document;
           if (iframeDoc) {
+            if (!INCREMENTAL.observedRoots.has(node)) {
+              // A navigating iframe replaces its document without a mutation in ours
+              INCREMENTAL.observedRoots.add(node);
+              node.addEventListener('load', () => INCREMENTAL.markChanged(node));
+            }
+            INCREMENTAL.observe(iframeDoc);
             for (const child of iframeDoc.childNodes) {
-              const domElement = buildDomTree(child, node);
+              const domElement = buildDomTree(child, node, dirtyAt);
               if (domElement) nodeData.children.push(domElement);
             }
           }
@@ -968,7 +1089,7 @@
       ) {
         // Process all child nodes to capture formatted text
         for (const child of node.childNodes) {
-          const domElement = buildDomTree(child, parentIframe);
+          const domElement = buildDomTree(child, parentIframe, dirtyAt);
           if (domElement) nodeData.children.push(domElement);
         }
       }
@@ -976,14 +1097,16 @@
         // Handle shadow DOM
         if (node.shadowRoot) {
           nodeData.shadowRoot = true;
+          // Mutations inside shadow roots are not reported to observers of the document
+          INCREMENTAL.observe(node.shadowRoot);
           for (const child of node.shadowRoot.childNodes) {
-            const domElement = buildDomTree(child, parentIframe);
+            const domElement = buildDomTree(child, parentIframe, dirtyAt);
             if (domElement) nodeData.children.push(domElement);
           }
         }
         // Handle regular elements
         for (const child of node.childNodes) {
-          const domElement = buildDomTree(child, parentIframe);
+          const domElement = buildDomTree(child, parentIframe, dirtyAt);
           if (domElement) nodeData.children.push(domElement);
         }
       }
@@ -1001,6 +1124,98 @@
     return id;
   }
 
+  // Bits of the columnar flags column, mirrored in browser_use/dom/views.py
+  const FLAG_VISIBLE = 1;
+  const FLAG_INTERACTIVE = 2;
+  const FLAG_TOP_ELEMENT = 4;
+  const FLAG_IN_VIEWPORT = 8;
+  const FLAG_SHADOW_ROOT = 16;
+  const FLAG_HAS_ATTRIBUTES = 32;
+  const FLAG_HIGHLIGHTED = 64;
+
+  /**
+   * Encodes the tree below rootId as parallel arrays instead of one verbose object per node.
+   * Nodes are in document order, so every parent comes before its children. tag, parent and flags
+   * have one entry per node (tag -1 for text nodes); xpath, attributes, highlightIndex and text only
+   * have entries for the nodes that carry them, in the same order. Tag names, attribute names and
+   * xpath segments are interned: an xpath that extends its parent's by one step is sent as the index
+   * of that last step, any other xpath as a string.
+   */
+  function encodeColumnar(rootId) {
+    const tables = { tags: [], attributeNames: [], xpathSegments: [] };
+    const indexes = { tags: new Map(), attributeNames: new Map(), xpathSegments: new Map() };
+    const intern = (table, value) => {
+      let index = indexes[table].get(value);
+      if (index === undefined) {
+        index = tables[table].length;
+        tables[table].push(value);
+        indexes[table].set(value, index);
+      }
+      return index;
+    };
+
+    const columns = { tag: [], parent: [], flags: [], xpath: [], attributes: [], highlightIndex: [], text: [] };
+    const xpaths = [];
+    // [id, parent position] pairs, children pushed in reverse so they come out in order
+    const stack = rootId === null ? [] : [[rootId, -1]];
+    while (stack.length) {
+      const [id, parent] = stack.pop();
+      const nodeData = DOM_HASH_MAP[id];
+      const position = columns.tag.length;
+      columns.parent.push(parent);
+
+      if (nodeData.type === "TEXT_NODE") {
+        columns.tag.push(-1);
+        columns.flags.push(nodeData.isVisible ? FLAG_VISIBLE : 0);
+        columns.text.push(nodeData.text);
+        xpaths.push(null);
+        continue;
+      }
+
+      columns.tag.push(intern("tags", nodeData.tagName));
+      let flags = 0;
+      if (nodeData.isVisible) flags |= FLAG_VISIBLE;
+      if (nodeData.isInteractive) flags |= FLAG_INTERACTIVE;
+      if (nodeData.isTopElement) flags |= FLAG_TOP_ELEMENT;
+      if (nodeData.isInViewport) flags |= FLAG_IN_VIEWPORT;
+      if (nodeData.shadowRoot) flags |= FLAG_SHADOW_ROOT;
+
+      const names = Object.keys(nodeData.attributes);
+      if (names.length) {
+        flags |= FLAG_HAS_ATTRIBUTES;
+        const attributes = [];
+        for (const name of names) attributes.push(intern("attributeNames", name), nodeData.attributes[name]);
+        columns.attributes.push(attributes);
+      }
+      if (nodeData.highlightIndex !== undefined) {
+        flags |= FLAG_HIGHLIGHTED;
+        columns.highlightIndex.push(nodeData.highlightIndex);
+      }
+      columns.flags.push(flags);
+
+      const parentXpath = parent >= 0 ? xpaths[parent] : null;
+      const xpath = nodeData.xpath;
+      if (
+        parentXpath !== null &&
+        xpath.length > parentXpath.length + 1 &&
+        xpath.startsWith(parentXpath) &&
+        xpath[parentXpath.length] === "/" &&
+        !xpath.includes("/", parentXpath.length + 1)
+      ) {
+        columns.xpath.push(intern("xpathSegments", xpath.slice(parentXpath.length + 1)));
+      } else {
+        columns.xpath.push(xpath);
+      }
+      xpaths.push(xpath);
+
+      for (let i = nodeData.children.length - 1; i >= 0; i--) {
+        stack.push([nodeData.children[i], position]);
+      }
+    }
+
+    return { ...tables, ...columns };
+  }
+
   // After all functions are defined, wrap them with performance measurement
   // Remove buildDomTree from here as we measure it separately
   highlightElement = measureTime(highlightElement);
@@ -1011,11 +1226,40 @@
   isTextNodeVisible = measureTime(isTextNodeVisible);
   getEffectiveScroll = measureTime(getEffectiveScroll);
 
+  // Nothing changed since the previous extraction: redraw its highlights and let the caller reuse its result
+  if (
+    previousExtractionId &&
+    previousExtractionId === INCREMENTAL.lastExtractionId &&
+    !INCREMENTAL.changed &&
+    argsKey === INCREMENTAL.lastArgsKey &&
+    layoutFingerprint(INCREMENTAL.interactiveElements) === INCREMENTAL.lastFingerprint
+  ) {
+    if (doHighlightElements) {
+      for (const [element, index, parentIframe] of INCREMENTAL.interactiveElements) {
+        if (focusHighlightIndex < 0 || focusHighlightIndex === index) {
+          highlightElement(element, index, parentIframe);
+        }
+      }
+    }
+    INCREMENTAL.markDirty(INCREMENTAL.observer.takeRecords());
+    return { unchanged: true, extractionId: INCREMENTAL.lastExtractionId };
+  }
+
+  const interactiveElements = [];
+  INCREMENTAL.generation++;
   const rootId = buildDomTree(document.body);
 
   // Clear the cache before starting
   DOM_CACHE.clearCache();
 
+  INCREMENTAL.lastExtractionId = `${INCREMENTAL.sessionId}-${INCREMENTAL.generation}`;
+  INCREMENTAL.lastArgsKey = argsKey;
+  INCREMENTAL.interactiveElements = interactiveElements;
+  INCREMENTAL.lastFingerprint = layoutFingerprint(interactiveElements);
+  INCREMENTAL.markDirty(INCREMENTAL.observer.takeRecords());
+  INCREMENTAL.changed = false;
+  const extractionId = INCREMENTAL.lastExtractionId;
+
   // Only process metrics in debug mode
   if (debugMode && PERF_METRICS) {
     // Convert timings to seconds and add useful derived metrics
@@ -1066,7 +1310,9 @@
     }
   }
 
-  return debugMode ?
-    { rootId, map: DOM_HASH_MAP, perfMetrics: PERF_METRICS } :
-    { rootId, map: DOM_HASH_MAP };
+  const result = wireFormat === 'columnar' ?
+    { columnar: encodeColumnar(rootId), extractionId } :
+    { rootId, map: DOM_HASH_MAP, extractionId };
+  if (debugMode) result.perfMetrics = PERF_METRICS;
+  return result;
 };
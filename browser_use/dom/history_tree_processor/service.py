@@ -1,9 +1,18 @@
-import hashlib
+import logging
 from typing import Optional
 
 from browser_use.dom.history_tree_processor.view import DOMHistoryElement, HashedDomElement
 from browser_use.dom.views import DOMElementNode
 
+logger = logging.getLogger(__name__)
+
+# Attributes that identify an element on their own when its hash no longer matches
+IDENTIFYING_ATTRIBUTES = ('id', 'name', 'data-testid', 'aria-label', 'href', 'placeholder')
+
+# Element hashes use Python's hash(): fast, but only stable within a process. They are only compared to hashes of
+# DOMHistoryElements computed in the same process, never stored.
+EMPTY_BRANCH_PATH_HASH = 0
+
 
 class HistoryTreeProcessor:
 	""" "
@@ -33,21 +42,8 @@ class HistoryTreeProcessor:
 
 	@staticmethod
 	def find_history_element_in_tree(dom_history_element: DOMHistoryElement, tree: DOMElementNode) -> Optional[DOMElementNode]:
-		hashed_dom_history_element = HistoryTreeProcessor._hash_dom_history_element(dom_history_element)
-
-		def process_node(node: DOMElementNode):
-			if node.highlight_index is not None:
-				hashed_node = HistoryTreeProcessor._hash_dom_element(node)
-				if hashed_node == hashed_dom_history_element:
-					return node
-			for child in node.children:
-				if isinstance(child, DOMElementNode):
-					result = process_node(child)
-					if result is not None:
-						return result
-			return None
-
-		return process_node(tree)
+		"""Exact match only. To look up several elements in the same tree, use DOMState.history_index."""
+		return HistoryTreeIndex(tree).find_exact(dom_history_element)
 
 	@staticmethod
 	def compare_history_element_and_dom_element(dom_history_element: DOMHistoryElement, dom_element: DOMElementNode) -> bool:
@@ -66,8 +62,7 @@ class HistoryTreeProcessor:
 
 	@staticmethod
 	def _hash_dom_element(dom_element: DOMElementNode) -> HashedDomElement:
-		parent_branch_path = HistoryTreeProcessor._get_parent_branch_path(dom_element)
-		branch_path_hash = HistoryTreeProcessor._parent_branch_path_hash(parent_branch_path)
+		branch_path_hash = HistoryTreeProcessor._branch_path_hash(dom_element)
 		attributes_hash = HistoryTreeProcessor._attributes_hash(dom_element.attributes)
 		xpath_hash = HistoryTreeProcessor._xpath_hash(dom_element.xpath)
 		# text_hash = DomTreeProcessor._text_hash(dom_element)
@@ -87,21 +82,109 @@ class HistoryTreeProcessor:
 		return [parent.tag_name for parent in parents]
 
 	@staticmethod
-	def _parent_branch_path_hash(parent_branch_path: list[str]) -> str:
-		parent_branch_path_string = '/'.join(parent_branch_path)
-		return hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
+	def _branch_path_hash(dom_element: DOMElementNode) -> int:
+		"""
+		Hash of _get_parent_branch_path(dom_element), folded from the parent's and memoized on every element on the
+		way, so hashing all elements of a tree costs one step per element instead of one walk to the root each
+		"""
+		missing: list[DOMElementNode] = []
+		current_element = dom_element
+		while current_element.parent is not None and current_element._branch_path_hash is None:
+			missing.append(current_element)
+			current_element = current_element.parent
+
+		path_hash = current_element._branch_path_hash if current_element.parent is not None else EMPTY_BRANCH_PATH_HASH
+		for element in reversed(missing):
+			path_hash = hash((path_hash, element.tag_name))
+			element._branch_path_hash = path_hash
+		return path_hash
+
+	@staticmethod
+	def _parent_branch_path_hash(parent_branch_path: list[str]) -> int:
+		path_hash = EMPTY_BRANCH_PATH_HASH
+		for tag_name in parent_branch_path:
+			path_hash = hash((path_hash, tag_name))
+		return path_hash
 
 	@staticmethod
-	def _attributes_hash(attributes: dict[str, str]) -> str:
-		attributes_string = ''.join(f'{key}={value}' for key, value in attributes.items())
-		return hashlib.sha256(attributes_string.encode()).hexdigest()
+	def _attributes_hash(attributes: dict[str, str]) -> int:
+		return hash(tuple(attributes.items()))
 
 	@staticmethod
-	def _xpath_hash(xpath: str) -> str:
-		return hashlib.sha256(xpath.encode()).hexdigest()
+	def _xpath_hash(xpath: str) -> int:
+		return hash(xpath)
 
 	@staticmethod
-	def _text_hash(dom_element: DOMElementNode) -> str:
+	def _text_hash(dom_element: DOMElementNode) -> int:
 		""" """
 		text_string = dom_element.get_all_text_till_next_clickable_element()
-		return hashlib.sha256(text_string.encode()).hexdigest()
+		return hash(text_string)
+
+
+class HistoryTreeIndex:
+	"""
+	The highlighted elements of a tree indexed by hash, xpath and identifying attributes, so that matching the
+	elements of a replayed history against the tree costs one walk in total instead of one per element
+	"""
+
+	def __init__(self, tree: DOMElementNode):
+		self._by_hash: dict[HashedDomElement, DOMElementNode] = {}
+		self._by_xpath: dict[str, list[DOMElementNode]] = {}
+		self._by_attribute: dict[tuple[str, str], list[DOMElementNode]] = {}
+
+		stack = [tree]
+		while stack:
+			node = stack.pop()
+			if node.highlight_index is not None:
+				# The first element in document order wins, like the walk of find_history_element_in_tree did
+				self._by_hash.setdefault(node.hash, node)
+				self._by_xpath.setdefault(node.xpath, []).append(node)
+				for name in IDENTIFYING_ATTRIBUTES:
+					if node.attributes.get(name):
+						self._by_attribute.setdefault((name, node.attributes[name]), []).append(node)
+			stack.extend(child for child in reversed(node.children) if isinstance(child, DOMElementNode))
+
+	def find(self, dom_history_element: DOMHistoryElement) -> Optional[DOMElementNode]:
+		"""The element with the same hash, else the one clear best fuzzy match, else None"""
+		return self.find_exact(dom_history_element) or self.find_fuzzy(dom_history_element)
+
+	def find_exact(self, dom_history_element: DOMHistoryElement) -> Optional[DOMElementNode]:
+		return self._by_hash.get(HistoryTreeProcessor._hash_dom_history_element(dom_history_element))
+
+	def find_fuzzy(self, dom_history_element: DOMHistoryElement) -> Optional[DOMElementNode]:
+		"""
+		Elements with the same tag and xpath or identifying attribute are scored on how much else still matches.
+		A match needs more than the position alone (xpath and branch path) and must beat every other candidate.
+		"""
+		candidates: dict[int, DOMElementNode] = {}
+		for node in self._by_xpath.get(dom_history_element.xpath, []):
+			candidates[id(node)] = node
+		for name in IDENTIFYING_ATTRIBUTES:
+			value = dom_history_element.attributes.get(name)
+			for node in self._by_attribute.get((name, value), []) if value else []:
+				candidates[id(node)] = node
+
+		branch_path_hash = HistoryTreeProcessor._parent_branch_path_hash(dom_history_element.entire_parent_branch_path)
+		history_attributes = set(dom_history_element.attributes.items())
+		scored = []
+		for node in candidates.values():
+			if node.tag_name != dom_history_element.tag_name:
+				continue
+			attributes = set(node.attributes.items())
+			union = history_attributes | attributes
+			score = 2 * len(history_attributes & attributes) / len(union) if union else 0.0
+			score += node.xpath == dom_history_element.xpath
+			score += node.hash.branch_path_hash == branch_path_hash
+			score += any(
+				node.attributes.get(name) == dom_history_element.attributes.get(name)
+				for name in IDENTIFYING_ATTRIBUTES
+				if dom_history_element.attributes.get(name)
+			)
+			scored.append((score, node))
+
+		scored.sort(key=lambda scored_node: scored_node[0], reverse=True)
+		if not scored or scored[0][0] <= 2 or (len(scored) > 1 and scored[1][0] == scored[0][0]):
+			return None
+
+		logger.debug(f'Fuzzy matched {dom_history_element.tag_name} {dom_history_element.xpath} with score {scored[0][0]:.2f}')
+		return scored[0][1]
@@ -4,16 +4,16 @@ from typing import Optional
 from pydantic import BaseModel
 
 
-@dataclass
+@dataclass(frozen=True)
 class HashedDomElement:
 	"""
 	Hash of the dom element to be used as a unique identifier
 	"""
 
-	branch_path_hash: str
-	attributes_hash: str
-	xpath_hash: str
-	# text_hash: str
+	branch_path_hash: int
+	attributes_hash: int
+	xpath_hash: int
+	# text_hash: int
 
 
 class Coordinates(BaseModel):
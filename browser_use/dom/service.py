@@ -1,6 +1,8 @@
 import gc
+import hashlib
 import json
 import logging
+import weakref
 from dataclasses import dataclass
 from importlib import resources
 from typing import TYPE_CHECKING, Optional
@@ -10,16 +12,120 @@ if TYPE_CHECKING:
 	from playwright.async_api import Page
 
 from browser_use.dom.views import (
+	FLAG_HAS_ATTRIBUTES,
+	FLAG_HIGHLIGHTED,
+	FLAG_IN_VIEWPORT,
+	FLAG_INTERACTIVE,
+	FLAG_SHADOW_ROOT,
+	FLAG_TOP_ELEMENT,
+	FLAG_VISIBLE,
 	DOMBaseNode,
 	DOMElementNode,
+	DOMPageState,
 	DOMState,
+	DOMStore,
 	DOMTextNode,
 	SelectorMap,
 )
-from browser_use.utils import time_execution_async
+from browser_use.utils import time_execution_async, time_execution_sync
 
 logger = logging.getLogger(__name__)
 
+REMOVE_HIGHLIGHTS_JS = """
+try {
+	// Remove the highlight container and all its contents
+	const container = document.getElementById('playwright-highlight-container');
+	if (container) {
+		container.remove();
+	}
+
+	// Remove highlight attributes from elements
+	const highlightedElements = document.querySelectorAll('[browser-user-highlight-id^="playwright-highlight-"]');
+	highlightedElements.forEach(el => {
+		el.removeAttribute('browser-user-highlight-id');
+	});
+} catch (e) {
+	console.error('Failed to remove highlights:', e);
+}
+"""
+
+# buildDomTree.js keeps the interactive elements of its last extraction in the page, indexed by highlight index.
+# This resolves an index to its element if it is still attached at the xpath it was extracted with, else null.
+# Elements inside iframes are left to selectors, their handles belong to another frame.
+RESOLVE_HIGHLIGHTED_ELEMENT_JS = """
+({ index, xpath }) => {
+	const state = window.__browserUseIncrementalDom;
+	const entry = state && state.interactiveElements[index];
+	if (!entry || entry[1] !== index || entry[2] || !entry[0].isConnected) return null;
+	const record = state.records.get(entry[0]);
+	return record && record.xpath === xpath ? entry[0] : null;
+}
+"""
+
+# The last extraction per page. buildDomTree.js keeps an observer in the page and answers
+# {unchanged: true} when nothing changed since the extraction with this id.
+# Any change still costs a walk of the whole body, only per-element records are reused.
+_previous_extractions: 'weakref.WeakKeyDictionary[Page, tuple[str, DOMState]]' = weakref.WeakKeyDictionary()
+_previous_stores: 'weakref.WeakKeyDictionary[Page, tuple[str, DOMStore]]' = weakref.WeakKeyDictionary()
+
+BUILD_DOM_TREE_JS = resources.read_text('browser_use.dom', 'buildDomTree.js')
+BUILD_DOM_TREE_VERSION = hashlib.sha256(BUILD_DOM_TREE_JS.encode()).hexdigest()[:12]
+
+# buildDomTree.js stays resident in the page as window.__browserUseBuildDomTree, so calls only ship a short stub.
+# Pages without it (a new document) or with another version answer {notInstalled: true} and get the full script.
+RESOLVE_BUILD_DOM_TREE_JS_TEMPLATE = """
+	let buildDomTree = window.__browserUseBuildDomTree;
+	if (%(needed)s && (!buildDomTree || buildDomTree.version !== '%(version)s')) {
+		%(fallback)s
+	}
+"""
+INSTALL_BUILD_DOM_TREE_JS = "buildDomTree = window.__browserUseBuildDomTree = Object.assign(%s, { version: '%s' });" % (
+	BUILD_DOM_TREE_JS.strip().rstrip(';'),
+	BUILD_DOM_TREE_VERSION,
+)
+NOT_INSTALLED_JS = 'return { notInstalled: true };'
+
+BUILD_DOM_TREE_CALL_JS_TEMPLATE = """
+(args) => {
+	%s
+	return buildDomTree(args);
+}
+"""
+
+# Everything the browser state needs from the page in one evaluate call: highlight cleanup, DOM tree, title and scroll info
+PAGE_STATE_JS_TEMPLATE = """
+(args) => {
+	%s
+	%s
+	const root = document.documentElement;
+	return {
+		title: document.title,
+		scrollY: window.scrollY,
+		viewportHeight: window.innerHeight,
+		scrollHeight: root ? root.scrollHeight : 0,
+		dom: args.buildDomTree ? buildDomTree(args.domArgs) : null,
+	};
+}
+"""
+
+
+def _resolve_build_dom_tree_js(needed: str, install: bool) -> str:
+	return RESOLVE_BUILD_DOM_TREE_JS_TEMPLATE % {
+		'needed': needed,
+		'version': BUILD_DOM_TREE_VERSION,
+		'fallback': INSTALL_BUILD_DOM_TREE_JS if install else NOT_INSTALLED_JS,
+	}
+
+
+# (stub, stub that installs buildDomTree.js) pairs
+BUILD_DOM_TREE_SCRIPTS = tuple(
+	BUILD_DOM_TREE_CALL_JS_TEMPLATE % _resolve_build_dom_tree_js('true', install) for install in (False, True)
+)
+PAGE_STATE_SCRIPTS = tuple(
+	PAGE_STATE_JS_TEMPLATE % (_resolve_build_dom_tree_js('args.buildDomTree', install), REMOVE_HIGHLIGHTS_JS)
+	for install in (False, True)
+)
+
 
 @dataclass
 class ViewportInfo:
@@ -32,7 +138,7 @@ class DomService:
 		self.page = page
 		self.xpath_cache = {}
 
-		self.js_code = resources.read_text('browser_use.dom', 'buildDomTree.js')
+		self.js_code = BUILD_DOM_TREE_JS
 
 	# region - Clickable elements
 	@time_execution_async('--get_clickable_elements')
@@ -45,6 +151,79 @@ class DomService:
 		element_tree, selector_map = await self._build_dom_tree(highlight_elements, focus_element, viewport_expansion)
 		return DOMState(element_tree=element_tree, selector_map=selector_map)
 
+	@time_execution_async('--get_page_state')
+	async def get_page_state(
+		self,
+		highlight_elements: bool = True,
+		focus_element: int = -1,
+		viewport_expansion: int = 0,
+	) -> DOMPageState:
+		"""
+		Like get_clickable_elements, but in a single round-trip that also removes old highlights and reads the
+		page title and scroll position. Raises if the page cannot evaluate javascript.
+		"""
+		debug_mode = logger.getEffectiveLevel() == logging.DEBUG
+		args = {
+			# short-circuit if the page is a new empty tab for speed, no need to run buildDomTree.js
+			'buildDomTree': self.page.url != 'about:blank',
+			'domArgs': {
+				'doHighlightElements': highlight_elements,
+				'focusHighlightIndex': focus_element,
+				'viewportExpansion': viewport_expansion,
+				'debugMode': debug_mode,
+				'wireFormat': 'columnar',
+			},
+		}
+		if args['buildDomTree']:
+			args['domArgs']['previousExtractionId'] = self._previous_extraction_id()
+		page_state: dict = await self._evaluate_with_build_dom_tree(PAGE_STATE_SCRIPTS, args)
+
+		eval_page = page_state['dom']
+		if eval_page is None:
+			element_tree, selector_map = self._empty_dom_tree()
+		else:
+			element_tree, selector_map = await self._dom_tree_from_eval(eval_page)
+
+		return DOMPageState(
+			element_tree=element_tree,
+			selector_map=selector_map,
+			title=page_state['title'],
+			pixels_above=page_state['scrollY'],
+			pixels_below=page_state['scrollHeight'] - (page_state['scrollY'] + page_state['viewportHeight']),
+		)
+
+	@time_execution_async('--get_dom_store')
+	async def get_dom_store(
+		self,
+		highlight_elements: bool = True,
+		focus_element: int = -1,
+		viewport_expansion: int = 0,
+	) -> DOMStore:
+		"""
+		Like get_clickable_elements, but returns the page as an array-backed DOMStore instead of a tree of
+		DOMElementNode objects, for callers that only query it.
+		"""
+		if self.page.url == 'about:blank':
+			return DOMStore.empty()
+
+		previous = _previous_stores.get(self.page)
+		args = {
+			'doHighlightElements': highlight_elements,
+			'focusHighlightIndex': focus_element,
+			'viewportExpansion': viewport_expansion,
+			'debugMode': False,
+			'previousExtractionId': previous[0] if previous else None,
+			'wireFormat': 'columnar',
+		}
+		eval_page: dict = await self._evaluate_with_build_dom_tree(BUILD_DOM_TREE_SCRIPTS, args)
+		if eval_page.get('unchanged') and previous and previous[0] == eval_page['extractionId']:
+			return previous[1]
+
+		store = DOMStore(eval_page['columnar'])
+		if eval_page.get('extractionId'):
+			_previous_stores[self.page] = (eval_page['extractionId'], store)
+		return store
+
 	@time_execution_async('--get_cross_origin_iframes')
 	async def get_cross_origin_iframes(self) -> list[str]:
 		# invisible cross-origin iframes are used for ads and tracking, dont open those
@@ -75,17 +254,7 @@ class DomService:
 
 		if self.page.url == 'about:blank':
 			# short-circuit if the page is a new empty tab for speed, no need to inject buildDomTree.js
-			return (
-				DOMElementNode(
-					tag_name='body',
-					xpath='',
-					attributes={},
-					children=[],
-					is_visible=False,
-					parent=None,
-				),
-				{},
-			)
+			return self._empty_dom_tree()
 
 		# NOTE: We execute JS code in the browser to extract important DOM information.
 		#       The returned hash map contains information about the DOM tree and the
@@ -96,23 +265,124 @@ class DomService:
 			'focusHighlightIndex': focus_element,
 			'viewportExpansion': viewport_expansion,
 			'debugMode': debug_mode,
+			'previousExtractionId': self._previous_extraction_id(),
+			'wireFormat': 'columnar',
 		}
 
 		try:
-			eval_page: dict = await self.page.evaluate(self.js_code, args)
+			eval_page: dict = await self._evaluate_with_build_dom_tree(BUILD_DOM_TREE_SCRIPTS, args)
 		except Exception as e:
 			logger.error('Error evaluating JavaScript: %s', e)
 			raise
 
+		return await self._dom_tree_from_eval(eval_page)
+
+	async def _evaluate_with_build_dom_tree(self, scripts: tuple[str, ...], args: dict):
+		"""Run a script that calls buildDomTree, sending buildDomTree.js only if the page does not have it yet"""
+		stub, installing_stub = scripts
+		result = await self.page.evaluate(stub, args)
+		if isinstance(result, dict) and result.get('notInstalled'):
+			result = await self.page.evaluate(installing_stub, args)
+		return result
+
+	def _previous_extraction_id(self) -> Optional[str]:
+		previous = _previous_extractions.get(self.page)
+		return previous[0] if previous else None
+
+	async def _dom_tree_from_eval(self, eval_page: dict) -> tuple[DOMElementNode, SelectorMap]:
+		"""Build the tree from buildDomTree.js output, or reuse the previous one if the page did not change"""
+		previous = _previous_extractions.get(self.page)
+		if eval_page.get('unchanged') and previous and previous[0] == eval_page['extractionId']:
+			logger.debug('♻️  DOM unchanged since the last extraction, reusing it')
+			return previous[1].element_tree, previous[1].selector_map
+
 		# Only log performance metrics in debug mode
-		if debug_mode and 'perfMetrics' in eval_page:
+		if logger.getEffectiveLevel() == logging.DEBUG and 'perfMetrics' in eval_page:
 			logger.debug(
 				'DOM Tree Building Performance Metrics for: %s\n%s',
 				self.page.url,
 				json.dumps(eval_page['perfMetrics'], indent=2),
 			)
 
-		return await self._construct_dom_tree(eval_page)
+		if 'columnar' in eval_page:
+			element_tree, selector_map = self._decode_columnar_dom_tree(eval_page['columnar'])
+		else:
+			element_tree, selector_map = await self._construct_dom_tree(eval_page)
+		if eval_page.get('extractionId'):
+			_previous_extractions[self.page] = (
+				eval_page['extractionId'],
+				DOMState(element_tree=element_tree, selector_map=selector_map),
+			)
+		return element_tree, selector_map
+
+	@staticmethod
+	def _empty_dom_tree() -> tuple[DOMElementNode, SelectorMap]:
+		return (
+			DOMElementNode(
+				tag_name='body',
+				xpath='',
+				attributes={},
+				children=[],
+				is_visible=False,
+				parent=None,
+			),
+			{},
+		)
+
+	@staticmethod
+	@time_execution_sync('--decode_columnar_dom_tree')
+	def _decode_columnar_dom_tree(columnar: dict) -> tuple[DOMElementNode, SelectorMap]:
+		"""Build the tree from the columnar wire format of buildDomTree.js in one pass, parents come before their children"""
+		tags = columnar['tags']
+		attribute_names = columnar['attributeNames']
+		xpath_segments = columnar['xpathSegments']
+		xpaths = iter(columnar['xpath'])
+		attributes = iter(columnar['attributes'])
+		highlight_indices = iter(columnar['highlightIndex'])
+		texts = iter(columnar['text'])
+
+		nodes: list[DOMBaseNode] = []
+		selector_map: SelectorMap = {}
+		for tag, parent_position, flags in zip(columnar['tag'], columnar['parent'], columnar['flags']):
+			parent = nodes[parent_position] if parent_position >= 0 else None
+
+			if tag < 0:
+				node = DOMTextNode(text=next(texts), is_visible=bool(flags & FLAG_VISIBLE), parent=parent)
+			else:
+				xpath = next(xpaths)
+				if not isinstance(xpath, str):
+					xpath = f'{parent.xpath}/{xpath_segments[xpath]}'
+
+				node_attributes = {}
+				if flags & FLAG_HAS_ATTRIBUTES:
+					pairs = next(attributes)
+					for i in range(0, len(pairs), 2):
+						node_attributes[attribute_names[pairs[i]]] = pairs[i + 1]
+
+				node = DOMElementNode(
+					tag_name=tags[tag],
+					xpath=xpath,
+					attributes=node_attributes,
+					children=[],
+					is_visible=bool(flags & FLAG_VISIBLE),
+					is_interactive=bool(flags & FLAG_INTERACTIVE),
+					is_top_element=bool(flags & FLAG_TOP_ELEMENT),
+					is_in_viewport=bool(flags & FLAG_IN_VIEWPORT),
+					highlight_index=next(highlight_indices) if flags & FLAG_HIGHLIGHTED else None,
+					shadow_root=bool(flags & FLAG_SHADOW_ROOT),
+					parent=parent,
+				)
+				if node.highlight_index is not None:
+					selector_map[node.highlight_index] = node
+
+			if parent is not None:
+				parent.children.append(node)
+			nodes.append(node)
+
+		if not nodes or not isinstance(nodes[0], DOMElementNode):
+			raise ValueError('Failed to parse HTML to dictionary')
+
+		return nodes[0], selector_map
 
 	@time_execution_async('--construct_dom_tree')
 	async def _construct_dom_tree(
@@ -1,5 +1,8 @@
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from functools import cached_property
+from itertools import compress
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from browser_use.dom.history_tree_processor.view import CoordinateSet, HashedDomElement, ViewportInfo
@@ -7,8 +10,19 @@ from browser_use.utils import time_execution_sync
 
 # Avoid circular import issues
 if TYPE_CHECKING:
+	from browser_use.dom.history_tree_processor.service import HistoryTreeIndex
+
 	from .views import DOMElementNode
 
+# Bits of the flags column in the columnar wire format, mirrored in buildDomTree.js
+FLAG_VISIBLE = 1
+FLAG_INTERACTIVE = 2
+FLAG_TOP_ELEMENT = 4
+FLAG_IN_VIEWPORT = 8
+FLAG_SHADOW_ROOT = 16
+FLAG_HAS_ATTRIBUTES = 32
+FLAG_HIGHLIGHTED = 64
+
 
 @dataclass(frozen=False)
 class DOMBaseNode:
@@ -62,6 +76,8 @@ class DOMElementNode(DOMBaseNode):
 	viewport_coordinates: Optional[CoordinateSet] = None
 	page_coordinates: Optional[CoordinateSet] = None
 	viewport_info: Optional[ViewportInfo] = None
+	# Hash of the parent branch path, memoized by HistoryTreeProcessor
+	_branch_path_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
 	def __repr__(self) -> str:
 		tag_str = f'<{self.tag_name}'
@@ -121,47 +137,60 @@ class DOMElementNode(DOMBaseNode):
 	def clickable_elements_to_string(self, include_attributes: list[str] | None = None) -> str:
 		"""Convert the processed DOM content to HTML."""
 		formatted_text = []
-
-		def process_node(node: DOMBaseNode, depth: int) -> None:
+		# (position in formatted_text, element, its text) of highlighted elements, completed after the traversal
+		highlighted_lines = []
+
+		# One pass: every node carries the text list of its closest highlighted ancestor (None if there is none)
+		# down the tree, so text below a highlighted element joins its line instead of getting its own.
+		# Text below a highlighted ancestor of this element is not shown at all.
+		outer_texts = None
+		ancestor = self.parent
+		while ancestor is not None and outer_texts is None:
+			outer_texts = [] if ancestor.highlight_index is not None else None
+			ancestor = ancestor.parent
+		stack: list[tuple[DOMBaseNode, Optional[list[str]]]] = [(self, outer_texts)]
+		while stack:
+			node, texts = stack.pop()
 			if isinstance(node, DOMElementNode):
-				# Add element with highlight_index
 				if node.highlight_index is not None:
-					attributes_str = ''
-					text = node.get_all_text_till_next_clickable_element()
-					if include_attributes:
-						attributes = list(
-							set(
-								[
-									str(value)
-									for key, value in node.attributes.items()
-									if key in include_attributes and value != node.tag_name
-								]
-							)
-						)
-						if text in attributes:
-							attributes.remove(text)
-						attributes_str = ';'.join(attributes)
-					line = f'[{node.highlight_index}]<{node.tag_name} '
-					if attributes_str:
-						line += f'{attributes_str}'
-					if text:
-						if attributes_str:
-							line += f'>{text}'
-						else:
-							line += f'{text}'
-					line += '/>'
-					formatted_text.append(line)
-
-				# Process children regardless
-				for child in node.children:
-					process_node(child, depth + 1)
+					texts = []
+					highlighted_lines.append((len(formatted_text), node, texts))
+					formatted_text.append('')
+				stack.extend((child, texts) for child in reversed(node.children))
 
 			elif isinstance(node, DOMTextNode):
-				# Add text only if it doesn't have a highlighted parent
-				if not node.has_parent_with_highlight_index() and node.is_visible:  # and node.is_parent_top_element()
+				if texts is not None:
+					texts.append(node.text)
+				elif node.is_visible:  # and node.is_parent_top_element()
 					formatted_text.append(f'{node.text}')
 
-		process_node(self, 0)
+		for position, node, texts in highlighted_lines:
+			attributes_str = ''
+			text = '\n'.join(texts).strip()
+			if include_attributes:
+				attributes = list(
+					set(
+						[
+							str(value)
+							for key, value in node.attributes.items()
+							if key in include_attributes and value != node.tag_name
+						]
+					)
+				)
+				if text in attributes:
+					attributes.remove(text)
+				attributes_str = ';'.join(attributes)
+			line = f'[{node.highlight_index}]<{node.tag_name} '
+			if attributes_str:
+				line += f'{attributes_str}'
+			if text:
+				if attributes_str:
+					line += f'>{text}'
+				else:
+					line += f'{text}'
+			line += '/>'
+			formatted_text[position] = line
+
 		return '\n'.join(formatted_text)
 
 	def get_file_upload_element(self, check_siblings: bool = True) -> Optional['DOMElementNode']:
@@ -194,3 +223,282 @@ SelectorMap = dict[int, DOMElementNode]
 class DOMState:
 	element_tree: DOMElementNode
 	selector_map: SelectorMap
+
+	@cached_property
+	def history_index(self) -> 'HistoryTreeIndex':
+		"""Index to find elements of a replayed history in this state, built on first use"""
+		from browser_use.dom.history_tree_processor.service import HistoryTreeIndex
+
+		return HistoryTreeIndex(self.element_tree)
+
+
+@dataclass
+class DOMPageState(DOMState):
+	"""DOM state plus the page facts read in the same evaluate call"""
+
+	title: str
+	pixels_above: int
+	pixels_below: int
+
+
+def _flag_mask(required: int) -> bytes:
+	"""bytes.translate table that maps a flags byte to 1 if it has all the required bits, else 0"""
+	return bytes(int(flags & required == required) for flags in range(256))
+
+
+class DOMStore:
+	"""
+	Array-backed alternative to a tree of DOMElementNode/DOMTextNode, built from the columnar wire format of
+	buildDomTree.js. Nodes are positions in document order, their state lives in parallel typed arrays and
+	queries scan those arrays instead of walking objects. Node views are created on demand.
+	"""
+
+	def __init__(self, columnar: dict):
+		self.tag_names: list[str] = columnar['tags']
+		self._attribute_names: list[str] = columnar['attributeNames']
+		self._xpath_segments: list[str] = columnar['xpathSegments']
+		self._xpaths: list[int | str] = columnar['xpath']
+		self._attributes: list[list] = columnar['attributes']
+		self._texts: list[str] = columnar['text']
+
+		self.tag = array('h', columnar['tag'])
+		self.parent = array('i', columnar['parent'])
+		self.flags = array('B', columnar['flags'])
+		size = len(self.tag)
+
+		# Positions of the nodes that have an entry in the sparse columns, to find it by bisection
+		positions = range(size)
+		self._text_positions = array('i', (position for position, tag in enumerate(self.tag) if tag < 0))
+		self._element_positions = array('i', (position for position, tag in enumerate(self.tag) if tag >= 0))
+		self._attribute_positions = array('i', self.positions_with(FLAG_HAS_ATTRIBUTES))
+		self._highlighted_positions = array('i', self.positions_with(FLAG_HIGHLIGHTED))
+
+		self.highlight_index = array('i', [-1]) * size
+		for position, highlight_index in zip(self._highlighted_positions, columnar['highlightIndex']):
+			self.highlight_index[position] = highlight_index
+
+		# Position after the last descendant, the subtree of a node is range(position, end[position])
+		self.end = array('i', positions[1:])
+		self.end.append(size)
+		parent, end = self.parent, self.end
+		for position in range(size - 1, 0, -1):
+			if end[position] > end[parent[position]]:
+				end[parent[position]] = end[position]
+
+		self._resolved_xpaths: dict[int, str] = {}
+
+	@classmethod
+	def empty(cls) -> 'DOMStore':
+		return cls(
+			{
+				'tags': ['body'],
+				'attributeNames': [],
+				'xpathSegments': [],
+				'tag': [0],
+				'parent': [-1],
+				'flags': [0],
+				'xpath': [''],
+				'attributes': [],
+				'highlightIndex': [],
+				'text': [],
+			}
+		)
+
+	def __len__(self) -> int:
+		return len(self.tag)
+
+	@property
+	def root(self) -> 'DOMElementView':
+		return DOMElementView(self, 0)
+
+	def view(self, position: int) -> 'DOMElementView | DOMTextView':
+		return DOMTextView(self, position) if self.tag[position] < 0 else DOMElementView(self, position)
+
+	def positions_with(self, required_flags: int, start: int = 0, stop: Optional[int] = None) -> list[int]:
+		"""Positions of the nodes that have all the required flags, scanned in C over the flags array"""
+		stop = len(self.tag) if stop is None else stop
+		mask = self.flags[start:stop].tobytes().translate(_flag_mask(required_flags))
+		return list(compress(range(start, stop), mask))
+
+	def _sparse_index(self, positions: array, position: int) -> int:
+		index = bisect_left(positions, position)
+		if index == len(positions) or positions[index] != position:
+			raise KeyError(position)
+		return index
+
+	def text(self, position: int) -> str:
+		return self._texts[self._sparse_index(self._text_positions, position)]
+
+	def xpath(self, position: int) -> str:
+		if position in self._resolved_xpaths:
+			return self._resolved_xpaths[position]
+
+		# Climb until an xpath sent as a string (or already resolved), collecting the interned steps on the way
+		steps = []
+		current = position
+		while current not in self._resolved_xpaths:
+			raw = self._xpaths[self._sparse_index(self._element_positions, current)]
+			if isinstance(raw, str):
+				self._resolved_xpaths[current] = raw
+				break
+			steps.append((current, self._xpath_segments[raw]))
+			current = self.parent[current]
+
+		xpath = self._resolved_xpaths[current]
+		for step_position, segment in reversed(steps):
+			xpath = f'{xpath}/{segment}'
+			self._resolved_xpaths[step_position] = xpath
+		return xpath
+
+	def attributes(self, position: int) -> dict[str, str]:
+		if not self.flags[position] & FLAG_HAS_ATTRIBUTES:
+			return {}
+		pairs = self._attributes[self._sparse_index(self._attribute_positions, position)]
+		return {self._attribute_names[pairs[i]]: pairs[i + 1] for i in range(0, len(pairs), 2)}
+
+	def children(self, position: int) -> list[int]:
+		children = []
+		child, end = position + 1, self.end[position]
+		while child < end:
+			children.append(child)
+			child = self.end[child]
+		return children
+
+	def selector_map(self) -> dict[int, 'DOMElementView']:
+		return {self.highlight_index[position]: DOMElementView(self, position) for position in self._highlighted_positions}
+
+	def interactive_in_viewport(self) -> list['DOMElementView']:
+		return [DOMElementView(self, position) for position in self.positions_with(FLAG_INTERACTIVE | FLAG_IN_VIEWPORT)]
+
+	def text_till_next_clickable(self, position: int, max_depth: int = -1) -> str:
+		"""Same as DOMElementNode.get_all_text_till_next_clickable_element, from two bisections and a merge"""
+		end = self.end[position]
+		texts = self._text_positions
+		highlighted = self._highlighted_positions
+		text_start, text_stop = bisect_left(texts, position), bisect_left(texts, end)
+		highlight_start, highlight_stop = bisect_right(highlighted, position), bisect_left(highlighted, end)
+
+		text_parts = []
+		blocked_until = -1
+		for text_index in range(text_start, text_stop):
+			text_position = texts[text_index]
+			# Skip the subtrees of highlighted descendants
+			while highlight_start < highlight_stop and highlighted[highlight_start] < text_position:
+				blocked_until = max(blocked_until, self.end[highlighted[highlight_start]])
+				highlight_start += 1
+			if text_position < blocked_until:
+				continue
+			if max_depth != -1 and self._depth_below(text_position, position) > max_depth:
+				continue
+			text_parts.append(self._texts[text_index])
+		return '\n'.join(text_parts).strip()
+
+	def texts_till_next_clickable(self) -> dict[int, str]:
+		"""text_till_next_clickable of every highlighted element by highlight index, in one pass over the store"""
+		highlighted, end = self._highlighted_positions, self.end
+		text_parts: dict[int, list[str]] = {position: [] for position in highlighted}
+		# Highlighted ancestors of the current text node, innermost last: subtrees nest, so this is a stack
+		open_positions: list[int] = []
+		next_highlighted = 0
+		for text_position, text in zip(self._text_positions, self._texts):
+			while next_highlighted < len(highlighted) and highlighted[next_highlighted] < text_position:
+				position = highlighted[next_highlighted]
+				while open_positions and end[open_positions[-1]] <= position:
+					open_positions.pop()
+				open_positions.append(position)
+				next_highlighted += 1
+			while open_positions and end[open_positions[-1]] <= text_position:
+				open_positions.pop()
+			if open_positions:
+				text_parts[open_positions[-1]].append(text)
+		highlight_index = self.highlight_index
+		return {highlight_index[position]: '\n'.join(parts).strip() for position, parts in text_parts.items()}
+
+	def _depth_below(self, position: int, ancestor: int) -> int:
+		depth = 0
+		while position != ancestor:
+			position = self.parent[position]
+			depth += 1
+		return depth
+
+
+class DOMNodeView:
+	"""A node of a DOMStore, reading its fields from the store's arrays"""
+
+	__slots__ = ('store', 'position')
+
+	def __init__(self, store: DOMStore, position: int):
+		self.store = store
+		self.position = position
+
+	def __eq__(self, other: object) -> bool:
+		return isinstance(other, DOMNodeView) and other.store is self.store and other.position == self.position
+
+	def __hash__(self) -> int:
+		return hash((id(self.store), self.position))
+
+	@property
+	def is_visible(self) -> bool:
+		return bool(self.store.flags[self.position] & FLAG_VISIBLE)
+
+	@property
+	def parent(self) -> Optional['DOMElementView']:
+		parent = self.store.parent[self.position]
+		return DOMElementView(self.store, parent) if parent >= 0 else None
+
+
+class DOMTextView(DOMNodeView):
+	__slots__ = ()
+
+	type = 'TEXT_NODE'
+
+	@property
+	def text(self) -> str:
+		return self.store.text(self.position)
+
+
+class DOMElementView(DOMNodeView):
+	__slots__ = ()
+
+	def __repr__(self) -> str:
+		return f'<{self.tag_name} {self.xpath!r} at {self.position}>'
+
+	@property
+	def tag_name(self) -> str:
+		return self.store.tag_names[self.store.tag[self.position]]
+
+	@property
+	def xpath(self) -> str:
+		return self.store.xpath(self.position)
+
+	@property
+	def attributes(self) -> dict[str, str]:
+		return self.store.attributes(self.position)
+
+	@property
+	def children(self) -> list['DOMElementView | DOMTextView']:
+		return [self.store.view(child) for child in self.store.children(self.position)]
+
+	@property
+	def is_interactive(self) -> bool:
+		return bool(self.store.flags[self.position] & FLAG_INTERACTIVE)
+
+	@property
+	def is_top_element(self) -> bool:
+		return bool(self.store.flags[self.position] & FLAG_TOP_ELEMENT)
+
+	@property
+	def is_in_viewport(self) -> bool:
+		return bool(self.store.flags[self.position] & FLAG_IN_VIEWPORT)
+
+	@property
+	def shadow_root(self) -> bool:
+		return bool(self.store.flags[self.position] & FLAG_SHADOW_ROOT)
+
+	@property
+	def highlight_index(self) -> Optional[int]:
+		highlight_index = self.store.highlight_index[self.position]
+		return highlight_index if highlight_index >= 0 else None
+
+	def get_all_text_till_next_clickable_element(self, max_depth: int = -1) -> str:
+		return self.store.text_till_next_clickable(self.position, max_depth)
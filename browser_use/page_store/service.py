@@ -0,0 +1,294 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from browser_use.page_store.views import StoredPage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_STORE_PATH = Path.home() / '.cache' / 'browser_use' / 'pages.sqlite'
+
+MAX_AGE_PATTERN = re.compile(r'max-age=(\d+)')
+# Responses the server wants revalidated before every reuse
+NO_CACHE_PATTERN = re.compile(r'\bno-(?:cache|store)\b')
+
+# Key prefix of HTML rendered in a browser, kept apart from the HTTP response stored for the same URL
+RENDERED_KEY_PREFIX = 'rendered:'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+	url TEXT PRIMARY KEY,
+	content_hash TEXT NOT NULL,
+	etag TEXT,
+	last_modified TEXT,
+	fetched_at REAL NOT NULL,
+	expires_at REAL NOT NULL,
+	last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access);
+CREATE TABLE IF NOT EXISTS blobs (
+	content_hash TEXT PRIMARY KEY,
+	html TEXT NOT NULL,
+	size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS texts (
+	content_hash TEXT NOT NULL,
+	variant TEXT NOT NULL,
+	text TEXT NOT NULL,
+	size INTEGER NOT NULL,
+	PRIMARY KEY (content_hash, variant)
+);
+"""
+
+
+class PageStore:
+	"""
+	Persistent, content-addressed store of fetched pages.
+
+	Pages are keyed by URL and point to their HTML by content hash, so identical
+	pages under different URLs are stored once. Text extracted from the HTML is
+	kept next to it per variant (e.g. with or without links) so conversion only
+	happens once per content.
+
+	Freshness comes from per-domain TTLs, then the response's Cache-Control
+	max-age, then the default TTL. Stale pages keep their ETag/Last-Modified for
+	conditional revalidation. Responses marked no-cache get a TTL of 0, so they
+	are always revalidated. When the stored HTML and text exceed max_bytes the
+	least recently used URLs are evicted.
+
+	The methods are synchronous SQLite calls, call them through asyncio.to_thread
+	from async code.
+
+	HTML rendered in a browser is stored with put_rendered under its own key, so
+	it never replaces the HTTP response (and its validators) stored for the URL.
+	"""
+
+	def __init__(
+		self,
+		path: str | Path = DEFAULT_PAGE_STORE_PATH,
+		max_bytes: int = 256 * 1024 * 1024,
+		default_ttl: float = 3600,
+		domain_ttls: Optional[dict[str, float]] = None,
+	):
+		self.path = Path(path)
+		self.max_bytes = max_bytes
+		self.default_ttl = default_ttl
+		# Keys match the domain and its subdomains, e.g. 'wikipedia.org' matches 'en.wikipedia.org'
+		self.domain_ttls = {domain.lstrip('.').lower(): ttl for domain, ttl in (domain_ttls or {}).items()}
+
+		self.hits = 0
+		self.misses = 0
+		self.revalidated = 0
+		self.text_hits = 0
+		self.evictions = 0
+
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self._lock = threading.Lock()
+		self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+		self._db.execute('PRAGMA journal_mode=WAL')
+		self._db.executescript(SCHEMA)
+		self._size = self._db.execute(
+			'SELECT (SELECT COALESCE(SUM(size), 0) FROM blobs) + (SELECT COALESCE(SUM(size), 0) FROM texts)'
+		).fetchone()[0]
+
+	@property
+	def size(self) -> int:
+		"""Bytes of HTML and text currently stored"""
+		return self._size
+
+	def ttl_for(self, url: str, cache_control: Optional[str] = None) -> float:
+		"""Time to live for a URL, 0 for no-cache responses, otherwise preferring the most specific domain policy"""
+		if cache_control and NO_CACHE_PATTERN.search(cache_control.lower()):
+			return 0.0
+		host = (urlparse(url).hostname or '').lower()
+		matches = [domain for domain in self.domain_ttls if host == domain or host.endswith('.' + domain)]
+		if matches:
+			return self.domain_ttls[max(matches, key=len)]
+		if cache_control:
+			max_age = MAX_AGE_PATTERN.search(cache_control)
+			if max_age:
+				return float(max_age.group(1))
+		return self.default_ttl
+
+	def get(self, url: str) -> Optional[StoredPage]:
+		"""Look up a URL, fresh or stale. Use `StoredPage.is_fresh` to decide whether to revalidate."""
+		with self._lock:
+			row = self._db.execute(
+				'SELECT url, content_hash, etag, last_modified, fetched_at, expires_at FROM pages WHERE url = ?', (url,)
+			).fetchone()
+			if row is None:
+				self.misses += 1
+				return None
+			self._db.execute('UPDATE pages SET last_access = ? WHERE url = ?', (time.time(), url))
+		page = _page_from_row(row)
+		if page.is_fresh:
+			self.hits += 1
+		return page
+
+	def html(self, page: StoredPage) -> Optional[str]:
+		with self._lock:
+			row = self._db.execute('SELECT html FROM blobs WHERE content_hash = ?', (page.content_hash,)).fetchone()
+		return row[0] if row else None
+
+	def put(
+		self,
+		url: str,
+		html: str,
+		etag: Optional[str] = None,
+		last_modified: Optional[str] = None,
+		cache_control: Optional[str] = None,
+	) -> Optional[StoredPage]:
+		"""
+		Store the HTML for a URL. Returns None if Cache-Control forbids storing it or it exceeds max_bytes.
+
+		If the content is unchanged, validators from an earlier response are kept.
+		"""
+		if cache_control and 'no-store' in cache_control.lower():
+			return None
+		return self._store(url, html, etag, last_modified, self.ttl_for(url, cache_control))
+
+	def put_rendered(self, url: str, html: str) -> Optional[StoredPage]:
+		"""
+		Store the HTML a browser rendered for a URL, next to (not over) the HTTP response stored for it.
+
+		A fresh entry with the same content is reused as is, so re-extracting an unchanged page writes nothing.
+		"""
+		key = RENDERED_KEY_PREFIX + url
+		stored = self.get(key)
+		if stored and stored.is_fresh and stored.content_hash == _content_hash(html.encode('utf-8', 'surrogatepass')):
+			return stored
+		return self._store(key, html, None, None, self.ttl_for(url))
+
+	def _store(self, url: str, html: str, etag: Optional[str], last_modified: Optional[str], ttl: float) -> Optional[StoredPage]:
+		data = html.encode('utf-8', 'surrogatepass')
+		size = len(data)
+		if size > self.max_bytes:
+			return None
+		content_hash = _content_hash(data)
+		now = time.time()
+		expires_at = now + ttl
+
+		with self._lock:
+			previous = self._db.execute('SELECT content_hash, etag, last_modified FROM pages WHERE url = ?', (url,)).fetchone()
+			if previous and previous[0] == content_hash:
+				etag = etag or previous[1]
+				last_modified = last_modified or previous[2]
+
+			self._db.execute('BEGIN')
+			try:
+				if self._db.execute('INSERT OR IGNORE INTO blobs VALUES (?, ?, ?)', (content_hash, html, size)).rowcount:
+					self._size += size
+				self._db.execute(
+					'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)',
+					(url, content_hash, etag, last_modified, now, expires_at, now),
+				)
+				if previous and previous[0] != content_hash:
+					self._delete_orphans(previous[0])
+				self._evict()
+				self._db.execute('COMMIT')
+			except Exception:
+				self._db.execute('ROLLBACK')
+				raise
+
+		return StoredPage(
+			url=url, content_hash=content_hash, etag=etag, last_modified=last_modified, fetched_at=now, expires_at=expires_at
+		)
+
+	def refresh(self, url: str, cache_control: Optional[str] = None) -> Optional[StoredPage]:
+		"""Extend the lifetime of a page after the server confirmed it is unchanged (HTTP 304)"""
+		now = time.time()
+		with self._lock:
+			self._db.execute(
+				'UPDATE pages SET fetched_at = ?, expires_at = ?, last_access = ? WHERE url = ?',
+				(now, now + self.ttl_for(url, cache_control), now, url),
+			)
+		self.revalidated += 1
+		return self.get(url)
+
+	def text(self, page: StoredPage, variant: str, convert: Callable[[str], str]) -> str:
+		"""
+		Extracted text of a stored page, converting the HTML only on the first request per variant.
+
+		`variant` names the conversion (e.g. 'markdown' or 'markdown-no-links'), `convert` maps HTML to text.
+		"""
+		with self._lock:
+			row = self._db.execute(
+				'SELECT text FROM texts WHERE content_hash = ? AND variant = ?', (page.content_hash, variant)
+			).fetchone()
+		if row:
+			self.text_hits += 1
+			return row[0]
+
+		html = self.html(page)
+		if html is None:
+			raise KeyError(f'No stored HTML for {page.url}')
+		text = convert(html)
+		size = len(text.encode('utf-8', 'surrogatepass'))
+		with self._lock:
+			# The page may have been evicted while converting, only keep text for live content
+			if self._db.execute('SELECT 1 FROM blobs WHERE content_hash = ?', (page.content_hash,)).fetchone():
+				if self._db.execute(
+					'INSERT OR IGNORE INTO texts VALUES (?, ?, ?, ?)', (page.content_hash, variant, text, size)
+				).rowcount:
+					self._size += size
+					self._evict()
+		return text
+
+	def _delete_orphans(self, content_hash: str) -> None:
+		if self._db.execute('SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1', (content_hash,)).fetchone():
+			return
+		freed = self._db.execute(
+			'SELECT (SELECT COALESCE(SUM(size), 0) FROM blobs WHERE content_hash = ?)'
+			' + (SELECT COALESCE(SUM(size), 0) FROM texts WHERE content_hash = ?)',
+			(content_hash, content_hash),
+		).fetchone()[0]
+		self._db.execute('DELETE FROM blobs WHERE content_hash = ?', (content_hash,))
+		self._db.execute('DELETE FROM texts WHERE content_hash = ?', (content_hash,))
+		self._size -= freed
+
+	def _evict(self) -> None:
+		while self._size > self.max_bytes:
+			row = self._db.execute('SELECT url, content_hash FROM pages ORDER BY last_access LIMIT 1').fetchone()
+			if row is None:
+				break
+			self._db.execute('DELETE FROM pages WHERE url = ?', (row[0],))
+			self._delete_orphans(row[1])
+			self.evictions += 1
+			logger.debug(f'Evicted {row[0]} from page store')
+
+	@property
+	def stats(self) -> dict[str, int]:
+		return {
+			'hits': self.hits,
+			'misses': self.misses,
+			'revalidated': self.revalidated,
+			'text_hits': self.text_hits,
+			'evictions': self.evictions,
+			'size': self._size,
+		}
+
+	def close(self) -> None:
+		with self._lock:
+			self._db.close()
+
+
+def _content_hash(data: bytes) -> str:
+	return hashlib.sha256(data).hexdigest()
+
+
+def _page_from_row(row: tuple) -> StoredPage:
+	url, content_hash, etag, last_modified, fetched_at, expires_at = row
+	return StoredPage(
+		url=url,
+		content_hash=content_hash,
+		etag=etag,
+		last_modified=last_modified,
+		fetched_at=fetched_at,
+		expires_at=expires_at,
+	)
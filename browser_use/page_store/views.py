@@ -0,0 +1,28 @@
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class StoredPage(BaseModel):
+	"""A page entry in the PageStore, the HTML itself is stored once per content hash"""
+
+	url: str
+	content_hash: str
+	etag: Optional[str] = None
+	last_modified: Optional[str] = None
+	fetched_at: float
+	expires_at: float
+
+	@property
+	def is_fresh(self) -> bool:
+		return time.time() < self.expires_at
+
+	def revalidation_headers(self) -> dict[str, str]:
+		"""Conditional request headers for checking whether the stored copy is still current"""
+		headers = {}
+		if self.etag:
+			headers['If-None-Match'] = self.etag
+		if self.last_modified:
+			headers['If-Modified-Since'] = self.last_modified
+		return headers
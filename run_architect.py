@@ -22,10 +22,21 @@ it detects that the browser is being blocked.
 import argparse
 import asyncio
 import json
+from langchain_core.globals import set_llm_cache
 from browser_use.architect.agents.architect_agent import ArchitectAgent
 from browser_use.architect.agents.planner_agent import PlannerAgent
+from browser_use.architect.tools.llm_interface import set_cassette
+from browser_use.cassette.service import Cassette
+from browser_use.page_store.service import PageStore
 
-async def main(goal, show_plan_only=False):
+def use_cassette(path, mode, match, latency_factor):
+    """Record or replay every Gemini and langchain LLM call through one cassette file."""
+    cassette = Cassette(path, mode=mode, match=match, latency_factor=latency_factor)
+    set_cassette(cassette)
+    set_llm_cache(cassette)
+    return cassette
+
+async def main(goal, show_plan_only=False, research_pipeline="full", http_first=False, page_store=None, dedup_path=None):
     print(f"\n{'='*70}")
     print(f"Starting research on: {goal}")
     
@@ -52,7 +63,7 @@ async def main(goal, show_plan_only=False):
         print("fall back to using Gemini's knowledge instead of browser automation.")
         print(f"{'='*70}\n")
         
-        architect = ArchitectAgent(goal=goal)
+        architect = ArchitectAgent(goal=goal, research_pipeline=research_pipeline, http_first=http_first, page_store=page_store, dedup_path=dedup_path)
         results = await architect.run()
         
         # Pretty print results from all agents
@@ -93,5 +104,21 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run The Architect")
     parser.add_argument("--goal", type=str, required=True, help="High-level goal")
     parser.add_argument("--show-plan-only", action="store_true", help="Only show the generated plan without executing it")
+    parser.add_argument("--research-pipeline", choices=["full", "single_pass"], default="full", help="Re-parse browser results with the LLM (full) or summarize the agent history directly (single_pass)")
+    parser.add_argument("--http-first", action="store_true", help="Fetch static pages over plain HTTP and only launch a browser when needed")
+    parser.add_argument("--page-store", type=str, help="Reuse fetched pages and extracted text from this SQLite file across runs")
+    parser.add_argument("--dedup-index", type=str, help="Remember near-duplicate sources and their URLs across runs in this JSON file")
+    parser.add_argument("--cassette", type=str, help="Record/replay LLM calls to this JSONL file")
+    parser.add_argument("--cassette-mode", choices=["record", "replay", "auto"], default="auto", help="Cassette mode")
+    parser.add_argument("--cassette-match", choices=["prompt", "sequence"], default="prompt", help="Match replayed calls by prompt or by call order")
+    parser.add_argument("--replay-latency", type=float, default=0.0, help="Sleep this fraction of the recorded latency on replay")
     args = parser.parse_args()
-    asyncio.run(main(args.goal, args.show_plan_only))
\ No newline at end of file
+    cassette = None
+    if args.cassette:
+        cassette = use_cassette(args.cassette, args.cassette_mode, args.cassette_match, args.replay_latency)
+    page_store = PageStore(args.page_store) if args.page_store else None
+    asyncio.run(main(args.goal, args.show_plan_only, args.research_pipeline, args.http_first, page_store, args.dedup_index))
+    if page_store:
+        print(f"Page store {args.page_store}: {page_store.stats}")
+    if cassette:
+        print(f"Cassette {args.cassette}: {cassette.stats}")
\ No newline at end of file
@@ -0,0 +1,72 @@
+import pytest
+
+from browser_use.architect.benchmarks.orchestration import (
+	SCENARIOS,
+	BenchmarkResult,
+	build_thresholds,
+	check_thresholds,
+	run_scenario,
+	track_memory_io,
+)
+from browser_use.architect.memory import memory_manager
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('scenario', SCENARIOS)
+async def test_scenario_runs_offline(scenario):
+	"""
+	Every scenario should complete against the stubs and record LLM calls,
+	callbacks and memory-file I/O without touching the network.
+	"""
+	result = await run_scenario(scenario, 3)
+	assert result.subtasks == 3
+	assert result.llm_calls > 0
+	assert result.callbacks > 0
+	assert result.memory_writes > 0
+	# Entries are appended, the memory file is never read back during a run
+	assert result.memory_reads == 0
+	assert result.wall_time >= result.overhead_time
+
+
+@pytest.mark.asyncio
+async def test_simulated_latency_is_excluded_from_overhead():
+	"""
+	Time spent sleeping in the stubs is reported separately, so the overhead
+	stays well below the wall time when latency dominates.
+	"""
+	result = await run_scenario('architect', 2, llm_latency=0.01, browser_latency=0.01)
+	assert result.simulated_latency > 0
+	assert result.overhead_time < result.wall_time
+
+
+def test_thresholds_detect_regressions():
+	"""
+	Thresholds derived from a reference run pass for the same numbers and
+	flag metrics that grew beyond the headroom.
+	"""
+	reference = BenchmarkResult(scenario='architect', subtasks=10, overhead_time=1.0, memory_bytes_written=1000)
+	thresholds = build_thresholds([reference], headroom=1.5)
+	assert check_thresholds([reference], thresholds) == []
+
+	regressed = BenchmarkResult(scenario='architect', subtasks=10, overhead_time=2.0, memory_bytes_written=1000)
+	violations = check_thresholds([regressed], thresholds)
+	assert len(violations) == 1
+	assert 'overhead_time' in violations[0]
+
+
+@pytest.mark.asyncio
+async def test_memory_file_io_grows_linearly(tmp_path):
+	"""
+	Memory entries are appended instead of rewriting the whole file, so the bytes
+	written grow with the number of subtasks, not with its square.
+	"""
+	small = await run_scenario('architect', 10, measure_memory=False)
+	large = await run_scenario('architect', 40, measure_memory=False)
+	assert large.memory_bytes_written < 5 * small.memory_bytes_written
+
+	with track_memory_io(str(tmp_path / 'memory.jsonl')):
+		memory_manager.log_message('Researcher', 'started')
+		memory_manager.save_task_result('Researcher', 'task-1', {'summary': 'done'})
+		memory = memory_manager._load_memory()
+	assert [entry['message'] for entry in memory['logs']] == ['started']
+	assert memory['tasks'][0]['result'] == {'summary': 'done'}
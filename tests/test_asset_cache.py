@@ -0,0 +1,142 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.asset_cache.service import IMMUTABLE_LIFETIME, AssetCache, cache_lifetime
+
+
+def make_route(url, resource_type='script', method='GET', headers=None):
+	route = MagicMock()
+	route.fallback = AsyncMock()
+	route.fulfill = AsyncMock()
+	route.fetch = AsyncMock()
+	route.request.url = url
+	route.request.method = method
+	route.request.resource_type = resource_type
+	route.request.headers = {'accept': '*/*'}
+	route.request.all_headers = AsyncMock(return_value={'accept': '*/*', **(headers or {})})
+	return route
+
+
+def make_response(status, headers, body=b''):
+	response = MagicMock(status=status, headers=headers)
+	response.body = AsyncMock(return_value=body)
+	return response
+
+
+def test_cache_lifetime():
+	assert cache_lifetime({'cache-control': 'public, max-age=600'}) == 600
+	assert cache_lifetime({'cache-control': 'max-age=60, s-maxage=3600'}) == 3600
+	assert cache_lifetime({'cache-control': 'public, immutable'}) == IMMUTABLE_LIFETIME
+	assert cache_lifetime({'cache-control': 'no-cache', 'etag': '"a"'}) == 0
+	assert cache_lifetime({'cache-control': 'no-cache'}) is None
+	assert cache_lifetime({'cache-control': 'no-store, max-age=600'}) is None
+	assert cache_lifetime({'cache-control': 'private, max-age=600'}) is None
+	assert cache_lifetime({'cache-control': 'max-age=600', 'set-cookie': 'a=b'}) is None
+	assert cache_lifetime({'cache-control': 'max-age=600', 'vary': 'Accept-Encoding'}) == 600
+	assert cache_lifetime({'cache-control': 'max-age=600', 'vary': 'Cookie'}) is None
+	assert cache_lifetime({'date': 'Mon, 01 Jan 2024 00:00:00 GMT', 'expires': 'Mon, 01 Jan 2024 01:00:00 GMT'}) == 3600
+	assert (
+		cache_lifetime({'date': 'Mon, 11 Jan 2024 00:00:00 GMT', 'last-modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}) == 24 * 3600
+	)
+	assert cache_lifetime({}) is None
+
+
+def test_store_deduplicates_and_evicts_least_recently_used(tmp_path):
+	cache = AssetCache(tmp_path, max_bytes=250)
+	headers = {'Content-Type': 'text/javascript', 'Cache-Control': 'max-age=600', 'Content-Encoding': 'gzip'}
+
+	asset = cache.store('https://a.example/app.js', 200, headers, b'a' * 100)
+	assert asset.headers == {'content-type': 'text/javascript', 'cache-control': 'max-age=600'}
+	cache.store('https://b.example/app.js', 200, headers, b'a' * 100)
+	assert cache.size == 100
+	assert cache.store('https://a.example/private.js', 200, {'cache-control': 'private'}, b'p') is None
+	assert cache.store('https://a.example/missing.js', 404, headers, b'') is None
+
+	cache.store('https://a.example/lib.js', 200, headers, b'l' * 100)
+	cache.lookup('https://b.example/app.js')
+	cache.store('https://a.example/vendor.js', 200, headers, b'v' * 100)
+	# Evicting a.example/app.js frees nothing while b.example/app.js shares its body, so lib.js goes too
+	assert cache.lookup('https://a.example/app.js') is None
+	assert cache.lookup('https://a.example/lib.js') is None
+	assert cache.read(cache.lookup('https://b.example/app.js')) == b'a' * 100
+	assert cache.size == 200
+	assert cache.stats.evictions == 2
+	cache.close()
+
+	# The index and blobs are shared through the directory
+	reopened = AssetCache(tmp_path, max_bytes=250)
+	assert reopened.size == 200
+	assert reopened.read(reopened.lookup('https://a.example/vendor.js')) == b'v' * 100
+	reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_routes_hits_misses_and_revalidation(tmp_path):
+	cache = AssetCache(tmp_path)
+	url = 'https://cdn.example/bundle.js'
+
+	miss = make_route(url)
+	miss.fetch.return_value = make_response(
+		200, {'content-type': 'text/javascript', 'cache-control': 'max-age=600', 'etag': '"v1"'}, b'js'
+	)
+	await cache._handle(miss)
+	miss.fetch.assert_awaited_once_with(headers=None)
+	miss.fulfill.assert_awaited_once_with(response=miss.fetch.return_value, body=b'js')
+
+	hit = make_route(url)
+	await cache._handle(hit)
+	hit.fetch.assert_not_awaited()
+	hit.fulfill.assert_awaited_once()
+	assert hit.fulfill.call_args.kwargs['body'] == b'js'
+
+	# Once stale, the cached copy is revalidated with its ETag and reused on 304
+	cache._db.execute('UPDATE assets SET expires_at = ?', (time.time() - 1,))
+	stale = make_route(url)
+	stale.fetch.return_value = make_response(304, {'cache-control': 'max-age=600'})
+	await cache._handle(stale)
+	assert stale.fetch.call_args.kwargs['headers']['if-none-match'] == '"v1"'
+	assert stale.fulfill.call_args.kwargs['body'] == b'js'
+	assert cache.lookup(url).is_fresh
+
+	# Non-GET requests, documents and uncacheable responses go to the next route handler or the network
+	post = make_route(url, method='POST')
+	document = make_route('https://cdn.example/', resource_type='document')
+	for route in (post, document):
+		await cache._handle(route)
+		route.fallback.assert_awaited_once()
+	no_store = make_route('https://cdn.example/live.js')
+	no_store.fetch.return_value = make_response(200, {'cache-control': 'no-store'}, b'live')
+	await cache._handle(no_store)
+	await cache._handle(no_store)
+	assert no_store.fetch.await_count == 2
+
+	stats = cache.stats
+	assert (stats.hits, stats.revalidated, stats.misses, stats.stored) == (1, 1, 3, 1)
+	assert stats.bytes_served == 4
+	assert stats.hit_rate == 0.4
+	cache.close()
+
+
+@pytest.mark.asyncio
+async def test_credentialed_responses_are_stored_only_when_shared(tmp_path):
+	cache = AssetCache(tmp_path)
+	assert cache_lifetime({'cache-control': 'max-age=600'}, credentialed=True) is None
+	assert cache_lifetime({'cache-control': 'public, max-age=600'}, credentialed=True) == 600
+	assert cache_lifetime({'cache-control': 's-maxage=60'}, credentialed=True) == 60
+
+	for url, cache_control, headers in (
+		('https://app.example/private.js', 'max-age=600', {'cookie': 'session=1'}),
+		('https://app.example/account.js', 'max-age=600', {'Authorization': 'Bearer token'}),
+		('https://app.example/vendor.js', 'public, max-age=600', {'cookie': 'session=1'}),
+	):
+		route = make_route(url, headers=headers)
+		route.fetch.return_value = make_response(200, {'cache-control': cache_control}, b'js')
+		await cache._handle(route)
+		route.fulfill.assert_awaited_once()
+
+	assert cache.lookup('https://app.example/private.js') is None
+	assert cache.lookup('https://app.example/account.js') is None
+	assert cache.lookup('https://app.example/vendor.js') is not None
+	cache.close()
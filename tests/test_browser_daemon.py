@@ -0,0 +1,142 @@
+"""
+The daemon's Chromium launch is replaced by a fake CDP URL, so these tests cover the control
+socket protocol, client tracking, idle shutdown and Browser auto-detection.
+"""
+
+import asyncio
+
+import pytest
+
+from browser_use.browser.browser import Browser, BrowserConfig
+from browser_use.browser.daemon import BrowserDaemon, BrowserDaemonClient, BrowserDaemonConfig
+
+CDP_URL = 'http://127.0.0.1:9333'
+
+
+class FakeBrowserDaemon(BrowserDaemon):
+	def __init__(self, config):
+		super().__init__(config)
+		self.resets = 0
+
+	async def _launch_browser(self):
+		self.cdp_url = CDP_URL
+
+	async def _reset_browser(self):
+		self.resets += 1
+
+
+@pytest.fixture
+async def daemon(tmp_path, monkeypatch):
+	socket_path = tmp_path / 'daemon.sock'
+	monkeypatch.setenv('BROWSER_USE_DAEMON_SOCKET', str(socket_path))
+	daemon = FakeBrowserDaemon(BrowserDaemonConfig(idle_timeout=0))
+	task = asyncio.create_task(daemon.serve())
+	while not socket_path.exists():
+		await asyncio.sleep(0.01)
+	yield daemon
+	daemon.stop()
+	await task
+
+
+async def settle():
+	for _ in range(10):
+		await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_clients_attach_and_detach(daemon):
+	observer = await BrowserDaemonClient.connect()
+	assert (await observer.status())['clients'] == 0
+
+	client = await BrowserDaemonClient.connect()
+	assert await client.attach() == CDP_URL
+	assert (await observer.status())['clients'] == 1
+
+	# Closing the control connection detaches the client, also when it crashes
+	await client.close()
+	await settle()
+	assert (await observer.status())['clients'] == 0
+	assert daemon.resets == 1
+	await observer.close()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_and_idle_timeout(tmp_path):
+	socket_path = tmp_path / 'daemon.sock'
+	daemon = FakeBrowserDaemon(BrowserDaemonConfig(socket_path=socket_path, idle_timeout=0))
+	task = asyncio.create_task(daemon.serve())
+	while not socket_path.exists():
+		await asyncio.sleep(0.01)
+	client = await BrowserDaemonClient.connect(socket_path)
+	await client.shutdown()
+	await client.close()
+	await asyncio.wait_for(task, timeout=5)
+	assert not socket_path.exists()
+	assert await BrowserDaemonClient.connect(socket_path) is None
+
+	idle_daemon = FakeBrowserDaemon(BrowserDaemonConfig(socket_path=socket_path, idle_timeout=0.05))
+	await asyncio.wait_for(idle_daemon.serve(), timeout=5)
+	assert not socket_path.exists()
+
+
+def fake_playwright(monkeypatch, attach: bool):
+	class DummyBrowser:
+		async def close(self):
+			pass
+
+	class DummyChromium:
+		async def connect_over_cdp(self, endpoint_url):
+			assert attach, 'Browser should launch its own chromium instead of attaching to the daemon'
+			assert endpoint_url == CDP_URL
+			return DummyBrowser()
+
+		async def launch(self, **kwargs):
+			assert not attach, 'Browser should attach to the daemon instead of launching'
+			return DummyBrowser()
+
+	class DummyPlaywright:
+		def __init__(self):
+			self.chromium = DummyChromium()
+
+		async def stop(self):
+			pass
+
+	class DummyAsyncPlaywrightContext:
+		async def start(self):
+			return DummyPlaywright()
+
+	monkeypatch.setattr('browser_use.browser.browser.async_playwright', lambda: DummyAsyncPlaywrightContext())
+	return DummyBrowser
+
+
+@pytest.mark.asyncio
+async def test_browser_attaches_to_running_daemon(daemon, monkeypatch):
+	DummyBrowser = fake_playwright(monkeypatch, attach=True)
+	browser = Browser(config=BrowserConfig(headless=True, use_daemon=True))
+	assert isinstance(await browser.get_playwright_browser(), DummyBrowser)
+	assert daemon.status()['clients'] == 1
+
+	await browser.close()
+	await settle()
+	assert daemon.status()['clients'] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	'config',
+	[
+		BrowserConfig(headless=True),
+		BrowserConfig(headless=False, use_daemon=True),
+		BrowserConfig(headless=True, use_daemon=True, disable_security=False),
+		BrowserConfig(headless=True, use_daemon=True, extra_browser_args=['--lang=de']),
+		BrowserConfig(headless=True, use_daemon=True, proxy={'server': 'http://proxy.example:8080'}),
+	],
+)
+async def test_browser_launches_when_daemon_is_off_or_does_not_match(daemon, monkeypatch, config):
+	fake_playwright(monkeypatch, attach=False)
+	monkeypatch.setattr(Browser, '_setup_builtin_browser', lambda self, playwright: playwright.chromium.launch())
+	browser = Browser(config=config)
+	await browser.get_playwright_browser()
+	await settle()
+	assert daemon.status()['clients'] == 0
+	await browser.close()
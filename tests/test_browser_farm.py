@@ -0,0 +1,237 @@
+"""
+BrowserFarm routing and failover run against fake CDP endpoints (HTTP servers answering
+/json/version). test_farm_with_local_chromium runs the farm against several headless Chromium
+instances started by the test and is skipped when Playwright's Chromium is not installed.
+"""
+
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from playwright.async_api import async_playwright
+
+from browser_use.browser import farm as farm_module
+from browser_use.browser.farm import BrowserFarm, BrowserFarmConfig
+
+
+class VersionHandler(BaseHTTPRequestHandler):
+	def do_GET(self):
+		body = b'{"Browser": "HeadlessChrome"}'
+		self.send_response(200)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format, *args):
+		pass
+
+
+class FakeEndpoint:
+	def __init__(self):
+		self.server = ThreadingHTTPServer(('127.0.0.1', 0), VersionHandler)
+		self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+		threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+	def stop(self):
+		self.server.shutdown()
+		self.server.server_close()
+
+
+class FakeFarmBrowser:
+	broken: set[str] = set()
+
+	def __init__(self, endpoint_url, config, connect_timeout=20.0):
+		self.endpoint_url = endpoint_url
+		self.playwright_browser = None
+
+	async def get_playwright_browser(self):
+		if self.endpoint_url in FakeFarmBrowser.broken:
+			raise ConnectionError('connect_over_cdp failed')
+		self.playwright_browser = MagicMock()
+		self.playwright_browser.is_connected.return_value = True
+		return self.playwright_browser
+
+	async def _stop_playwright(self):
+		pass
+
+
+class FakeContext:
+	def __init__(self, browser, config=None):
+		self.browser = browser
+
+	async def get_session(self):
+		return MagicMock()
+
+	async def close(self):
+		pass
+
+
+@pytest.fixture
+def endpoints(monkeypatch):
+	FakeFarmBrowser.broken = set()
+	monkeypatch.setattr(farm_module, 'FarmBrowser', FakeFarmBrowser)
+	monkeypatch.setattr(farm_module, 'BrowserContext', FakeContext)
+	servers = [FakeEndpoint() for _ in range(3)]
+	yield servers
+	for server in servers:
+		try:
+			server.stop()
+		except Exception:
+			pass
+
+
+def farm_config(urls, **kwargs):
+	return BrowserFarmConfig(endpoints=urls, health_check_interval=0, health_check_timeout=1, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_routes_to_least_loaded_endpoint(endpoints):
+	async with BrowserFarm(farm_config([server.url for server in endpoints])) as farm:
+		contexts = [await farm.new_context() for _ in range(6)]
+		assert [stats.open_contexts for stats in farm.stats()] == [2, 2, 2]
+
+		for context in contexts[:2]:
+			await farm.close_context(context)
+		busiest = max(farm.stats(), key=lambda stats: stats.open_contexts)
+		context = await farm.new_context()
+		assert context.browser.endpoint_url != busiest.url
+
+
+@pytest.mark.asyncio
+async def test_fails_over_when_connect_fails(endpoints):
+	urls = [server.url for server in endpoints]
+	FakeFarmBrowser.broken = {urls[0], urls[1]}
+	async with BrowserFarm(farm_config(urls)) as farm:
+		# Equal load and latency, endpoints are tried in order
+		for endpoint in farm.endpoints:
+			endpoint.latencies.clear()
+		context = await farm.new_context()
+		stats = {stats.url: stats for stats in farm.stats()}
+
+	assert context.browser.endpoint_url == urls[2]
+	assert not stats[urls[0]].healthy and not stats[urls[1]].healthy
+	assert stats[urls[2]].open_contexts == 1
+
+
+@pytest.mark.asyncio
+async def test_health_checks_remove_and_restore_endpoints(endpoints):
+	urls = [server.url for server in endpoints]
+	async with BrowserFarm(farm_config(urls[:2], max_contexts_per_endpoint=1)) as farm:
+		assert all(stats.healthy and stats.avg_latency > 0 for stats in farm.stats())
+
+		endpoints[0].stop()
+		await farm.check_health()
+		assert [stats.healthy for stats in farm.stats()] == [False, True]
+
+		await farm.new_context()
+		with pytest.raises(RuntimeError):
+			await farm.new_context()
+
+	async with BrowserFarm(farm_config(['ws://127.0.0.1:9/devtools/browser/abc', urls[2]])) as farm:
+		assert [stats.healthy for stats in farm.stats()] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_leased_context_survives_failed_health_check(endpoints):
+	urls = [server.url for server in endpoints]
+	async with BrowserFarm(farm_config(urls[:2])) as farm:
+		for endpoint in farm.endpoints:
+			endpoint.latencies.clear()
+		async with farm.lease() as context:
+			assert context.browser.endpoint_url == urls[0]
+			endpoints[0].stop()
+			await farm.check_health()
+
+			# No new contexts go to the endpoint, the leased one keeps its connection and slot
+			stats = farm.stats()[0]
+			assert not stats.healthy and stats.connected and stats.open_contexts == 1
+			assert context.browser.playwright_browser is not None
+			assert (await farm.new_context()).browser.endpoint_url == urls[1]
+		assert farm.stats()[0].open_contexts == 0
+
+
+@pytest.mark.asyncio
+async def test_lost_connection_fails_contexts_and_frees_slots(endpoints):
+	async with BrowserFarm(farm_config([endpoints[0].url])) as farm:
+		async with farm.lease() as context:
+			context.browser.playwright_browser.is_connected.return_value = False
+			await farm.check_health()
+			stats = farm.stats()[0]
+			assert not stats.healthy and not stats.connected and stats.open_contexts == 0
+
+			await farm.check_health()
+			assert farm.stats()[0].healthy
+		assert farm.stats()[0].open_contexts == 0
+
+
+def free_port():
+	with socket.socket() as s:
+		s.bind(('127.0.0.1', 0))
+		return s.getsockname()[1]
+
+
+@pytest.fixture
+async def chromium_endpoints():
+	playwright = await async_playwright().start()
+	executable = playwright.chromium.executable_path
+	await playwright.stop()
+	if not os.path.exists(executable):
+		pytest.skip('Playwright Chromium is not installed')
+
+	processes, profiles, urls = [], [], []
+	for _ in range(2):
+		port = free_port()
+		profile = tempfile.mkdtemp()
+		processes.append(
+			subprocess.Popen(
+				[executable, '--headless=new', f'--remote-debugging-port={port}', f'--user-data-dir={profile}', 'about:blank'],
+				stdout=subprocess.DEVNULL,
+				stderr=subprocess.DEVNULL,
+			)
+		)
+		profiles.append(profile)
+		urls.append(f'http://127.0.0.1:{port}')
+
+	async with httpx.AsyncClient() as client:
+		for url in urls:
+			for _ in range(50):
+				try:
+					await client.get(f'{url}/json/version')
+					break
+				except httpx.HTTPError:
+					await asyncio.sleep(0.2)
+
+	yield urls, processes
+	for process in processes:
+		process.kill()
+		process.wait()
+	for profile in profiles:
+		shutil.rmtree(profile, ignore_errors=True)
+
+
+@pytest.mark.asyncio
+async def test_farm_with_local_chromium(chromium_endpoints):
+	urls, processes = chromium_endpoints
+	async with BrowserFarm(farm_config(urls)) as farm:
+		first = await farm.new_context()
+		second = await farm.new_context()
+		assert {first.browser.endpoint_url, second.browser.endpoint_url} == set(urls)
+
+		page = await first.get_current_page()
+		await page.goto('data:text/html,<title>farm</title>')
+		assert await page.title() == 'farm'
+
+		processes[0].kill()
+		processes[0].wait()
+		await farm.check_health()
+		context = await farm.new_context()
+		assert context.browser.endpoint_url == urls[1]
@@ -0,0 +1,223 @@
+"""
+BrowserPool tests run against in-memory fakes of Browser and BrowserContext,
+so they exercise leasing, resets and recycling without launching Chromium.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser import pool as pool_module
+from browser_use.browser.browser import BrowserConfig
+from browser_use.browser.context import BrowserContextState
+from browser_use.browser.pool import BrowserPool, BrowserPoolConfig, fast_reset
+
+
+class FakePage:
+	def __init__(self, context, url='about:blank'):
+		self.context = context
+		self.url = url
+		self.closed = False
+		self.evaluate = AsyncMock(return_value=1)
+
+	def is_closed(self):
+		return self.closed
+
+	async def close(self):
+		self.closed = True
+		self.context.pages.remove(self)
+
+	async def goto(self, url):
+		self.url = url
+
+
+class FakePlaywrightContext:
+	def __init__(self):
+		self.pages = [FakePage(self)]
+		self.cookies_cleared = 0
+		self.cdp = MagicMock()
+		self.cdp.send = AsyncMock()
+		self.cdp.detach = AsyncMock()
+
+	async def new_page(self):
+		page = FakePage(self)
+		self.pages.append(page)
+		return page
+
+	async def storage_state(self):
+		return {'cookies': [], 'origins': [{'origin': 'https://stored.example', 'localStorage': []}]}
+
+	async def new_cdp_session(self, page):
+		return self.cdp
+
+	async def clear_cookies(self):
+		self.cookies_cleared += 1
+
+	async def clear_permissions(self):
+		pass
+
+
+class FakeBrowser:
+	launches = 0
+
+	def __init__(self, config=None):
+		self.config = config or BrowserConfig()
+		self.playwright = None
+		self.playwright_browser = None
+
+	async def get_playwright_browser(self):
+		FakeBrowser.launches += 1
+		self.playwright_browser = MagicMock()
+		self.playwright_browser.is_connected.return_value = True
+		self.playwright_browser.close = AsyncMock()
+		return self.playwright_browser
+
+	async def _stop_playwright(self):
+		self.playwright = None
+
+	async def close(self):
+		self.playwright_browser = None
+
+
+class FakeContext:
+	def __init__(self, browser, config=None):
+		self.browser = browser
+		self.config = config
+		self.state = BrowserContextState()
+		self.session = None
+		self.closed = False
+
+	async def get_session(self):
+		if self.session is None:
+			self.session = MagicMock()
+			self.session.context = FakePlaywrightContext()
+		return self.session
+
+	async def get_current_page(self):
+		session = await self.get_session()
+		return session.context.pages[-1]
+
+	async def close(self):
+		self.closed = True
+
+
+@pytest.fixture
+def fake_browsers(monkeypatch):
+	FakeBrowser.launches = 0
+	monkeypatch.setattr(pool_module, 'Browser', FakeBrowser)
+	monkeypatch.setattr(pool_module, 'BrowserContext', FakeContext)
+
+
+async def settle():
+	for _ in range(5):
+		await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_lease_reuses_warm_contexts(fake_browsers):
+	async with BrowserPool(BrowserPoolConfig(size=2)) as pool:
+		assert FakeBrowser.launches == 2
+		seen = set()
+		for _ in range(4):
+			async with pool.lease() as context:
+				seen.add(id(context))
+		stats = pool.stats()
+
+	assert FakeBrowser.launches == 2
+	assert len(seen) <= 2
+	assert stats.acquisitions == 4
+	assert stats.resets == 4
+	assert stats.max_acquire_time >= stats.avg_acquire_time >= 0
+
+
+@pytest.mark.asyncio
+async def test_fast_reset_clears_state(fake_browsers):
+	context = FakeContext(FakeBrowser())
+	session = await context.get_session()
+	playwright_context = session.context
+	playwright_context.pages[0].url = 'https://visited.example/page'
+	await playwright_context.new_page()
+	context.state.target_id = 'target'
+
+	await fast_reset(context)
+
+	assert len(playwright_context.pages) == 1
+	assert playwright_context.pages[0].url == 'about:blank'
+	assert playwright_context.cookies_cleared == 1
+	cleared = {call.args[1]['origin'] for call in playwright_context.cdp.send.call_args_list}
+	assert cleared == {'https://visited.example', 'https://stored.example'}
+	assert context.state.target_id is None
+	assert session.cached_state is None
+
+
+@pytest.mark.asyncio
+async def test_context_recycled_after_max_leases(fake_browsers):
+	async with BrowserPool(BrowserPoolConfig(size=1, max_leases_per_context=2)) as pool:
+		first = await pool.acquire()
+		await pool.release(first)
+		assert await pool.acquire() is first
+		await pool.release(first)
+		await settle()
+		second = await pool.acquire()
+		await pool.release(second)
+		stats = pool.stats()
+
+	assert first.closed
+	assert second is not first
+	assert stats.recycled_contexts == 1
+	assert FakeBrowser.launches == 1
+
+
+@pytest.mark.asyncio
+async def test_browser_recycled_after_max_leases(fake_browsers):
+	async with BrowserPool(BrowserPoolConfig(size=1, max_leases_per_browser=1)) as pool:
+		async with pool.lease():
+			pass
+		await settle()
+		async with pool.lease():
+			pass
+		stats = pool.stats()
+
+	assert stats.recycled_browsers >= 1
+	assert FakeBrowser.launches >= 2
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_context_is_replaced(fake_browsers):
+	async with BrowserPool(BrowserPoolConfig(size=1, health_check_timeout=0.1)) as pool:
+		context = await pool.acquire()
+		await pool.release(context)
+		page = await context.get_current_page()
+		page.evaluate.side_effect = RuntimeError('Target crashed')
+
+		replacement = await pool.acquire()
+		stats = pool.stats()
+		await pool.release(replacement)
+
+	assert replacement is not context
+	assert stats.failed_health_checks == 1
+
+
+@pytest.mark.asyncio
+async def test_acquire_times_out_when_exhausted(fake_browsers):
+	async with BrowserPool(BrowserPoolConfig(size=1, acquire_timeout=0.05)) as pool:
+		context = await pool.acquire()
+		with pytest.raises(TimeoutError):
+			await pool.acquire()
+		await pool.release(context)
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_process_wide_httpx_clients(fake_browsers, monkeypatch):
+	browser_close = AsyncMock()
+	monkeypatch.setattr(FakeBrowser, 'close', browser_close)
+	async with BrowserPool(BrowserPoolConfig(size=2)) as pool:
+		connections = [owner.browser.playwright_browser for owner in pool._browsers]
+		async with pool.lease():
+			pass
+
+	# Browser.close() would also close every httpx client in the process
+	browser_close.assert_not_awaited()
+	for connection in connections:
+		connection.close.assert_awaited_once()
@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage
+
+from browser_use.architect.tools import llm_interface
+from browser_use.cassette.service import Cassette
+from browser_use.cassette.views import CassetteMissError
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+	return tmp_path / 'llm.jsonl'
+
+
+@pytest.mark.asyncio
+async def test_chat_model_record_and_replay(cassette_path):
+	"""
+	A recorded langchain response is replayed without calling the model again.
+	"""
+	recorder = Cassette(cassette_path, mode='record').attach(FakeListChatModel(responses=['first', 'second']))
+	recorded = await recorder.ainvoke([HumanMessage(content='hello')])
+	assert recorded.content == 'first'
+
+	model = FakeListChatModel(responses=['first', 'second'])
+	Cassette(cassette_path, mode='replay').attach(model)
+	replayed = await model.ainvoke([HumanMessage(content='hello')])
+	assert replayed.content == 'first'
+	# The sync path used by extract_content replays as well
+	assert model.invoke([HumanMessage(content='hello')]).content == 'first'
+	assert model.i == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_raises(cassette_path):
+	"""
+	Replay mode never falls through to the model.
+	"""
+	model = FakeListChatModel(responses=['unused'])
+	Cassette(cassette_path, mode='replay').attach(model)
+	with pytest.raises(CassetteMissError):
+		await model.ainvoke([HumanMessage(content='not recorded')])
+
+
+@pytest.mark.asyncio
+async def test_latency_simulation(cassette_path):
+	"""
+	Recorded latencies are kept and replayed scaled by latency_factor.
+	"""
+
+	async def slow_call():
+		await asyncio.sleep(0.05)
+		return 'answer'
+
+	recorder = Cassette(cassette_path, mode='record')
+	assert await recorder.aplay('gemini', 'prompt', slow_call) == 'answer'
+
+	async def fail():
+		raise AssertionError('should be replayed')
+
+	start = time.perf_counter()
+	assert await Cassette(cassette_path, mode='replay').aplay('gemini', 'prompt', fail) == 'answer'
+	assert time.perf_counter() - start < 0.05
+
+	simulated = Cassette(cassette_path, mode='replay', latency_factor=1.0)
+	start = time.perf_counter()
+	assert await simulated.aplay('gemini', 'prompt', fail) == 'answer'
+	assert time.perf_counter() - start >= 0.05
+	assert simulated.stats['simulated_latency'] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_sequence_matching_ignores_prompt_changes(cassette_path):
+	"""
+	In sequence mode calls are replayed in recorded order even if prompts differ.
+	"""
+	recorder = Cassette(cassette_path, mode='record')
+	for answer in ('one', 'two'):
+
+		async def call(answer=answer):
+			return answer
+
+		await recorder.aplay('gemini', f'prompt with screenshot {answer}', call)
+
+	replay = Cassette(cassette_path, mode='replay', match='sequence')
+	assert await replay.aplay('gemini', 'changed prompt', None) == 'one'
+	assert await replay.aplay('gemini', 'another prompt', None) == 'two'
+	with pytest.raises(CassetteMissError):
+		await replay.aplay('gemini', 'one too many', None)
+
+
+@pytest.mark.asyncio
+async def test_llm_interface_uses_cassette(cassette_path, monkeypatch):
+	"""
+	Gemini calls made through llm_interface are recorded once and replayed offline.
+	"""
+	calls = []
+
+	class DummyResponse:
+		text = ' recorded summary '
+
+	class DummyModel:
+		def __init__(self, model_name):
+			self.model_name = model_name
+
+		def generate_content(self, prompt):
+			calls.append(prompt)
+			return DummyResponse()
+
+	monkeypatch.setattr(llm_interface.genai, 'GenerativeModel', DummyModel)
+	monkeypatch.setattr(llm_interface, '_cassette', None)
+
+	llm_interface.set_cassette(Cassette(cassette_path, mode='auto'))
+	assert await llm_interface.summarize('some text') == 'recorded summary'
+	llm_interface.set_cassette(Cassette(cassette_path, mode='replay'))
+	assert await llm_interface.summarize('some text') == 'recorded summary'
+	assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_interface_replay_miss_is_not_a_model_failure(cassette_path, monkeypatch):
+	"""
+	A replay miss raises instead of turning into a failure string, an error dict or retries.
+	"""
+
+	class UnreachableModel:
+		def __init__(self, model_name):
+			raise AssertionError('replay must not call Gemini')
+
+	sleeps = []
+
+	async def no_sleep(seconds):
+		sleeps.append(seconds)
+
+	monkeypatch.setattr(llm_interface.genai, 'GenerativeModel', UnreachableModel)
+	monkeypatch.setattr(llm_interface.asyncio, 'sleep', no_sleep)
+	monkeypatch.setattr(llm_interface, '_cassette', None)
+	llm_interface.set_cassette(Cassette(cassette_path, mode='replay'))
+
+	with pytest.raises(CassetteMissError):
+		await llm_interface._run_llm('not recorded')
+	with pytest.raises(CassetteMissError):
+		await llm_interface.run_and_parse('not recorded')
+	with pytest.raises(CassetteMissError):
+		await llm_interface._run_llm_with_retry('not recorded')
+	assert sleeps == []
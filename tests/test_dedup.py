@@ -0,0 +1,75 @@
+import pytest
+
+from browser_use.architect.agents import summarizer_agent
+from browser_use.architect.agents.summarizer_agent import SummarizerAgent
+from browser_use.architect.benchmarks.orchestration import track_memory_io
+from browser_use.architect.tools.dedup import NearDuplicateIndex, Source, simhash
+
+ARTICLE = ' '.join(
+	f'Sentence {i} of the syndicated article explains how the new Python release improves performance.' for i in range(30)
+)
+OTHER = ' '.join(f'Paragraph {i} describes a completely unrelated gardening technique for tomatoes.' for i in range(30))
+
+
+def test_simhash_tolerates_small_edits():
+	original, _ = simhash(ARTICLE)
+	syndicated, _ = simhash('Reprinted with permission. ' + ARTICLE + ' Subscribe to our newsletter.')
+	other, _ = simhash(OTHER)
+	assert bin(original ^ syndicated).count('1') <= 3
+	assert bin(original ^ other).count('1') > 3
+
+
+def test_collapse_keeps_provenance_and_counts_tokens():
+	index = NearDuplicateIndex()
+	sources = [
+		Source(text=ARTICLE, urls=['https://a.example/post']),
+		Source(text=OTHER, urls=['https://garden.example']),
+		Source(text='Reprinted with permission. ' + ARTICLE, urls=['https://b.example/copy']),
+	]
+	unique = index.collapse(sources)
+
+	assert [source.text for source in unique] == [ARTICLE, OTHER]
+	assert unique[0].urls == ['https://a.example/post', 'https://b.example/copy']
+	assert 'https://b.example/copy' in unique[0].format()
+	assert index.duplicates_collapsed == 1
+	assert index.tokens_saved == len(sources[2].text) // 3
+
+
+def test_short_texts_only_match_exactly():
+	index = NearDuplicateIndex()
+	unique = index.collapse([Source(text='Price is 10 dollars'), Source(text='Price is 12 dollars')])
+	assert len(unique) == 2
+
+
+def test_index_persists_across_runs(tmp_path):
+	path = str(tmp_path / 'dedup.json')
+	first_run = NearDuplicateIndex(path)
+	first_run.collapse([Source(text=ARTICLE, urls=['https://a.example/post'])])
+	first_run.save()
+
+	second_run = NearDuplicateIndex(path)
+	unique = second_run.collapse([Source(text=ARTICLE + ' Updated.', urls=['https://c.example/mirror'])])
+	assert unique[0].urls == ['https://a.example/post', 'https://c.example/mirror']
+
+
+@pytest.mark.asyncio
+async def test_summarizer_lists_duplicate_results_once(tmp_path, monkeypatch):
+	prompts = []
+
+	async def fake_summarize(text, model=None):
+		prompts.append(text)
+		return 'summary'
+
+	monkeypatch.setattr(summarizer_agent, 'summarize', fake_summarize)
+	results = [
+		{'subtask': 'Research source A', 'agent_type': 'Researcher', 'result': ARTICLE},
+		{'subtask': 'Research source B', 'agent_type': 'Researcher', 'result': ARTICLE + ' Read more.'},
+		{'subtask': 'Write intro', 'agent_type': 'Writer', 'result': OTHER},
+	]
+	index = NearDuplicateIndex()
+	with track_memory_io(str(tmp_path / 'memory.json')):
+		assert await SummarizerAgent('goal', results, dedup_index=index).run() == 'summary'
+
+	assert prompts[0].count(ARTICLE) == 1
+	assert '(Same result for: Result 2: [Researcher] Research source B)' in prompts[0]
+	assert index.tokens_saved > 0
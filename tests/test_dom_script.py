@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from browser_use.dom.service import BUILD_DOM_TREE_JS, BUILD_DOM_TREE_VERSION, DomService
+
+EXTRACTION = {
+	'rootId': 0,
+	'map': {'0': {'tagName': 'body', 'xpath': '', 'children': [], 'isVisible': True}},
+}
+
+
+class FakePage:
+	"""Answers like a page where buildDomTree.js is resident once a script installed it"""
+
+	def __init__(self):
+		self.url = 'https://news.example/'
+		self.installed_version = None
+		self.sent_bytes = []
+
+	async def evaluate(self, script, args=None):
+		self.sent_bytes.append(len(script))
+		if script == '1+1':
+			return 2
+		if 'window.__browserUseBuildDomTree = ' in script:
+			self.installed_version = BUILD_DOM_TREE_VERSION
+		elif self.installed_version != BUILD_DOM_TREE_VERSION:
+			return {'notInstalled': True}
+		if 'domArgs' in script:
+			return {'title': 'News', 'scrollY': 0, 'viewportHeight': 800, 'scrollHeight': 800, 'dom': EXTRACTION}
+		return EXTRACTION
+
+
+@pytest.mark.asyncio
+async def test_build_dom_tree_is_sent_once_per_document():
+	page = FakePage()
+
+	await DomService(page).get_page_state()
+	# Stub, then the stub with buildDomTree.js
+	assert len(page.sent_bytes) == 2
+	assert page.sent_bytes[1] > len(BUILD_DOM_TREE_JS)
+
+	page.sent_bytes.clear()
+	await DomService(page).get_page_state()
+	await DomService(page).get_clickable_elements()
+	assert max(page.sent_bytes) < 2_000
+
+	# A new document (or an older version of the script) gets it again
+	page.installed_version = None
+	page.sent_bytes.clear()
+	state = await DomService(page).get_page_state()
+	assert len(page.sent_bytes) == 2
+	assert state.title == 'News'
+
+
+def test_script_is_read_once():
+	page = MagicMock()
+	assert DomService(page).js_code is DomService(page).js_code
@@ -0,0 +1,77 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.dom.benchmarks.wire_format import encode_columnar, synthetic_page
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMElementNode, DOMElementView, DOMStore, DOMTextNode
+
+
+def walk(node):
+	yield node
+	if isinstance(node, DOMElementNode):
+		for child in node.children:
+			yield from walk(child)
+
+
+def test_store_answers_like_the_object_tree():
+	columnar = encode_columnar(synthetic_page(3_000))['columnar']
+	tree, selector_map = DomService._decode_columnar_dom_tree(columnar)
+	store = DOMStore(columnar)
+
+	nodes = list(walk(tree))
+	positions = {id(node): position for position, node in enumerate(nodes)}
+	assert len(store) == len(nodes)
+	for position, node in enumerate(nodes):
+		view = store.view(position)
+		assert view.is_visible == node.is_visible
+		assert (view.parent.position if view.parent else None) == (positions[id(node.parent)] if node.parent else None)
+		if isinstance(node, DOMTextNode):
+			assert view.text == node.text
+			continue
+		assert (view.tag_name, view.xpath, view.attributes) == (node.tag_name, node.xpath, node.attributes)
+		assert (view.is_interactive, view.is_top_element, view.is_in_viewport, view.shadow_root) == (
+			node.is_interactive,
+			node.is_top_element,
+			node.is_in_viewport,
+			node.shadow_root,
+		)
+		assert view.highlight_index == node.highlight_index
+		assert [child.position for child in view.children] == [positions[id(child)] for child in node.children]
+
+	assert {index: view.xpath for index, view in store.selector_map().items()} == {
+		index: node.xpath for index, node in selector_map.items()
+	}
+	assert [view.position for view in store.interactive_in_viewport()] == [
+		position for position, node in enumerate(nodes) if getattr(node, 'is_interactive', False) and node.is_in_viewport
+	]
+
+	texts = store.texts_till_next_clickable()
+	for index, node in selector_map.items():
+		assert texts[index] == node.get_all_text_till_next_clickable_element()
+		assert store.selector_map()[index].get_all_text_till_next_clickable_element() == texts[index]
+	# Containers collect the text around their highlighted descendants, within the depth limit
+	for view, node in zip(store.root.children[:5], tree.children[:5]):
+		assert view.get_all_text_till_next_clickable_element() == node.get_all_text_till_next_clickable_element()
+		assert view.get_all_text_till_next_clickable_element(max_depth=2) == node.get_all_text_till_next_clickable_element(
+			max_depth=2
+		)
+
+
+@pytest.mark.asyncio
+async def test_get_dom_store_reuses_the_store_of_an_unchanged_page():
+	page = MagicMock(url='https://shop.example/')
+	columnar = encode_columnar(synthetic_page(50))
+	page.evaluate = AsyncMock(return_value={**columnar, 'extractionId': 'x-1'})
+
+	store = await DomService(page).get_dom_store()
+	assert page.evaluate.call_args.args[1]['wireFormat'] == 'columnar'
+	assert isinstance(store.root, DOMElementView)
+	assert store.root.tag_name == 'body'
+
+	page.evaluate = AsyncMock(return_value={'unchanged': True, 'extractionId': 'x-1'})
+	assert await DomService(page).get_dom_store() is store
+	assert page.evaluate.call_args.args[1]['previousExtractionId'] == 'x-1'
+
+	blank_page = MagicMock(url='about:blank')
+	assert len(await DomService(blank_page).get_dom_store()) == 1
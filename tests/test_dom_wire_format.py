@@ -0,0 +1,72 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.dom.benchmarks.wire_format import encode_columnar, synthetic_page
+from browser_use.dom.service import DomService
+from browser_use.dom.views import DOMElementNode
+
+
+def describe(node):
+	if not isinstance(node, DOMElementNode):
+		return (node.text, node.is_visible, node.parent.xpath)
+	return (
+		node.tag_name,
+		node.xpath,
+		node.attributes,
+		node.is_visible,
+		node.is_interactive,
+		node.is_top_element,
+		node.is_in_viewport,
+		node.shadow_root,
+		node.highlight_index,
+		node.parent.xpath if node.parent else None,
+		[describe(child) for child in node.children],
+	)
+
+
+@pytest.mark.asyncio
+async def test_columnar_format_decodes_to_the_same_tree():
+	eval_page = synthetic_page(2_000)
+	columnar = encode_columnar(eval_page)
+
+	expected_tree, expected_map = await DomService(page=MagicMock())._construct_dom_tree(eval_page)
+	tree, selector_map = DomService._decode_columnar_dom_tree(columnar['columnar'])
+
+	assert describe(tree) == describe(expected_tree)
+	assert {index: node.xpath for index, node in selector_map.items()} == {
+		index: node.xpath for index, node in expected_map.items()
+	}
+	# xpaths that extend their parent's are sent as an interned step
+	assert len(columnar['columnar']['xpathSegments']) < len(columnar['columnar']['xpath']) / 10
+
+
+@pytest.mark.asyncio
+async def test_dom_service_asks_for_the_columnar_format():
+	page = MagicMock(url='https://shop.example/')
+	columnar = encode_columnar(
+		{
+			'rootId': 2,
+			'map': {
+				'0': {'type': 'TEXT_NODE', 'text': 'Buy', 'isVisible': True},
+				'1': {
+					'tagName': 'button',
+					'xpath': 'html/body/button',
+					'attributes': {'type': 'submit'},
+					'children': ['0'],
+					'isVisible': True,
+					'highlightIndex': 0,
+				},
+				'2': {'tagName': 'body', 'xpath': '/body', 'attributes': {}, 'children': ['1']},
+			},
+		}
+	)
+	page.evaluate = AsyncMock(side_effect=lambda script, *args: 2 if script == '1+1' else {**columnar, 'extractionId': 'x-1'})
+
+	state = await DomService(page).get_clickable_elements()
+
+	assert page.evaluate.call_args.args[1]['wireFormat'] == 'columnar'
+	button = state.selector_map[0]
+	assert (button.tag_name, button.xpath, button.attributes) == ('button', 'html/body/button', {'type': 'submit'})
+	assert button.parent is state.element_tree
+	assert button.get_all_text_till_next_clickable_element() == 'Buy'
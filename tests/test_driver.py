@@ -0,0 +1,82 @@
+import pytest
+
+from browser_use.browser import driver as driver_module
+from browser_use.browser.browser import Browser, BrowserConfig
+from browser_use.browser.driver import get_shared_driver
+
+
+class DummyBrowser:
+	async def close(self):
+		pass
+
+
+class DummyChromium:
+	def __init__(self):
+		self.endpoints = []
+
+	async def connect_over_cdp(self, endpoint_url, timeout=20000):
+		self.endpoints.append(endpoint_url)
+		return DummyBrowser()
+
+
+class DummyPlaywright:
+	started = 0
+	stopped = 0
+
+	def __init__(self):
+		self.chromium = DummyChromium()
+
+	async def stop(self):
+		DummyPlaywright.stopped += 1
+
+
+class DummyAsyncPlaywrightContext:
+	async def start(self):
+		DummyPlaywright.started += 1
+		return DummyPlaywright()
+
+
+@pytest.fixture
+def dummy_driver(monkeypatch):
+	DummyPlaywright.started = DummyPlaywright.stopped = 0
+	monkeypatch.setattr(driver_module, 'async_playwright', lambda: DummyAsyncPlaywrightContext())
+
+
+@pytest.mark.asyncio
+async def test_browsers_share_one_driver(dummy_driver):
+	"""
+	Browsers with shared_driver=True connect to their endpoints through one driver,
+	which is stopped only when the last of them closes.
+	"""
+	browsers = [Browser(BrowserConfig(cdp_url=f'ws://endpoint-{i}', shared_driver=True)) for i in range(3)]
+	for browser in browsers:
+		await browser.get_playwright_browser()
+
+	playwright = browsers[0].playwright
+	assert all(browser.playwright is playwright for browser in browsers)
+	assert playwright.chromium.endpoints == ['ws://endpoint-0', 'ws://endpoint-1', 'ws://endpoint-2']
+	assert DummyPlaywright.started == 1
+	assert get_shared_driver().references == 3
+
+	for browser in browsers[:2]:
+		await browser.close()
+	assert DummyPlaywright.stopped == 0
+
+	await browsers[2].close()
+	assert DummyPlaywright.stopped == 1
+	assert get_shared_driver().references == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_releases_reference(dummy_driver, monkeypatch):
+	async def failing_setup(self, playwright):
+		raise RuntimeError('launch failed')
+
+	monkeypatch.setattr(Browser, '_setup_browser', failing_setup)
+	browser = Browser(BrowserConfig(shared_driver=True))
+	with pytest.raises(RuntimeError):
+		await browser.get_playwright_browser()
+
+	assert browser.playwright is None
+	assert get_shared_driver().references == 0
+	assert DummyPlaywright.stopped == 1
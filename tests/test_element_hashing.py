@@ -0,0 +1,30 @@
+from browser_use.dom.benchmarks.element_hashing import legacy_hash_dom_element, selector_map
+from browser_use.dom.benchmarks.prompt_serializer import synthetic_tree
+from browser_use.dom.history_tree_processor.service import HistoryTreeProcessor
+
+
+def test_incremental_hashes_match_history_elements_like_before():
+	elements = selector_map(synthetic_tree(1_000, 40))
+	history_elements = [HistoryTreeProcessor.convert_dom_element_to_history_element(element) for element in elements]
+
+	for element, history_element in zip(elements, history_elements):
+		assert element.hash == HistoryTreeProcessor._hash_dom_history_element(history_element)
+
+	# The same pairs match as with the SHA-256 hashes
+	legacy_hashes = [legacy_hash_dom_element(element) for element in elements]
+	for element, legacy_hash in zip(elements[:50], legacy_hashes[:50]):
+		matches = [HistoryTreeProcessor.compare_history_element_and_dom_element(h, element) for h in history_elements]
+		assert matches == [legacy_hash == other for other in legacy_hashes]
+
+
+def test_branch_path_hashes_are_memoized_top_down():
+	elements = selector_map(synthetic_tree(1_000, 40))
+	deepest = max(elements, key=lambda element: len(HistoryTreeProcessor._get_parent_branch_path(element)))
+
+	HistoryTreeProcessor._hash_dom_element(deepest)
+	ancestor = deepest.parent
+	while ancestor.parent is not None:
+		assert ancestor._branch_path_hash == HistoryTreeProcessor._parent_branch_path_hash(
+			HistoryTreeProcessor._get_parent_branch_path(ancestor)
+		)
+		ancestor = ancestor.parent
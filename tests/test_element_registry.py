@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser.browser import BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
+from browser_use.dom.views import DOMElementNode
+
+
+def make_element(parent_tag='div'):
+	root = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	parent = DOMElementNode(
+		tag_name=parent_tag, xpath=f'html/body/{parent_tag}', attributes={}, children=[], is_visible=True, parent=root
+	)
+	return DOMElementNode(
+		tag_name='button',
+		xpath=f'html/body/{parent_tag}/button',
+		attributes={'class': 'btn css-9f3a2'},
+		children=[],
+		is_visible=True,
+		highlight_index=7,
+		parent=parent,
+	)
+
+
+def make_context(page):
+	context = BrowserContext(browser=MagicMock(config=BrowserConfig()), config=BrowserContextConfig())
+	context.get_current_page = AsyncMock(return_value=page)
+	return context
+
+
+def make_page(registered_element):
+	page = MagicMock()
+	handle = MagicMock()
+	handle.as_element.return_value = registered_element
+	handle.dispose = AsyncMock()
+	page.evaluate_handle = AsyncMock(return_value=handle)
+	page.query_selector = AsyncMock(return_value=MagicMock(scroll_into_view_if_needed=AsyncMock()))
+	return page, handle
+
+
+@pytest.mark.asyncio
+async def test_element_is_resolved_from_the_page_registry_in_one_evaluate():
+	registered_element = MagicMock(scroll_into_view_if_needed=AsyncMock())
+	page, _ = make_page(registered_element)
+
+	assert await make_context(page).get_locate_element(make_element()) is registered_element
+
+	page.evaluate_handle.assert_awaited_once()
+	assert page.evaluate_handle.call_args.args[1] == {'index': 7, 'xpath': 'html/body/div/button'}
+	registered_element.scroll_into_view_if_needed.assert_awaited_once()
+	page.query_selector.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stale_registry_falls_back_to_selectors():
+	page, handle = make_page(None)
+
+	element_handle = await make_context(page).get_locate_element(make_element())
+
+	handle.dispose.assert_awaited_once()
+	page.query_selector.assert_awaited_once()
+	assert element_handle is page.query_selector.return_value
+
+	# Elements inside iframes are always located through frame locators
+	page, _ = make_page(MagicMock())
+	await make_context(page).get_locate_element(make_element(parent_tag='iframe'))
+	page.evaluate_handle.assert_not_awaited()
+	page.frame_locator.assert_called_once()
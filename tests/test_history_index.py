@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+from browser_use.agent.service import Agent
+from browser_use.browser.views import BrowserState
+from browser_use.dom.benchmarks.element_hashing import selector_map
+from browser_use.dom.benchmarks.prompt_serializer import synthetic_tree
+from browser_use.dom.history_tree_processor.service import HistoryTreeProcessor
+from browser_use.dom.views import DOMElementNode
+
+
+def make_state(tree):
+	elements = selector_map(tree)
+	return BrowserState(
+		element_tree=tree,
+		selector_map={element.highlight_index: element for element in elements},
+		url='https://shop.example/',
+		title='Shop',
+		tabs=[],
+	)
+
+
+def element(tag_name, xpath, attributes, highlight_index, parent):
+	node = DOMElementNode(
+		tag_name=tag_name,
+		xpath=xpath,
+		attributes=attributes,
+		children=[],
+		is_visible=True,
+		highlight_index=highlight_index,
+		parent=parent,
+	)
+	parent.children.append(node)
+	return node
+
+
+def test_index_finds_history_elements_like_the_tree_walk():
+	state = make_state(synthetic_tree(1_000, 20))
+	history = [HistoryTreeProcessor.convert_dom_element_to_history_element(node) for node in state.selector_map.values()]
+
+	assert state.history_index is state.history_index
+	for history_element, node in zip(history, state.selector_map.values()):
+		assert state.history_index.find(history_element) is node
+		assert HistoryTreeProcessor.find_history_element_in_tree(history_element, state.element_tree) is node
+
+
+def test_fuzzy_fallback_when_the_hash_misses():
+	old_root = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	old_form = element('form', 'html/body/form', {}, None, old_root)
+	buy = element('button', 'html/body/form/button', {'id': 'buy', 'class': 'btn session-1'}, 0, old_form)
+	search = element('input', 'html/body/form/input', {'name': 'q', 'type': 'text'}, 1, old_form)
+	ad = element('a', 'html/body/form/a', {'class': 'promo'}, 2, old_form)
+	history = {
+		name: HistoryTreeProcessor.convert_dom_element_to_history_element(node)
+		for name, node in (('buy', buy), ('search', search), ('ad', ad))
+	}
+
+	root = DOMElementNode(tag_name='body', xpath='/body', attributes={}, children=[], is_visible=True, parent=None)
+	banner = element('div', 'html/body/div', {}, None, root)
+	form = element('form', 'html/body/form', {}, None, root)
+	# A dynamic class changed, same position
+	new_buy = element('button', 'html/body/form/button', {'id': 'buy', 'class': 'btn session-2'}, 3, form)
+	# Moved into another container, identified by its name
+	new_search = element('input', 'html/body/div/input', {'name': 'q', 'type': 'text'}, 4, banner)
+	# A different link took the old position
+	element('a', 'html/body/form/a', {'class': 'cart'}, 5, form)
+	state = make_state(root)
+
+	assert state.history_index.find_exact(history['buy']) is None
+	assert state.history_index.find(history['buy']) is new_buy
+	assert state.history_index.find(history['search']) is new_search
+	assert state.history_index.find(history['ad']) is None
+
+
+async def test_replayed_actions_get_the_index_of_the_matching_element():
+	state = make_state(synthetic_tree(300, 10))
+	node = list(state.selector_map.values())[-1]
+	history_element = HistoryTreeProcessor.convert_dom_element_to_history_element(node)
+	action = MagicMock()
+	action.get_index.return_value = node.highlight_index + 1
+
+	assert await Agent._update_action_indices(MagicMock(), history_element, action, state) is action
+	action.set_index.assert_called_once_with(node.highlight_index)
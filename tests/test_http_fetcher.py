@@ -0,0 +1,156 @@
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from browser_use.architect.agents.researcher_agent import ResearcherAgent
+from browser_use.architect.benchmarks.orchestration import track_memory_io
+from browser_use.architect.benchmarks.stubs import StubLLM, patch_browser, patch_llm_interface, stub_browser_agent
+from browser_use.architect.tools.http_fetcher import HttpFetcher
+from browser_use.page_store.service import PageStore
+
+ARTICLE = '<html><body><main><h1>Python</h1>' + '<p>Python is a programming language. </p>' * 40 + '</main></body></html>'
+SPA = (
+	'<html><body><div id="root"></div><noscript>Please enable JavaScript</noscript><script src="/app.js"></script></body></html>'
+)
+CHALLENGE = '<html><body><p>Please complete the captcha to continue.</p></body></html>'
+
+
+class Handler(BaseHTTPRequestHandler):
+	active = 0
+	max_active = 0
+	lock = threading.Lock()
+	requests = []
+
+	def do_GET(self):
+		Handler.requests.append(self.path)
+		if self.path == '/etag':
+			if self.headers.get('If-None-Match') == '"v1"':
+				self.send_response(304)
+				self.end_headers()
+				return
+			return self._send(200, ARTICLE, {'ETag': '"v1"'})
+		if self.path == '/slow':
+			with Handler.lock:
+				Handler.active += 1
+				Handler.max_active = max(Handler.max_active, Handler.active)
+			time.sleep(0.05)
+			with Handler.lock:
+				Handler.active -= 1
+			return self._send(200, ARTICLE)
+		if self.path == '/article':
+			return self._send(200, ARTICLE)
+		if self.path == '/spa':
+			return self._send(200, SPA)
+		if self.path == '/challenge':
+			return self._send(200, CHALLENGE)
+		if self.path == '/forbidden':
+			return self._send(403, 'Forbidden')
+		return self._send(404, 'Not found')
+
+	def _send(self, status, body, headers=None):
+		data = body.encode()
+		self.send_response(status)
+		self.send_header('Content-Type', 'text/html; charset=utf-8')
+		for name, value in (headers or {}).items():
+			self.send_header(name, value)
+		if 'gzip' in self.headers.get('Accept-Encoding', ''):
+			data = gzip.compress(data)
+			self.send_header('Content-Encoding', 'gzip')
+		self.send_header('Content-Length', str(len(data)))
+		self.end_headers()
+		self.wfile.write(data)
+
+	def log_message(self, format, *args):
+		pass
+
+
+@pytest.fixture(scope='module')
+def http_server():
+	server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+	thread = threading.Thread(target=server.serve_forever, daemon=True)
+	thread.start()
+	yield f'http://127.0.0.1:{server.server_address[1]}'
+	server.shutdown()
+	server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_classifies_pages(http_server):
+	"""
+	Static pages are usable as is, everything else is flagged for the browser.
+	"""
+	async with HttpFetcher() as fetcher:
+		article, spa, challenge, forbidden, missing = await fetcher.fetch_all(
+			[f'{http_server}/{path}' for path in ('article', 'spa', 'challenge', 'forbidden', 'missing')]
+		)
+
+	assert not article.needs_browser
+	assert 'Python is a programming language.' in article.text
+	assert spa.escalate_reason == 'js-rendered'
+	assert challenge.escalate_reason == 'blocked'
+	assert forbidden.escalate_reason == 'blocked (HTTP 403)'
+	assert missing.escalate_reason == 'HTTP 404'
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit(http_server):
+	Handler.max_active = 0
+	async with HttpFetcher(max_concurrency=2) as fetcher:
+		results = await fetcher.fetch_all([f'{http_server}/slow'] * 6)
+	assert all(not result.needs_browser for result in results)
+	assert Handler.max_active <= 2
+
+
+@pytest.mark.asyncio
+async def test_unreachable_host_escalates():
+	async with HttpFetcher(timeout=1.0) as fetcher:
+		result = await fetcher.fetch('http://127.0.0.1:9/unreachable')
+	assert result.status_code is None
+	assert result.needs_browser
+
+
+@pytest.mark.asyncio
+async def test_page_store_revalidation(http_server, tmp_path):
+	"""
+	Fresh pages are served from the store, stale ones are revalidated with If-None-Match.
+	"""
+	url = f'{http_server}/etag'
+	store = PageStore(tmp_path / 'pages.sqlite', domain_ttls={'127.0.0.1': 0})
+	Handler.requests.clear()
+	async with HttpFetcher(page_store=store) as fetcher:
+		first = await fetcher.fetch(url)
+		second = await fetcher.fetch(url)
+
+	assert first.status_code == 200 and not first.from_store
+	assert second.status_code == 304 and second.from_store
+	assert second.text == first.text
+	assert Handler.requests == ['/etag', '/etag']
+	assert store.revalidated == 1
+
+	store.domain_ttls = {'127.0.0.1': 3600}
+	store.refresh(url)
+	async with HttpFetcher(page_store=store) as fetcher:
+		third = await fetcher.fetch(url)
+	assert third.from_store
+	assert len(Handler.requests) == 2
+	assert store.text_hits >= 2
+	store.close()
+
+
+@pytest.mark.parametrize('path, browser_runs', [('article', 0), ('spa', 1)])
+@pytest.mark.asyncio
+async def test_researcher_escalates_only_when_needed(http_server, tmp_path, path, browser_runs):
+	"""
+	A static page is summarized straight from HTTP, a JS-rendered one goes to the browser Agent.
+	"""
+	goal = f'Read {http_server}/{path} and summarize it'
+	agent_cls = stub_browser_agent()
+	with track_memory_io(str(tmp_path / 'memory.json')), patch_llm_interface(StubLLM()) as llm, patch_browser(agent_cls):
+		result = await ResearcherAgent(goal, pipeline='single_pass', http_first=True).run()
+
+	assert agent_cls.runs == browser_runs
+	assert llm.calls['summarize'] == 1
+	assert result.startswith('stub response')
@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.dom.service import DomService
+
+EXTRACTION = {
+	'rootId': 0,
+	'extractionId': 'abc-1',
+	'map': {
+		'0': {'tagName': 'body', 'xpath': '', 'children': [1], 'isVisible': True},
+		'1': {'tagName': 'a', 'xpath': 'body/a', 'children': [], 'isVisible': True, 'highlightIndex': 0},
+	},
+}
+
+
+def evaluate_returning(result):
+	# get_clickable_elements checks that the page evaluates javascript first
+	return AsyncMock(side_effect=lambda script, *args: 2 if script == '1+1' else result)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_page_reuses_the_previous_extraction():
+	page = MagicMock(url='https://news.example/')
+	page.evaluate = evaluate_returning(EXTRACTION)
+
+	first = await DomService(page).get_clickable_elements()
+	assert page.evaluate.call_args.args[1]['previousExtractionId'] is None
+
+	page.evaluate = evaluate_returning({'unchanged': True, 'extractionId': 'abc-1'})
+	second = await DomService(page).get_clickable_elements()
+	assert page.evaluate.call_args.args[1]['previousExtractionId'] == 'abc-1'
+	assert second.element_tree is first.element_tree
+	assert second.selector_map[0] is first.selector_map[0]
+
+	# The fused state capture shares the same cache
+	page.evaluate = evaluate_returning(
+		{
+			'title': 'News',
+			'scrollY': 0,
+			'viewportHeight': 800,
+			'scrollHeight': 800,
+			'dom': {'unchanged': True, 'extractionId': 'abc-1'},
+		}
+	)
+	page_state = await DomService(page).get_page_state()
+	assert page.evaluate.call_args.args[1]['domArgs']['previousExtractionId'] == 'abc-1'
+	assert page_state.element_tree is first.element_tree
+
+	# A changed page returns a new extraction, which replaces the cached one
+	page.evaluate = evaluate_returning({**EXTRACTION, 'extractionId': 'abc-2'})
+	third = await DomService(page).get_clickable_elements()
+	assert third.element_tree is not first.element_tree
+	await DomService(page).get_clickable_elements()
+	assert page.evaluate.call_args.args[1]['previousExtractionId'] == 'abc-2'
@@ -0,0 +1,88 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser.browser import BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
+from browser_use.browser.load_profiles import PageLoadProfiles
+from browser_use.browser.views import PageLoadTimings, PageLoadWaits
+
+DEFAULTS = PageLoadWaits(minimum=0.25, network_idle=0.5, maximum=5.0)
+
+
+def timings(dom_content_loaded, network_idle, dom_stable):
+	return PageLoadTimings(dom_content_loaded=dom_content_loaded, network_idle=network_idle, dom_stable=dom_stable)
+
+
+def test_waits_adapt_to_known_domains():
+	profiles = PageLoadProfiles()
+	for _ in range(3):
+		profiles.record('https://static.example/docs', timings(0.1, 0.3, 0.12))
+		profiles.record('https://spa.example/app', timings(0.8, 7.0, 4.0))
+
+	assert profiles.waits('https://unknown.example/', DEFAULTS) == DEFAULTS
+
+	fast = profiles.waits('https://static.example/other', DEFAULTS)
+	assert fast.minimum == pytest.approx(0.12)
+	assert fast.maximum == pytest.approx(1.0)
+
+	slow = profiles.waits('https://spa.example/app', DEFAULTS)
+	assert slow.minimum == pytest.approx(4.0)
+	assert slow.maximum == pytest.approx(11.0)
+	assert slow.network_idle == DEFAULTS.network_idle
+
+
+def test_profiles_persist_and_merge(tmp_path):
+	path = str(tmp_path / 'profiles.json')
+	first, second = PageLoadProfiles(path, min_samples=1), PageLoadProfiles(path, min_samples=1)
+	first.record('https://a.example/', timings(0.1, 0.2, 0.1))
+	second.record('https://b.example/', timings(0.1, 0.2, 0.1))
+	first.save()
+	second.save()
+
+	reloaded = PageLoadProfiles(path, min_samples=1)
+	assert set(reloaded.profiles) == {'a.example', 'b.example'}
+	assert reloaded.waits('https://a.example/', DEFAULTS) != DEFAULTS
+
+
+@pytest.mark.asyncio
+async def test_context_records_new_documents_and_applies_waits(tmp_path):
+	context = BrowserContext(
+		browser=MagicMock(config=BrowserConfig()),
+		config=BrowserContextConfig(page_load_profiles_path=str(tmp_path / 'profiles.json'), minimum_wait_page_load_time=0),
+	)
+	page = MagicMock(url='https://shop.example/cart')
+	context.get_current_page = AsyncMock(return_value=page)
+	context._check_and_handle_navigation = AsyncMock()
+	context._wait_for_stable_network = AsyncMock(return_value=True)
+
+	for origin in (1.0, 1.0, 2.0, 3.0):
+		page.evaluate = AsyncMock(
+			return_value={'timeOrigin': origin, 'now': 2000, 'domContentLoaded': 150, 'interactiveChangedAt': 900}
+		)
+		await context._wait_for_page_and_frames_load()
+
+	# The second load kept the same document (e.g. a click without navigation) and was not recorded
+	profile = context.page_load_profiles.profiles['shop.example']
+	assert len(profile['network_idle']) == 3
+	assert profile['dom_stable'] == [0.9, 0.9, 0.9]
+
+	# A new document that has been loading for 0.3s waits for the rest of the learned 0.9s
+	page.evaluate = AsyncMock(return_value={'timeOrigin': 4.0, 'now': 300, 'domContentLoaded': 150, 'interactiveChangedAt': 900})
+	start = time.time()
+	await context._wait_for_page_and_frames_load()
+	waits = context._wait_for_stable_network.await_args.args[0]
+	assert waits.minimum == pytest.approx(0.6)
+	assert waits.maximum < context.config.maximum_wait_page_load_time
+	assert time.time() - start >= 0.55
+
+	# Later steps on the same document keep the configured waits
+	page.evaluate = AsyncMock(return_value={'timeOrigin': 4.0, 'now': 5000, 'domContentLoaded': 150, 'interactiveChangedAt': 900})
+	start = time.time()
+	await context._wait_for_page_and_frames_load()
+	assert context._wait_for_stable_network.await_args.args[0] == context._default_page_load_waits()
+	assert time.time() - start < 0.25
+
+	await context.close()
+	assert 'shop.example' in PageLoadProfiles(str(tmp_path / 'profiles.json')).profiles
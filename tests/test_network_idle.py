@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser.network_idle import NetworkIdleWatcher, is_relevant_request, is_relevant_response
+
+
+class FakeEmitter:
+	def __init__(self):
+		self.handlers = {}
+
+	def on(self, event, handler):
+		self.handlers.setdefault(event, []).append(handler)
+
+	def remove_listener(self, event, handler):
+		self.handlers[event].remove(handler)
+
+	def emit(self, event, payload):
+		for handler in list(self.handlers.get(event, [])):
+			handler(payload)
+
+
+class FakeRequest:
+	def __init__(self, url, resource_type='script', headers=None):
+		self.url = url
+		self.resource_type = resource_type
+		self.headers = headers or {}
+
+
+class FakeResponse:
+	def __init__(self, request, content_type='application/javascript'):
+		self.request = request
+		self.headers = {'content-type': content_type}
+
+
+def test_request_filters():
+	assert is_relevant_request('script', 'https://example.com/app.js', {})
+	assert not is_relevant_request('script', 'https://www.google-analytics.com/analytics.js', {})
+	assert not is_relevant_request('script', 'https://CDN.Hotjar.com/x.js', {})
+	assert not is_relevant_request('xhr', 'https://example.com/api', {})
+	assert not is_relevant_request('image', 'data:image/png;base64,AAA', {})
+	assert not is_relevant_request('document', 'https://example.com/next', {'purpose': 'prefetch'})
+	assert is_relevant_response({'content-type': 'text/html; charset=utf-8'})
+	assert not is_relevant_response({'content-type': 'text/event-stream'})
+	assert not is_relevant_response({'content-type': 'image/png', 'content-length': str(10 * 1024 * 1024)})
+
+
+@pytest.mark.asyncio
+async def test_idle_detected_right_after_quiet_period():
+	page = FakeEmitter()
+	async with NetworkIdleWatcher(page) as watcher:
+		request = FakeRequest('https://example.com/app.js')
+		page.emit('request', request)
+
+		async def respond():
+			await asyncio.sleep(0.05)
+			page.emit('response', FakeResponse(request))
+
+		loop = asyncio.get_running_loop()
+		start = loop.time()
+		responder = asyncio.create_task(respond())
+		assert await watcher.wait(idle_time=0.1, timeout=2)
+		elapsed = loop.time() - start
+		await responder
+
+	# 50ms until the response, then 100ms of quiet: no polling interval on top
+	assert 0.15 <= elapsed < 0.2
+	assert page.handlers == {'request': [], 'response': [], 'requestfailed': []}
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_do_not_block_until_timeout():
+	page = FakeEmitter()
+	async with NetworkIdleWatcher(page) as watcher:
+		request = FakeRequest('https://example.com/style.css', resource_type='stylesheet')
+		page.emit('request', request)
+		asyncio.get_running_loop().call_later(0.02, page.emit, 'requestfailed', request)
+		assert await watcher.wait(idle_time=0.05, timeout=2)
+
+		page.emit('request', FakeRequest('https://example.com/slow.js'))
+		assert not await watcher.wait(idle_time=0.05, timeout=0.1)
+		assert list(watcher.pending.values()) == ['https://example.com/slow.js']
+
+
+@pytest.mark.asyncio
+async def test_cdp_requests_settle_on_loading_finished():
+	cdp_session = FakeEmitter()
+	cdp_session.send = AsyncMock()
+	cdp_session.detach = AsyncMock()
+	page = MagicMock()
+	page.context.new_cdp_session = AsyncMock(return_value=cdp_session)
+
+	async with NetworkIdleWatcher(page, use_cdp=True) as watcher:
+		cdp_session.emit(
+			'Network.requestWillBeSent',
+			{'requestId': '1', 'type': 'Document', 'request': {'url': 'https://example.com/', 'headers': {}}},
+		)
+		cdp_session.emit(
+			'Network.responseReceived',
+			{'requestId': '1', 'response': {'mimeType': 'text/html', 'headers': {'Content-Type': 'text/html'}}},
+		)
+		assert '1' in watcher.pending
+		cdp_session.emit('Network.loadingFinished', {'requestId': '1'})
+		assert await watcher.wait(idle_time=0.01, timeout=1)
+
+	cdp_session.send.assert_awaited_with('Network.enable')
+	cdp_session.detach.assert_awaited_once()
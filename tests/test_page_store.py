@@ -0,0 +1,147 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from browser_use.controller.service import Controller
+from browser_use.page_store.service import PageStore
+
+PAGE = '<html><body><h1>Title</h1><p>Some <a href="/x">linked</a> text.</p></body></html>'
+
+
+@pytest.fixture
+def store(tmp_path):
+	page_store = PageStore(tmp_path / 'pages.sqlite')
+	yield page_store
+	page_store.close()
+
+
+def test_text_is_converted_once_per_variant(store):
+	conversions = []
+
+	def convert(html):
+		conversions.append(html)
+		return html.upper()
+
+	page = store.put('https://example.com/a', PAGE)
+	assert store.text(page, 'upper', convert) == PAGE.upper()
+	assert store.text(store.get('https://example.com/a'), 'upper', convert) == PAGE.upper()
+	assert len(conversions) == 1
+	assert store.text_hits == 1
+
+
+def test_identical_content_is_stored_once(store):
+	store.put('https://example.com/a', PAGE)
+	size = store.size
+	store.put('https://example.com/b', PAGE)
+	assert store.size == size
+	assert store.get('https://example.com/a').content_hash == store.get('https://example.com/b').content_hash
+
+
+def test_ttl_policies(tmp_path):
+	store = PageStore(tmp_path / 'pages.sqlite', default_ttl=60, domain_ttls={'wikipedia.org': 86400, 'news.example.com': 0})
+	assert store.ttl_for('https://en.wikipedia.org/wiki/Python') == 86400
+	assert store.ttl_for('https://news.example.com/today', 'max-age=600') == 0
+	assert store.ttl_for('https://example.com/', 'public, max-age=600') == 600
+	assert store.ttl_for('https://example.com/') == 60
+	# no-cache responses are revalidated before every reuse, also on domains with a policy
+	assert store.ttl_for('https://example.com/', 'no-cache, max-age=600') == 0
+	assert store.ttl_for('https://en.wikipedia.org/wiki/Python', 'No-Cache') == 0
+
+	assert store.put('https://example.com/private', PAGE, cache_control='no-store') is None
+	assert store.put('https://news.example.com/today', PAGE).is_fresh is False
+	assert store.put('https://en.wikipedia.org/wiki/Python', PAGE).is_fresh
+	assert store.put('https://example.com/feed', PAGE, etag='"v1"', cache_control='no-cache').is_fresh is False
+	store.close()
+
+
+def test_lru_eviction(tmp_path):
+	pages = {f'https://example.com/{i}': f'<p>{i}</p>' + 'x' * 100 for i in range(3)}
+	store = PageStore(tmp_path / 'pages.sqlite', max_bytes=250)
+	for url, html in pages.items():
+		store.put(url, html)
+		time.sleep(0.001)
+
+	assert store.get('https://example.com/0') is None
+	assert store.get('https://example.com/2') is not None
+	assert store.size <= 250
+	assert store.evictions == 1
+	store.close()
+
+
+def test_revalidation_headers_and_persistence(tmp_path):
+	store = PageStore(tmp_path / 'pages.sqlite')
+	store.put('https://example.com/a', PAGE, etag='"v1"', last_modified='Wed, 21 Oct 2015 07:28:00 GMT')
+	# Unchanged content keeps the validators of the earlier response
+	store.put('https://example.com/a', PAGE)
+	store.close()
+
+	reopened = PageStore(tmp_path / 'pages.sqlite')
+	page = reopened.get('https://example.com/a')
+	assert page.revalidation_headers() == {
+		'If-None-Match': '"v1"',
+		'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT',
+	}
+	assert reopened.html(page) == PAGE
+	reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_extract_content_uses_page_store(store, monkeypatch):
+	"""
+	extract_content converts identical page content only once across calls.
+	"""
+	import markdownify
+
+	calls = []
+	original = markdownify.markdownify
+
+	def counting_markdownify(html, **kwargs):
+		calls.append(html)
+		return original(html, **kwargs)
+
+	monkeypatch.setattr(markdownify, 'markdownify', counting_markdownify)
+
+	page = MagicMock()
+	page.url = 'https://example.com/a'
+	page.content = AsyncMock(return_value=PAGE)
+	page.frames = []
+	page.context.cookies = AsyncMock(return_value=[])
+	browser = MagicMock()
+	browser.get_current_page = AsyncMock(return_value=page)
+
+	controller = Controller(page_store=store)
+	llm = FakeListChatModel(responses=['{"title": "Title"}'])
+	written_at = []
+	for _ in range(2):
+		result = await controller.registry.execute_action(
+			'extract_content', {'goal': 'title', 'should_strip_link_urls': True}, browser=browser, page_extraction_llm=llm
+		)
+		assert 'Title' in result.extracted_content
+		written_at.append(store.get('rendered:https://example.com/a').fetched_at)
+
+	assert len(calls) == 1
+	# The unchanged page was looked up under its rendered key instead of being written again
+	assert written_at[0] == written_at[1]
+	# Rendered content does not replace the HTTP response stored for the URL
+	assert store.get('https://example.com/a') is None
+	assert store.get('rendered:https://example.com/a') is not None
+
+	# Sessions with cookies may render private content, it is not persisted
+	page.url = 'https://example.com/account'
+	page.context.cookies = AsyncMock(return_value=[{'name': 'session', 'value': 'secret'}])
+	await controller.registry.execute_action(
+		'extract_content', {'goal': 'title', 'should_strip_link_urls': True}, browser=browser, page_extraction_llm=llm
+	)
+	assert store.get('rendered:https://example.com/account') is None
+
+
+def test_rendered_content_keeps_http_validators(store):
+	store.put('https://example.com/a', PAGE, etag='"v1"', cache_control='max-age=600')
+	store.put_rendered('https://example.com/a', PAGE.replace('Title', 'Rendered title'))
+
+	stored = store.get('https://example.com/a')
+	assert stored.etag == '"v1"'
+	assert stored.expires_at - stored.fetched_at == pytest.approx(600)
+	assert store.html(stored) == PAGE
@@ -0,0 +1,34 @@
+import pytest
+
+from browser_use.dom.benchmarks.prompt_serializer import (
+	INCLUDE_ATTRIBUTES,
+	legacy_clickable_elements_to_string,
+	synthetic_tree,
+)
+from browser_use.dom.views import DOMElementNode
+
+
+@pytest.mark.parametrize('depth', [1, 8, 60])
+def test_single_pass_serializer_matches_the_recursive_one(depth):
+	root = synthetic_tree(2_000, depth, seed=depth)
+
+	for include_attributes in (None, INCLUDE_ATTRIBUTES):
+		assert root.clickable_elements_to_string(include_attributes) == legacy_clickable_elements_to_string(
+			root, include_attributes
+		)
+
+
+def test_subtree_below_a_highlighted_element():
+	root = synthetic_tree(500, 30)
+	nested = []
+	stack = [root]
+	while stack:
+		node = stack.pop()
+		if isinstance(node, DOMElementNode):
+			if node.highlight_index is not None:
+				nested += [child for child in node.children if isinstance(child, DOMElementNode) and child.children]
+			stack.extend(node.children)
+	assert nested
+
+	for subtree in nested:
+		assert subtree.clickable_elements_to_string() == legacy_clickable_elements_to_string(subtree)
@@ -0,0 +1,55 @@
+import pytest
+
+from browser_use.architect.agents.researcher_agent import ResearcherAgent
+from browser_use.architect.benchmarks.orchestration import track_memory_io
+from browser_use.architect.benchmarks.stubs import StubLLM, patch_browser, patch_llm_interface, stub_browser_agent
+
+
+async def run_researcher(tmp_path, goal: str, pipeline: str) -> tuple[str, StubLLM]:
+	with (
+		track_memory_io(str(tmp_path / 'memory.json')),
+		patch_llm_interface(StubLLM()) as llm,
+		patch_browser(stub_browser_agent(steps=2)),
+	):
+		result = await ResearcherAgent(goal=goal, pipeline=pipeline).run()
+	return result, llm
+
+
+@pytest.mark.asyncio
+async def test_single_pass_uses_one_llm_call(tmp_path):
+	"""
+	A search-style goal is planned from a template and summarized directly,
+	while the full pipeline plans, re-parses and summarizes.
+	"""
+	goal = 'Find the latest Python release'
+	_, full = await run_researcher(tmp_path, goal, 'full')
+	result, single = await run_researcher(tmp_path, goal, 'single_pass')
+
+	assert full.total_calls == 3
+	assert single.total_calls == 1
+	assert single.calls['summarize'] == 1
+	assert result.startswith('stub response')
+
+
+@pytest.mark.asyncio
+async def test_single_pass_falls_back_to_llm_plan(tmp_path):
+	"""
+	Goals that fit no template still get an LLM-generated plan.
+	"""
+	_, llm = await run_researcher(tmp_path, 'Python packaging history', 'single_pass')
+	assert llm.calls['run_and_parse'] == 1
+	assert llm.calls['_run_llm_with_retry'] == 0
+	assert llm.calls['summarize'] == 1
+
+
+def test_template_plan_patterns():
+	url_plan = ResearcherAgent('Read https://example.com/docs, then summarize')._template_plan()
+	assert url_plan['parameters']['action'][0] == {'open_url': {'url': 'https://example.com/docs'}}
+
+	search_plan = ResearcherAgent('Search for python books')._template_plan()
+	assert search_plan['parameters']['action'][0]['open_url']['url'].endswith('q=Search+for+python+books')
+
+	assert ResearcherAgent('Python packaging history')._template_plan() is None
+
+	with pytest.raises(ValueError):
+		ResearcherAgent('goal', pipeline='unknown')
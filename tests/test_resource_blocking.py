@@ -0,0 +1,63 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser.resource_blocking import PLACEHOLDER_IMAGE, ResourceBlocker, ResourceBlockingConfig
+
+
+def make_route(page, url, resource_type, navigation=False):
+	route = MagicMock()
+	route.fallback = AsyncMock()
+	route.abort = AsyncMock()
+	route.fulfill = AsyncMock()
+	request = route.request
+	request.url = url
+	request.resource_type = resource_type
+	request.is_navigation_request.return_value = navigation
+	request.frame.page = page
+	request.frame.parent_frame = None if navigation else MagicMock()
+	return route
+
+
+def test_decide():
+	blocker = ResourceBlocker(ResourceBlockingConfig(blocked_domains=['Widgets.example']))
+	assert blocker.decide('https://news.example/a.jpg', 'image') == 'abort'
+	assert blocker.decide('https://news.example/font.woff2', 'font') == 'abort'
+	assert blocker.decide('https://news.example/app.js', 'script') == 'continue'
+	assert blocker.decide('https://www.googletagmanager.com/gtm.js', 'script') == 'abort'
+	assert blocker.decide('https://cdn.widgets.example:8443/embed.js', 'script') == 'abort'
+	assert blocker.decide('https://notdoubleclick.net/app.js', 'script') == 'continue'
+	assert blocker.decide('data:image/png;base64,AAA', 'image') == 'continue'
+	assert blocker.decide('https://ad.doubleclick.net/', 'document', is_main_frame_navigation=True) == 'continue'
+
+	placeholders = ResourceBlocker(ResourceBlockingConfig(resource_types=[], image_placeholders=True))
+	assert placeholders.decide('https://news.example/a.jpg', 'image') == 'continue'
+	assert placeholders.decide('https://pixel.quantserve.com/p.gif', 'image') == 'placeholder'
+
+
+@pytest.mark.asyncio
+async def test_routes_and_counts_per_page():
+	blocker = ResourceBlocker(ResourceBlockingConfig(image_placeholders=True))
+	page = MagicMock(url='https://news.example/')
+
+	await blocker._handle(make_route(page, 'https://news.example/', 'document', navigation=True))
+	image = make_route(page, 'https://news.example/hero.jpg', 'image')
+	tracker = make_route(page, 'https://www.google-analytics.com/analytics.js', 'script')
+	script = make_route(page, 'https://news.example/app.js', 'script')
+	for route in (image, tracker, script):
+		await blocker._handle(route)
+
+	image.fulfill.assert_awaited_once_with(status=200, content_type='image/gif', body=PLACEHOLDER_IMAGE)
+	tracker.abort.assert_awaited_once_with('blockedbyclient')
+	script.fallback.assert_awaited_once()
+
+	stats = blocker.stats(page)
+	assert stats.url == 'https://news.example/'
+	assert stats.blocked_requests == 2
+	assert stats.placeholder_requests == 1
+	assert stats.blocked_by_type == {'image': 1, 'script': 1}
+	assert stats.estimated_bytes_saved > 0
+
+	# A new navigation starts a new report
+	await blocker._handle(make_route(page, 'https://news.example/next', 'document', navigation=True))
+	assert blocker.stats(page).blocked_requests == 0
@@ -0,0 +1,75 @@
+import base64
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.agent.prompts import screenshot_media_type
+from browser_use.agent.service import Agent
+from browser_use.agent.views import AgentSettings
+from browser_use.browser.browser import BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
+
+
+def make_context(page, **config):
+	context = BrowserContext(browser=MagicMock(config=BrowserConfig()), config=BrowserContextConfig(**config))
+	context.get_current_page = AsyncMock(return_value=page)
+	return context
+
+
+def make_page(cdp_session=None):
+	page = MagicMock()
+	page.bring_to_front = AsyncMock()
+	page.wait_for_load_state = AsyncMock()
+	page.screenshot = AsyncMock(return_value=b'\xff\xd8\xff\xe0jpeg')
+	page.evaluate = AsyncMock(return_value={'x': 0, 'y': 300, 'width': 1280, 'height': 1100, 'devicePixelRatio': 2})
+	if cdp_session:
+		page.context.new_cdp_session = AsyncMock(return_value=cdp_session)
+	else:
+		page.context.new_cdp_session = AsyncMock(side_effect=Exception('CDP session is only available in Chromium'))
+	return page
+
+
+@pytest.mark.asyncio
+async def test_jpeg_screenshot_through_playwright():
+	page = make_page()
+	screenshot = await make_context(page, screenshot_format='jpeg', screenshot_quality=60).take_screenshot()
+
+	page.screenshot.assert_awaited_once_with(full_page=False, animations='disabled', type='jpeg', quality=60)
+	assert screenshot_media_type(screenshot) == 'image/jpeg'
+
+	# Without CDP, webp falls back to jpeg
+	page = make_page()
+	await make_context(page, screenshot_format='webp').take_screenshot()
+	assert page.screenshot.call_args.kwargs['type'] == 'jpeg'
+
+
+@pytest.mark.asyncio
+async def test_downscaled_webp_screenshot_through_cdp():
+	cdp_session = MagicMock()
+	cdp_session.send = AsyncMock(return_value={'data': base64.b64encode(b'RIFF\x00\x00\x00\x00WEBP').decode()})
+	cdp_session.detach = AsyncMock()
+	page = make_page(cdp_session)
+
+	screenshot = await make_context(page, screenshot_format='webp', screenshot_max_width=1280).take_screenshot()
+
+	method, params = cdp_session.send.call_args.args
+	assert method == 'Page.captureScreenshot'
+	assert params['format'] == 'webp'
+	assert params['quality'] == 80
+	# 1280 css pixels at devicePixelRatio 2 are scaled to 1280 device pixels
+	assert params['clip'] == {'x': 0, 'y': 300, 'width': 1280, 'height': 1100, 'scale': 0.5}
+	page.screenshot.assert_not_awaited()
+	cdp_session.detach.assert_awaited_once()
+	assert screenshot_media_type(screenshot) == 'image/webp'
+	assert screenshot_media_type(base64.b64encode(b'\x89PNG\r\n').decode()) == 'image/png'
+
+
+def test_agent_keeps_history_screenshots_unless_opted_out():
+	def needs_screenshot(callback=None, **settings):
+		return Agent._needs_screenshot(MagicMock(settings=AgentSettings(**settings), register_new_step_callback=callback))
+
+	assert needs_screenshot(use_vision=False)
+	assert not needs_screenshot(use_vision=False, save_history_screenshots=False)
+	assert needs_screenshot(use_vision=False, save_history_screenshots=False, generate_gif=True)
+	# The step callback receives the state with its screenshot
+	assert needs_screenshot(lambda state, output, step: None, use_vision=False, save_history_screenshots=False)
@@ -0,0 +1,100 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser.browser import BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
+from browser_use.browser.views import TabInfo
+
+PAGE_STATE = {
+	'title': 'Shop',
+	'scrollY': 200,
+	'viewportHeight': 1000,
+	'scrollHeight': 3000,
+	'dom': {
+		'rootId': 0,
+		'map': {
+			'0': {'tagName': 'body', 'xpath': '', 'children': [1], 'isVisible': True},
+			'1': {'tagName': 'button', 'xpath': 'body/button', 'children': [], 'isVisible': True, 'highlightIndex': 0},
+		},
+	},
+}
+
+
+def make_context(page):
+	context = BrowserContext(browser=MagicMock(config=BrowserConfig()), config=BrowserContextConfig())
+	context.session = MagicMock()
+	context.session.context.pages = [page]
+	context.get_current_page = AsyncMock(return_value=page)
+	return context
+
+
+@pytest.mark.asyncio
+async def test_state_is_captured_in_one_evaluate_with_concurrent_tabs_and_screenshot():
+	page = MagicMock(url='https://shop.example/')
+	page.evaluate = AsyncMock(return_value=PAGE_STATE)
+	context = make_context(page)
+
+	async def slow_tabs_info():
+		await asyncio.sleep(0.2)
+		return [TabInfo(page_id=0, url=page.url, title='Shop')]
+
+	async def slow_screenshot():
+		await asyncio.sleep(0.2)
+		return 'iVBOR'
+
+	context.get_tabs_info = slow_tabs_info
+	context.take_screenshot = slow_screenshot
+
+	state = await context._update_state()
+
+	page.evaluate.assert_awaited_once()
+	assert state.title == 'Shop'
+	assert (state.pixels_above, state.pixels_below) == (200, 1800)
+	assert state.selector_map[0].tag_name == 'button'
+	assert state.tabs[0].title == 'Shop'
+	assert state.screenshot == 'iVBOR'
+	assert set(state.timings) == {'page_state', 'tabs', 'screenshot', 'total'}
+	# Tab titles and the screenshot overlap instead of adding up
+	assert state.timings['total'] < 0.35
+	context.session = None
+
+
+@pytest.mark.asyncio
+async def test_state_switches_to_a_live_page_when_the_current_one_is_gone():
+	dead_page = MagicMock(url='https://shop.example/')
+	dead_page.evaluate = AsyncMock(side_effect=Exception('Target page, context or browser has been closed'))
+	live_page = MagicMock(url='about:blank')
+	live_page.evaluate = AsyncMock(return_value={**PAGE_STATE, 'title': '', 'dom': None})
+	context = make_context(dead_page)
+	context._get_current_page = AsyncMock(return_value=live_page)
+	context.get_tabs_info = AsyncMock(return_value=[])
+
+	state = await context._update_state(include_screenshot=False)
+
+	assert state.url == 'about:blank'
+	assert state.selector_map == {}
+	assert state.screenshot is None
+	# about:blank skips buildDomTree.js
+	assert live_page.evaluate.call_args.args[1]['buildDomTree'] is False
+	context.session = None
+
+
+@pytest.mark.asyncio
+async def test_extraction_error_on_a_live_page_keeps_the_last_known_state():
+	page = MagicMock(url='https://shop.example/')
+	page.evaluate = AsyncMock(return_value=PAGE_STATE)
+	context = make_context(page)
+	context._get_current_page = AsyncMock()
+	context.get_tabs_info = AsyncMock(return_value=[])
+	context.state.target_id = 'target-1'
+	last_state = await context._update_state(include_screenshot=False)
+
+	# The page still answers the liveness check, so the tab is kept
+	page.evaluate = AsyncMock(side_effect=[Exception('Execution context was destroyed'), 1])
+	assert await context._update_state(include_screenshot=False) is last_state
+	assert page.evaluate.call_args.args == ('1',)
+	assert context.state.target_id == 'target-1'
+	context._get_current_page.assert_not_awaited()
+	context.session = None
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser_use.browser.browser import BrowserConfig
+from browser_use.browser.context import BrowserContext, BrowserContextConfig
+
+
+class FakePage:
+	def __init__(self, url, title, delay=0.0):
+		self.url = url
+		self._title = title
+		self.delay = delay
+		self.title_calls = 0
+		self.listeners = {}
+
+	async def title(self):
+		self.title_calls += 1
+		await asyncio.sleep(self.delay)
+		return self._title
+
+	def on(self, event, handler):
+		self.listeners.setdefault(event, []).append(handler)
+
+	def emit(self, event, *args):
+		for handler in self.listeners.get(event, []):
+			handler(*args)
+
+
+def make_context(pages, cdp_url=None):
+	context = BrowserContext(browser=MagicMock(config=BrowserConfig(cdp_url=cdp_url)), config=BrowserContextConfig())
+	context.session = MagicMock()
+	context.session.context.pages = pages
+	return context
+
+
+@pytest.mark.asyncio
+async def test_titles_are_fetched_concurrently_with_a_shared_deadline_and_cached():
+	pages = [FakePage(f'https://site.example/{i}', f'Page {i}', delay=0.1) for i in range(5)]
+	pages.append(FakePage('https://hung.example/', 'never', delay=10))
+	context = make_context(pages)
+
+	started_at = time.perf_counter()
+	tabs = await context.get_tabs_info(timeout=0.3)
+	assert time.perf_counter() - started_at < 0.5
+	assert [tab.title for tab in tabs[:5]] == [f'Page {i}' for i in range(5)]
+	assert tabs[5].url == 'about:blank'
+	assert tabs[5].title == 'ignore this tab and do not use it'
+
+	await context.get_tabs_info(timeout=0.3)
+	assert pages[0].title_calls == 1
+
+	# A main frame navigation drops the cached title
+	main_frame = MagicMock(parent_frame=None)
+	pages[0].emit('framenavigated', main_frame)
+	pages[0]._title = 'Next page'
+	tabs = await context.get_tabs_info(timeout=0.3)
+	assert tabs[0].title == 'Next page'
+	assert pages[1].title_calls == 1
+	context.session = None
+
+
+@pytest.mark.asyncio
+async def test_cdp_titles_come_from_one_target_list():
+	pages = [
+		FakePage('https://a.example/', 'A'),
+		FakePage('https://b.example/', 'B'),
+		FakePage('https://dup.example/', 'First'),
+		FakePage('https://dup.example/', 'Second'),
+	]
+	context = make_context(pages, cdp_url='http://localhost:9222')
+	context._get_cdp_targets = AsyncMock(
+		return_value=[
+			{'type': 'page', 'url': 'https://a.example/', 'title': 'A'},
+			{'type': 'page', 'url': 'https://b.example/', 'title': 'https://b.example/'},
+			{'type': 'page', 'url': 'https://dup.example/', 'title': 'First'},
+			{'type': 'page', 'url': 'https://dup.example/', 'title': 'Second'},
+			{'type': 'service_worker', 'url': 'https://a.example/sw.js', 'title': 'sw'},
+		]
+	)
+
+	tabs = await context.get_tabs_info()
+
+	context._get_cdp_targets.assert_awaited_once()
+	assert [tab.title for tab in tabs] == ['A', '', 'First', 'Second']
+	# Only the ambiguous tabs needed a title() call
+	assert [page.title_calls for page in pages] == [0, 0, 1, 1]
+	context.session = None